@@ -22,12 +22,20 @@ from when_exactly._api import (
     Year,
     Years,
 )
+from when_exactly._business_calendar import BusinessCalendar
+from when_exactly._parallel import Parallel
+from when_exactly._recurrence import Recurrence
+from when_exactly._scheduler import Scheduler, ticks
 from when_exactly.core.collection import Collection
 from when_exactly.core.custom_collection import CustomCollection
 from when_exactly.core.custom_interval import CustomInterval
 from when_exactly.core.delta import Delta
 from when_exactly.core.errors import InvalidMomentError
+from when_exactly.core.interning import disable_interning, enable_interning
 from when_exactly.core.interval import Interval
+from when_exactly.core.interval_index import IntervalIndex
+from when_exactly.core.interval_set import IntervalSet
+from when_exactly.core.iso import ParseFailure
 from when_exactly.core.moment import Moment
 
 __all__ = [
@@ -35,6 +43,8 @@ __all__ = [
     "CustomCollection",
     "CustomInterval",
     "Interval",
+    "IntervalIndex",
+    "IntervalSet",
     "Collection",
     "Moment",
     "Day",
@@ -58,5 +68,22 @@ __all__ = [
     "Weekdays",
     "Year",
     "Years",
+    "Recurrence",
+    "BusinessCalendar",
+    "Parallel",
+    "Scheduler",
+    "ticks",
     "InvalidMomentError",
+    "ParseFailure",
+    "enable_interning",
+    "disable_interning",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # MomentArray depends on the optional numpy dependency, so import it lazily
+    if name == "MomentArray":
+        from when_exactly.core.moment_array import MomentArray
+
+        return MomentArray
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
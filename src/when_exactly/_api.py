@@ -9,15 +9,15 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
-from functools import cached_property
-from typing import Iterable
+import itertools
 
+from when_exactly.core import gregorian, iso
 from when_exactly.core.custom_collection import CustomCollection
 from when_exactly.core.custom_interval import CustomInterval
 from when_exactly.core.delta import Delta
-from when_exactly.core.helper_functions import gen_until
 from when_exactly.core.interval import Interval
 from when_exactly.core.moment import Moment
+from when_exactly.core.slots import cached_property
 
 # region Custom Intervals
 
@@ -72,6 +72,9 @@ class Year(CustomInterval):
     ```
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000")
+
     def __init__(self, year: int) -> None:
         """# Create a Year.
 
@@ -109,18 +112,24 @@ class Year(CustomInterval):
         """Create a `Year` from a `Moment`."""
         return Year(moment.year)
 
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        return gregorian.ordinal_to_ymd(epoch_seconds // gregorian.SECONDS_PER_DAY + 1)[
+            0
+        ]
+
+    @classmethod
+    def _from_index(cls, index: int) -> Year:
+        return cls(index)
+
     @cached_property
     def months(self) -> Months:
-        return Months([Month(self.start.year, self.start.month + i) for i in range(12)])
+        return Months.range(Month(self.start.year, 1), 12)
 
     @cached_property
     def weeks(self) -> Weeks:
-        return Weeks(
-            gen_until(
-                Week(self.start.year, 1),
-                Week(self.start.year + 1, 1),
-            )
-        )
+        year = self.start.year
+        return Weeks.range(Week(year, 1), gregorian.iso_weeks_in_year(year))
 
     def month(self, month: int) -> Month:
         """Get a specific month of the year.
@@ -180,6 +189,9 @@ class Month(CustomInterval):
         ```
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000-00")
+
     def __init__(self, year: int, month: int) -> None:
         start = Moment(year, month, 1, 0, 0, 0)
         stop = start + Delta(months=1)
@@ -202,12 +214,22 @@ class Month(CustomInterval):
             moment.month,
         )
 
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        year, month, _ = gregorian.ordinal_to_ymd(
+            epoch_seconds // gregorian.SECONDS_PER_DAY + 1
+        )
+        return year * 12 + month - 1
+
+    @classmethod
+    def _from_index(cls, index: int) -> Month:
+        year, month_index = divmod(index, 12)
+        return cls(year, month_index + 1)
+
     def days(self) -> Days:
-        return Days(
-            gen_until(
-                Day(self.start.year, self.start.month, 1),
-                Day(self.start.year, self.start.month + 1, 1),
-            )
+        return Days.range(
+            Day(self.start.year, self.start.month, 1),
+            gregorian.days_in_month(self.start.year, self.start.month),
         )
 
     def day(self, day: int) -> Day:
@@ -258,6 +280,9 @@ class Week(CustomInterval):
         ```
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000-W00")
+
     def __init__(self, year: int, week: int) -> None:
         """Create a Week from ISO week year and week number.
 
@@ -268,8 +293,9 @@ class Week(CustomInterval):
         Returns:
             A Week interval.
         """
-        start = Moment.from_datetime(datetime.datetime.fromisocalendar(year, week, 1))
-        stop = start + Delta(days=7)
+        ordinal = gregorian.iso_to_ordinal(year, week, 1)
+        start = Moment.from_epoch_seconds((ordinal - 1) * gregorian.SECONDS_PER_DAY)
+        stop = Moment.from_epoch_seconds((ordinal + 6) * gregorian.SECONDS_PER_DAY)
         Interval.__init__(
             self,
             start=start,
@@ -278,11 +304,13 @@ class Week(CustomInterval):
 
     def __repr__(self) -> str:
         """Return the canonical string representation of the week."""
-        return f"Week({self.start.week_year}, {self.start.week})"
+        year, week, _ = self.start._iso_calendar
+        return f"Week({year}, {week})"
 
     def __str__(self) -> str:
         """Return the ISO 8601 string representation of the week."""
-        return f"{self.start.week_year:04}-W{self.start.week:02}"
+        year, week, _ = self.start._iso_calendar
+        return f"{year:04}-W{week:02}"
 
     @classmethod
     def from_moment(cls, moment: Moment) -> Week:
@@ -303,20 +331,27 @@ class Week(CustomInterval):
 
             ```
         """
-        return Week(
-            moment.week_year,
-            moment.week,
-        )
+        year, week, _ = moment._iso_calendar
+        return Week(year, week)
+
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        return epoch_seconds // gregorian.SECONDS_PER_WEEK
+
+    @classmethod
+    def _from_index(cls, index: int) -> Week:
+        year, week, _ = gregorian.ordinal_to_iso(index * 7 + 1)
+        return cls(year, week)
 
     @property
     def next(self) -> Week:
         """The next week."""
-        return Week.from_moment(self.stop)
+        return self._from_index(self._index + 1)
 
     @property
     def previous(self) -> Week:
         """The previous week."""
-        return Week.from_moment(self.start + Delta(weeks=-1))
+        return self._from_index(self._index - 1)
 
     def week_day(self, week_day: int) -> Weekday:
         """Get a specific weekday of the week.
@@ -336,21 +371,18 @@ class Week(CustomInterval):
 
             ```
         """
-        return Weekday(
-            self.start.week_year,
-            self.start.week,
-            week_day,
-        )
+        year, week, _ = self.start._iso_calendar
+        return Weekday(year, week, week_day)
 
     @cached_property
     def week_days(self) -> Weekdays:
         """All seven weekdays in this week."""
-        return Weekdays([self.week_day(i) for i in range(1, 8)])
+        return Weekdays.range(self.week_day(1), 7)
 
     @cached_property
     def days(self) -> Days:
         """All seven days in this week as Day objects."""
-        return Days([self.week_day(i).to_day() for i in range(1, 8)])
+        return Days.range(Day.from_moment(self.start), 7)
 
 
 @dataclasses.dataclass(frozen=True, init=False, repr=False)
@@ -383,6 +415,9 @@ class Weekday(CustomInterval):
         ```
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000-W00-0")
+
     def __init__(self, year: int, week: int, week_day: int):
         """Create a Weekday from ISO week year, week number, and weekday.
 
@@ -394,25 +429,20 @@ class Weekday(CustomInterval):
         Returns:
             A Weekday interval.
         """
-        start = Moment.from_datetime(
-            datetime.datetime.fromisocalendar(
-                year=year,
-                week=week,
-                day=week_day,
-            )
-        )
-        stop = start + Delta(days=1)
+        ordinal = gregorian.iso_to_ordinal(year, week, week_day)
+        start = Moment.from_epoch_seconds((ordinal - 1) * gregorian.SECONDS_PER_DAY)
+        stop = Moment.from_epoch_seconds(ordinal * gregorian.SECONDS_PER_DAY)
         Interval.__init__(self, start=start, stop=stop)
 
     def __repr__(self) -> str:
         """Return the canonical string representation of the weekday."""
-        return (
-            f"Weekday({self.start.week_year}, {self.start.week}, {self.start.week_day})"
-        )
+        year, week, week_day = self.start._iso_calendar
+        return f"Weekday({year}, {week}, {week_day})"
 
     def __str__(self) -> str:
         """Return the ISO 8601 string representation of the weekday."""
-        return f"{self.start.week_year}-W{self.start.week:02}-{self.start.week_day}"
+        year, week, week_day = self.start._iso_calendar
+        return f"{year}-W{week:02}-{week_day}"
 
     @classmethod
     def from_moment(cls, moment: Moment) -> Weekday:
@@ -433,21 +463,25 @@ class Weekday(CustomInterval):
 
             ```
         """
-        return Weekday(
-            year=moment.week_year,
-            week=moment.week,
-            week_day=moment.week_day,
-        )
+        return Weekday(*moment._iso_calendar)
+
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        return epoch_seconds // gregorian.SECONDS_PER_DAY
+
+    @classmethod
+    def _from_index(cls, index: int) -> Weekday:
+        return cls(*gregorian.ordinal_to_iso(index + 1))
 
     @property
     def next(self) -> Weekday:
         """The next weekday."""
-        return Weekday.from_moment(moment=self.stop)
+        return self._from_index(self._index + 1)
 
     @property
     def previous(self) -> Weekday:
         """The previous weekday."""
-        return Weekday.from_moment(moment=self.start - Delta(days=1))
+        return self._from_index(self._index - 1)
 
     @cached_property
     def week(self) -> Week:
@@ -499,6 +533,9 @@ class Day(CustomInterval):
 
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000-00-00")
+
     def __init__(self, year: int, month: int, day: int) -> None:
         start = Moment(year, month, day, 0, 0, 0)
         stop = start + Delta(days=1)
@@ -512,6 +549,14 @@ class Day(CustomInterval):
             moment.day,
         )
 
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        return epoch_seconds // gregorian.SECONDS_PER_DAY
+
+    @classmethod
+    def _from_index(cls, index: int) -> Day:
+        return cls(*gregorian.ordinal_to_ymd(index + 1))
+
     @property
     def previous(self) -> Day:
         return Day.from_moment(self.start - Delta(days=1))
@@ -611,6 +656,9 @@ class OrdinalDay(CustomInterval):
         ```
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000-000")
+
     def __init__(self, year: int, ordinal_day: int) -> None:
         """Create an OrdinalDay from year and ordinal day number.
 
@@ -637,6 +685,13 @@ class OrdinalDay(CustomInterval):
         """Return the ordinal day string representation."""
         return f"{self.start.year:04}-{self.start.ordinal_day:03}"
 
+    @classmethod
+    def _from_iso_fields(cls, year: int, ordinal_day: int) -> OrdinalDay:  # type: ignore[override]
+        # the constructor rolls day 366 of a common year over into the next year
+        if not 1 <= ordinal_day <= (366 if gregorian.is_leap(year) else 365):
+            raise ValueError(f"Invalid ordinal day: {ordinal_day}")
+        return cls(year, ordinal_day)
+
     @classmethod
     def from_moment(cls, moment: Moment) -> OrdinalDay:
         """Create an OrdinalDay from a Moment.
@@ -658,6 +713,15 @@ class OrdinalDay(CustomInterval):
         """
         return OrdinalDay(moment.year, moment.ordinal_day)
 
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        return epoch_seconds // gregorian.SECONDS_PER_DAY
+
+    @classmethod
+    def _from_index(cls, index: int) -> OrdinalDay:
+        moment = Moment.from_epoch_seconds(index * gregorian.SECONDS_PER_DAY)
+        return cls(moment.year, moment.ordinal_day)
+
     @property
     def next(self) -> OrdinalDay:
         """The next ordinal day."""
@@ -697,6 +761,9 @@ class Hour(CustomInterval):
         ```
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000-00-00T00")
+
     def __init__(self, year: int, month: int, day: int, hour: int) -> None:
         """Create an Hour from year, month, day, and hour.
 
@@ -748,11 +815,20 @@ class Hour(CustomInterval):
             moment.hour,
         )
 
-    def minutes(self) -> Iterable[Minute]:
-        """Generate all 60 minutes in this hour.
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        return epoch_seconds // gregorian.SECONDS_PER_HOUR
+
+    @classmethod
+    def _from_index(cls, index: int) -> Hour:
+        moment = Moment.from_epoch_seconds(index * gregorian.SECONDS_PER_HOUR)
+        return cls(moment.year, moment.month, moment.day, moment.hour)
+
+    def minutes(self) -> Minutes:
+        """Get all 60 minutes in this hour.
 
         Returns:
-            An iterable of Minute objects from :00 to :59.
+            A lazy collection of the Minutes from :00 to :59.
 
         Example:
             ```python
@@ -766,16 +842,7 @@ class Hour(CustomInterval):
 
             ```
         """
-        minute = Minute(
-            self.start.year,
-            self.start.month,
-            self.start.day,
-            self.start.hour,
-            0,
-        )
-        for _ in range(60):
-            yield minute
-            minute = minute.next
+        return Minutes.range(self.minute(0), 60)
 
     def minute(self, minute: int) -> Minute:
         """Get a specific minute of the hour.
@@ -859,6 +926,9 @@ class Minute(CustomInterval):
         ```
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000-00-00T00:00")
+
     def __init__(self, year: int, month: int, day: int, hour: int, minute: int) -> None:
         """Create a Minute from year, month, day, hour, and minute.
 
@@ -885,11 +955,11 @@ class Minute(CustomInterval):
         start = self.start
         return f"{start.year:04}-{start.month:02}-{start.day:02}T{start.hour:02}:{start.minute:02}"
 
-    def seconds(self) -> Iterable[Second]:
-        """Generate all 60 seconds in this minute.
+    def seconds(self) -> Seconds:
+        """Get all 60 seconds in this minute.
 
         Returns:
-            An iterable of Second objects from :00 to :59.
+            A lazy collection of the Seconds from :00 to :59.
 
         Example:
             ```python
@@ -903,17 +973,7 @@ class Minute(CustomInterval):
 
             ```
         """
-        second = Second(
-            self.start.year,
-            self.start.month,
-            self.start.day,
-            self.start.hour,
-            self.start.minute,
-            0,
-        )
-        for _ in range(60):
-            yield second
-            second = second.next
+        return Seconds.range(self.second(0), 60)
 
     def second(self, second: int) -> Second:
         """Get a specific second of the minute.
@@ -942,6 +1002,15 @@ class Minute(CustomInterval):
             second,
         )
 
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        return epoch_seconds // gregorian.SECONDS_PER_MINUTE
+
+    @classmethod
+    def _from_index(cls, index: int) -> Minute:
+        moment = Moment.from_epoch_seconds(index * gregorian.SECONDS_PER_MINUTE)
+        return cls(moment.year, moment.month, moment.day, moment.hour, moment.minute)
+
     @property
     def next(self) -> Minute:
         """The next minute."""
@@ -1007,6 +1076,9 @@ class Second(CustomInterval):
         ```
     """
 
+    __slots__ = ()
+    _iso_layout = iso.Layout("0000-00-00T00:00:00")
+
     def __init__(
         self, year: int, month: int, day: int, hour: int, minute: int, second: int
     ) -> None:
@@ -1053,6 +1125,22 @@ class Second(CustomInterval):
         """
         return Minute.from_moment(self.start)
 
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        return epoch_seconds
+
+    @classmethod
+    def _from_index(cls, index: int) -> Second:
+        moment = Moment.from_epoch_seconds(index)
+        return cls(
+            moment.year,
+            moment.month,
+            moment.day,
+            moment.hour,
+            moment.minute,
+            moment.second,
+        )
+
     @property
     def next(self) -> Second:
         """The next second."""
@@ -1196,7 +1284,11 @@ class Days(CustomCollection[Day]):
 
     @cached_property
     def months(self) -> Months:
-        return Months([day.month for day in self.values])
+        # the days are sorted, so equal months are adjacent
+        indexes = [Month._index_of(day.start.epoch_seconds) for day in self]
+        return Months.from_sorted(
+            Month._from_index(index) for index, _ in itertools.groupby(indexes)
+        )
 
 
 class Hours(CustomCollection[Hour]):
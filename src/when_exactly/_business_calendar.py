@@ -0,0 +1,169 @@
+"""Business-day arithmetic over weekends and holidays."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Iterable
+
+from when_exactly._api import Day
+from when_exactly.core import gregorian
+from when_exactly.core.errors import InvalidMomentError
+
+
+class BusinessCalendar:
+    """A BusinessCalendar knows which days are business days.
+
+    A business day is any day that is neither a weekend day nor a holiday.
+    Counting business days up to a day is closed-form: whole weeks are counted
+    arithmetically, and earlier holidays are found by binary search.
+    Each year also gets a table of its business days and their running count,
+    built the first time the year is needed and then cached,
+    so adding business days is a binary search within a single year.
+
+    Example:
+        ```python
+        >>> import when_exactly as wnx
+        >>> calendar = wnx.BusinessCalendar(holidays=[wnx.Day(2025, 12, 25), wnx.Day(2025, 12, 26)])
+        >>> calendar.is_business_day(wnx.Day(2025, 12, 25))
+        False
+        >>> calendar.add_business_days(wnx.Day(2025, 12, 24), 1)
+        Day(2025, 12, 29)
+        >>> calendar.business_days_between(wnx.Day(2025, 12, 1), wnx.Day(2026, 1, 1))
+        21
+
+        ```
+    """
+
+    def __init__(
+        self, weekend: Iterable[int] = (6, 7), holidays: Iterable[Day] = ()
+    ) -> None:
+        """Initialize a BusinessCalendar.
+
+        Args:
+            weekend: The days of the week that are not business days (1=Monday, 7=Sunday).
+            holidays: The days that are not business days.
+
+        Raises:
+            ValueError: If the weekend is not made of days of the week 1 to 7,
+                        or covers the whole week.
+        """
+        weekend = frozenset(weekend)
+        if not weekend <= set(range(1, 8)) or len(weekend) == 7:
+            raise ValueError(
+                "BusinessCalendar weekend must leave at least one day 1..7"
+            )
+        # day index 0 is Monday, January 1 of year 1, so week_day == index % 7 + 1
+        self._week = bytes(week_day not in weekend for week_day in range(1, 8))
+        self._week_prefix = list(accumulate(self._week, initial=0))
+        self._holidays = sorted(
+            {
+                index
+                for index in (day._index for day in holidays)
+                if self._week[index % 7]
+            }
+        )
+        self._years: dict[int, tuple[int, bytearray, list[int]]] = {}
+
+    def _year(self, year: int) -> tuple[int, bytearray, list[int]]:
+        """The first day index of a year, its business-day bitmap, and its running count."""
+        table = self._years.get(year)
+        if table is None:
+            start = gregorian.ymd_to_ordinal(year, 1, 1) - 1
+            length = 366 if gregorian.is_leap(year) else 365
+            offset = start % 7
+            weeks = self._week * (length // 7 + 2)
+            bits = bytearray(weeks[offset : offset + length])
+            first = bisect_left(self._holidays, start)
+            last = bisect_left(self._holidays, start + length)
+            for index in self._holidays[first:last]:
+                bits[index - start] = 0
+            table = self._years[year] = start, bits, list(accumulate(bits, initial=0))
+        return table
+
+    def _rank(self, index: int) -> int:
+        """The number of business days before the day with index `index`."""
+        weeks, days = divmod(index, 7)
+        return (
+            weeks * self._week_prefix[7]
+            + self._week_prefix[days]
+            - bisect_left(self._holidays, index)
+        )
+
+    def _select(self, rank: int) -> Day:
+        """The business day with `rank` business days before it."""
+        # the last day of the range has no stop, so the last Day is December 30
+        end = gregorian.ymd_to_ordinal(gregorian.MAXYEAR, 12, 31) - 1
+        if not 0 <= rank < self._rank(end):
+            raise InvalidMomentError("business day out of range")
+        # holidays only push the day later, so start from the estimate without them
+        weeks, days = divmod(rank, self._week_prefix[7])
+        estimate = weeks * 7 + bisect_left(self._week_prefix, days + 1) - 1
+        year = gregorian.ordinal_to_ymd(estimate + 1)[0]
+        while self._rank(self._year(year)[0]) > rank:
+            year -= 1
+        while year < gregorian.MAXYEAR and self._rank(self._year(year + 1)[0]) <= rank:
+            year += 1
+        start, _, prefix = self._year(year)
+        target = rank - self._rank(start)
+        return Day._from_index(start + bisect_left(prefix, target + 1) - 1)
+
+    def is_business_day(self, day: Day) -> bool:
+        """Check whether a day is a business day.
+
+        Args:
+            day: The day to check.
+
+        Returns:
+            True if the day is neither a weekend day nor a holiday.
+        """
+        index = day._index
+        start, bits, _ = self._year(day.start.year)
+        return bool(bits[index - start])
+
+    def next_business_day(self, day: Day) -> Day:
+        """Get the first business day after a day.
+
+        Args:
+            day: The day to start from.
+
+        Returns:
+            The next business day.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> wnx.BusinessCalendar().next_business_day(wnx.Day(2025, 1, 3))  # a Friday
+            Day(2025, 1, 6)
+
+            ```
+        """
+        return self._select(self._rank(day._index + 1))
+
+    def add_business_days(self, day: Day, n: int) -> Day:
+        """Get the `n`-th business day after a day, or before it if `n` is negative.
+
+        Args:
+            day: The day to start from.
+            n: The number of business days to move; `0` returns `day` unchanged.
+
+        Returns:
+            The business day `n` business days away.
+        """
+        if n == 0:
+            return day
+        if n > 0:
+            return self._select(self._rank(day._index + 1) + n - 1)
+        return self._select(self._rank(day._index) + n)
+
+    def business_days_between(self, start: Day, stop: Day) -> int:
+        """Count the business days from `start` (inclusive) to `stop` (exclusive).
+
+        Args:
+            start: The first day.
+            stop: The day after the last day.
+
+        Returns:
+            The number of business days, negative if `stop` is before `start`.
+        """
+        return self._rank(stop._index) - self._rank(start._index)
@@ -0,0 +1,232 @@
+"""Parallel work over large time ranges, split into aligned chunks."""
+
+from __future__ import annotations
+
+import datetime
+import heapq
+from array import array
+from bisect import bisect_left
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import groupby, pairwise
+from typing import Any, Callable, Iterable, Sequence
+
+from when_exactly._api import Month
+from when_exactly.core.collection import Collection, _sort_key
+from when_exactly.core.custom_collection import CustomCollection
+from when_exactly.core.custom_interval import _MISSING, CustomInterval, _epoch_seconds
+from when_exactly.core.interval import Interval
+from when_exactly.core.moment import Moment
+
+
+def _aggregate(
+    interval_type: type[CustomInterval],
+    reduce: Callable[[Any, Any], Any],
+    pairs: Sequence[tuple[Moment | datetime.datetime, Any]],
+    **initial: Any,
+) -> list[tuple[CustomInterval, Any]]:
+    return list(interval_type.aggregate(pairs, reduce, **initial))
+
+
+def _merge_indexes(arrays: list[array[int]]) -> array[int]:
+    """Merge sorted arrays of interval indexes, dropping duplicates."""
+    arrays = [indexes for indexes in arrays if indexes]
+    merged = array("q")
+    if all(a[-1] < b[0] for a, b in pairwise(arrays)):
+        for indexes in arrays:  # the usual case: chunks do not overlap
+            merged.extend(indexes)
+    else:
+        merged.extend(index for index, _ in groupby(heapq.merge(*arrays)))
+    return merged
+
+
+class Parallel:
+    """Parallel runs work over a large time range, one aligned chunk at a time.
+
+    A range is split into chunks along the intervals of `chunk_type`,
+    e.g. the months of a year, and each chunk is handed to an executor.
+    The sorted results of the chunks are merged back in order.
+
+    Work sent to a `ProcessPoolExecutor` must be picklable,
+    so pass module-level functions, or `functools.partial` objects of them.
+    Intervals and collections pickle compactly by their integer keys.
+
+    Example:
+        ```python
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> import when_exactly as wnx
+        >>> with ThreadPoolExecutor() as executor:
+        ...     parallel = wnx.Parallel(wnx.Month, executor)
+        ...     chunks = parallel.split(wnx.Interval(
+        ...         wnx.Moment(2025, 1, 15, 0, 0, 0), wnx.Moment(2025, 3, 1, 0, 0, 0)
+        ...     ))
+        >>> for chunk in chunks:
+        ...     print(chunk)
+        2025-01-15T00:00:00/2025-02-01T00:00:00
+        2025-02
+
+        ```
+    """
+
+    def __init__(
+        self,
+        chunk_type: type[CustomInterval] = Month,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize a Parallel.
+
+        Args:
+            chunk_type: The type of interval to split ranges along.
+            executor: The executor to run chunks on.
+                      If not given, each call starts and shuts down a `ProcessPoolExecutor`.
+        """
+        self._chunk_type = chunk_type
+        self._executor = executor
+
+    def split(self, interval: Interval) -> list[Interval]:
+        """Split an interval into chunks aligned to the chunk type.
+
+        Chunks that lie entirely within `interval` are intervals of the chunk type;
+        the first and last chunks are clipped to `interval`.
+
+        Args:
+            interval: The range to split.
+
+        Returns:
+            The chunks, in order.
+        """
+        start, stop = interval.start.epoch_seconds, interval.stop.epoch_seconds
+        chunk_type = self._chunk_type
+        chunks: list[Interval] = []
+        for index in range(
+            chunk_type._index_of(start), chunk_type._index_of(stop - 1) + 1
+        ):
+            chunk = chunk_type._from_index(index)
+            if chunk.start.epoch_seconds < start or chunk.stop.epoch_seconds > stop:
+                chunk = Interval(
+                    max(chunk.start, interval.start), min(chunk.stop, interval.stop)
+                )
+            chunks.append(chunk)
+        return chunks
+
+    def _map[A, R](self, func: Callable[[A], R], arguments: Iterable[A]) -> list[R]:
+        if self._executor is not None:
+            return list(self._executor.map(func, arguments))
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(func, arguments))
+
+    def collect[C: Collection[Any]](
+        self, func: Callable[[Interval], C], interval: Interval
+    ) -> C:
+        """Build a collection by running `func` on each chunk of an interval.
+
+        The collections of the chunks are merged with a k-way merge, dropping duplicates,
+        so intervals found in two neighbouring chunks appear once.
+        Custom collections holding only their declared interval type are merged
+        by their integer indexes, and the result is lazy:
+        intervals are only created when they are accessed.
+
+        Args:
+            func: A function giving a collection of the intervals found in a chunk.
+            interval: The range to work over.
+
+        Returns:
+            A collection of the type returned by `func`.
+
+        Example:
+            ```python
+            >>> from concurrent.futures import ThreadPoolExecutor
+            >>> import when_exactly as wnx
+            >>> def weeks_in(chunk):
+            ...     return wnx.IntervalSet([chunk]).to_collection(wnx.Weeks)
+            >>> with ThreadPoolExecutor() as executor:
+            ...     parallel = wnx.Parallel(wnx.Month, executor)
+            ...     weeks = parallel.collect(weeks_in, wnx.Year(2025))
+            >>> len(weeks), weeks[0], weeks[-1]
+            (53, Week(2025, 1), Week(2026, 1))
+
+            ```
+        """
+        parts = self._map(func, self.split(interval))
+        collection_type = type(parts[0])
+        if not all(type(part) is collection_type for part in parts):
+            raise TypeError("Parallel collect chunks must return one collection type")
+        if issubclass(collection_type, CustomCollection):
+            try:
+                packed = [part._pack() for part in parts]
+            except (TypeError, NotImplementedError):
+                pass  # e.g. mixed interval types, merged below instead
+            else:
+                name = packed[0][0]
+                return collection_type._unpack(
+                    name, _merge_indexes([indexes for _, indexes in packed])
+                )  # type: ignore
+        # the constructor drops the duplicates of neighbouring chunks
+        return collection_type(heapq.merge(*parts, key=_sort_key))
+
+    def aggregate[T: CustomInterval, V, A](
+        self,
+        interval_type: type[T],
+        pairs: Sequence[tuple[Moment | datetime.datetime, V]],
+        reduce: Callable[[A, V], A],
+        initial: A = _MISSING,
+    ) -> list[tuple[T, A]]:
+        """Group sorted timestamped values by interval, and reduce each group in parallel.
+
+        This is a parallel `CustomInterval.aggregate`.
+        The pairs are cut at the chunk boundaries by binary search,
+        moving each cut back to the start of the interval it falls in,
+        so no group is split between two chunks and the results only need concatenating.
+
+        Args:
+            interval_type: The type of interval to group by, e.g. `Minute`.
+            pairs: `(moment, value)` pairs sorted by time.
+            reduce: A function combining a group's accumulated result with its next value.
+            initial: The starting result of each group.
+                     If not given, the first value of each group is used.
+
+        Returns:
+            The `(interval, result)` pairs for the intervals that have values, in order.
+
+        Example:
+            ```python
+            >>> import operator
+            >>> from concurrent.futures import ThreadPoolExecutor
+            >>> import when_exactly as wnx
+            >>> events = [
+            ...     (wnx.Moment(2025, 1, 31, 23, 59, 30), 1),
+            ...     (wnx.Moment(2025, 2, 1, 0, 0, 10), 1),  # a new month, but the same week
+            ...     (wnx.Moment(2025, 3, 10, 12, 0, 0), 1),
+            ... ]
+            >>> with ThreadPoolExecutor() as executor:
+            ...     parallel = wnx.Parallel(wnx.Month, executor)
+            ...     parallel.aggregate(wnx.Week, events, operator.add)
+            [(Week(2025, 5), 2), (Week(2025, 11), 1)]
+
+            ```
+        """
+        if not pairs:
+            return []
+        first = _epoch_seconds(pairs[0][0])
+        last = _epoch_seconds(pairs[-1][0])
+
+        def seconds(pair: tuple[Moment | datetime.datetime, V]) -> int:
+            return _epoch_seconds(pair[0])
+
+        cuts = [0]
+        chunk_type = self._chunk_type
+        for index in range(
+            chunk_type._index_of(first) + 1, chunk_type._index_of(last) + 1
+        ):
+            boundary = chunk_type._from_index(index).start.epoch_seconds
+            # cut at the start of the interval containing the boundary
+            boundary = interval_type._from_index(
+                interval_type._index_of(boundary)
+            ).start.epoch_seconds
+            cuts.append(max(cuts[-1], bisect_left(pairs, boundary, key=seconds)))
+        cuts.append(len(pairs))
+        slices = [pairs[i:j] for i, j in pairwise(cuts) if i < j]
+
+        kwargs = {} if initial is _MISSING else {"initial": initial}
+        parts = self._map(partial(_aggregate, interval_type, reduce, **kwargs), slices)
+        return [result for part in parts for result in part]  # type: ignore
@@ -0,0 +1,201 @@
+"""Recurrence rules that produce intervals lazily."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from when_exactly._api import Day
+from when_exactly.core.custom_interval import CustomInterval
+from when_exactly.core.moment import Moment
+
+
+def _nth_day(
+    period: CustomInterval, n: int, week_days: frozenset[int]
+) -> Sequence[Day]:
+    """The `n`-th day of `period` falling on one of `week_days`, counting from the end if negative."""
+    first = Day._index_of(period.start.epoch_seconds)
+    last = Day._index_of(period.stop.epoch_seconds - 1)
+    # day index 0 is Monday, January 1 of year 1
+    if n > 0:
+        matches = [i for i in range(first, first + 7) if i % 7 + 1 in week_days]
+        weeks, position = divmod(n - 1, len(matches))
+        index = matches[position] + 7 * weeks
+    else:
+        matches = [i for i in range(last, last - 7, -1) if i % 7 + 1 in week_days]
+        weeks, position = divmod(-n - 1, len(matches))
+        index = matches[position] - 7 * weeks
+    if first <= index <= last:
+        return [Day._from_index(index)]
+    return []
+
+
+class Recurrence[T: CustomInterval]:
+    """A Recurrence is an endless, lazily computed series of intervals.
+
+    A recurrence steps through periods, every `every`-th interval of the type of `start`,
+    and selects the occurrences within each period.
+    By default each period is itself an occurrence, e.g. every 15th day.
+
+    Periods are found from their integer index, so `between` jumps straight to the
+    first period of interest instead of testing every interval before it.
+
+    Example:
+        ```python
+        >>> import itertools
+        >>> import when_exactly as wnx
+        >>> every_15th_day = wnx.Recurrence(wnx.Day(2025, 1, 1), every=15)
+        >>> list(itertools.islice(every_15th_day, 3))
+        [Day(2025, 1, 1), Day(2025, 1, 16), Day(2025, 1, 31)]
+        >>> every_15th_day.count(wnx.Moment(2025, 1, 1, 0, 0, 0), wnx.Moment(2026, 1, 1, 0, 0, 0))
+        25
+
+        ```
+    """
+
+    def __init__(
+        self,
+        start: CustomInterval,
+        every: int = 1,
+        select: Callable[[Any], Iterable[T]] | None = None,
+    ) -> None:
+        """Initialize a Recurrence.
+
+        Args:
+            start: The first period.
+            every: The number of intervals from one period to the next.
+            select: A function giving the sorted occurrences within a period.
+                    Occurrences must start within their period.
+                    If not given, each period is an occurrence.
+        """
+        if every < 1:
+            raise ValueError("Recurrence every must be positive")
+        self._period_type = type(start)
+        self._first = start._index
+        self._every = every
+        self._select = select
+
+    @classmethod
+    def nth_weekday(
+        cls,
+        start: CustomInterval,
+        n: int,
+        week_days: Iterable[int],
+        every: int = 1,
+    ) -> Recurrence[Day]:
+        """The `n`-th day of each period that falls on one of `week_days`.
+
+        Each day is computed directly from the start or stop of its period.
+
+        Args:
+            start: The first period, e.g. a Month or a Week.
+            n: Which matching day to take: 1 for the first, -1 for the last.
+               Periods without an `n`-th matching day are skipped.
+            week_days: The days of the week to match (1=Monday, 7=Sunday).
+            every: The number of intervals from one period to the next.
+
+        Returns:
+            A recurrence of days.
+
+        Example:
+            ```python
+            >>> import itertools
+            >>> import when_exactly as wnx
+            >>> second_tuesdays = wnx.Recurrence.nth_weekday(wnx.Month(2025, 1), 2, [2])
+            >>> list(itertools.islice(second_tuesdays, 2))
+            [Day(2025, 1, 14), Day(2025, 2, 11)]
+            >>> last_business_days = wnx.Recurrence.nth_weekday(wnx.Month(2025, 5), -1, range(1, 6))
+            >>> list(itertools.islice(last_business_days, 2))
+            [Day(2025, 5, 30), Day(2025, 6, 30)]
+            >>> every_other_tuesday = wnx.Recurrence.nth_weekday(wnx.Week(2025, 1), 1, [2], every=2)
+            >>> list(itertools.islice(every_other_tuesday, 2))
+            [Day(2024, 12, 31), Day(2025, 1, 14)]
+
+            ```
+        """
+        if n == 0:
+            raise ValueError("Recurrence n must not be zero")
+        days = frozenset(week_days)
+        if not days or not days <= set(range(1, 8)):
+            raise ValueError("Recurrence week_days must be between 1 and 7")
+        return cls(start, every, lambda period: _nth_day(period, n, days))  # type: ignore
+
+    def _periods_from(self, k: int) -> Iterator[CustomInterval]:
+        """The periods from the `k`-th one on."""
+        from_index = self._period_type._from_index
+        index = self._first + k * self._every
+        while True:
+            yield from_index(index)
+            index += self._every
+
+    def _first_k(self, epoch_seconds: int) -> int:
+        """The number of periods starting before the period containing `epoch_seconds`."""
+        index = self._period_type._index_of(epoch_seconds)
+        return max(0, -(-(index - self._first) // self._every))
+
+    def _occurrences(self, periods: Iterable[CustomInterval]) -> Iterator[T]:
+        if self._select is None:
+            return iter(periods)  # type: ignore
+        select = self._select
+        return (value for period in periods for value in select(period))
+
+    def __iter__(self) -> Iterator[T]:
+        return self._occurrences(self._periods_from(0))
+
+    def between(self, start: Moment, stop: Moment) -> Iterator[T]:
+        """Get the occurrences starting at or after `start`, and before `stop`.
+
+        Args:
+            start: The earliest start (inclusive).
+            stop: The latest start (exclusive).
+
+        Returns:
+            An iterator of the occurrences, in order.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> paydays = wnx.Recurrence.nth_weekday(wnx.Month(2000, 1), -1, range(1, 6))
+            >>> list(paydays.between(wnx.Moment(2025, 11, 1, 0, 0, 0), wnx.Moment(2026, 1, 1, 0, 0, 0)))
+            [Day(2025, 11, 28), Day(2025, 12, 31)]
+
+            ```
+        """
+        low, high = start.epoch_seconds, stop.epoch_seconds
+        for period in self._periods_from(self._first_k(low)):
+            if period.start.epoch_seconds >= high:
+                return
+            for value in self._occurrences([period]):
+                seconds = value.start.epoch_seconds
+                if seconds >= high:
+                    return
+                if seconds >= low:
+                    yield value
+
+    def count(self, start: Moment, stop: Moment) -> int:
+        """Count the occurrences starting at or after `start`, and before `stop`.
+
+        Without `select` this is computed arithmetically;
+        otherwise it visits each period in the range once.
+
+        Args:
+            start: The earliest start (inclusive).
+            stop: The latest start (exclusive).
+
+        Returns:
+            The number of occurrences.
+        """
+        low, high = start.epoch_seconds, stop.epoch_seconds
+        if self._select is not None:
+            return sum(1 for _ in self.between(start, stop))
+        if high <= low:
+            return 0
+        first = self._first_k(low)
+        if (
+            self._period_type._from_index(
+                self._first + first * self._every
+            ).start.epoch_seconds
+            < low
+        ):
+            first += 1
+        last = (self._period_type._index_of(high - 1) - self._first) // self._every
+        return max(0, last - first + 1)
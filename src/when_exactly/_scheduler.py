@@ -0,0 +1,154 @@
+"""An asyncio scheduler that wakes at interval boundaries."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import heapq
+import itertools
+import weakref
+from typing import AsyncIterator, Callable
+
+from when_exactly.core import gregorian
+from when_exactly.core.custom_interval import CustomInterval
+
+
+def _now() -> float:
+    """The local time, in seconds since the epoch of `Moment.epoch_seconds`."""
+    now = datetime.datetime.now()
+    return gregorian.datetime_to_epoch_seconds(now) + now.microsecond / 1_000_000
+
+
+class Scheduler:
+    """A Scheduler wakes sleeping tasks when the clock reaches their deadlines.
+
+    All sleepers share a single heap of deadlines and a single timer on the event loop,
+    so thousands of concurrent timers cost one heap entry each rather than one task each.
+    The timer is set from the monotonic loop clock, and when it fires the
+    wall clock is read again: sleepers whose deadline has not been reached yet,
+    e.g. because the wall clock drifted, are put back to sleep for the remaining time.
+
+    Example:
+        ```python
+        >>> import asyncio
+        >>> import when_exactly as wnx
+        >>> async def main():
+        ...     scheduler = wnx.Scheduler()
+        ...     deadline = scheduler.now() + 0.01
+        ...     await asyncio.gather(*(scheduler.sleep_until(deadline) for _ in range(1000)))
+        ...     return scheduler.now() >= deadline
+        >>> asyncio.run(main())
+        True
+
+        ```
+    """
+
+    def __init__(self, clock: Callable[[], float] = _now) -> None:
+        """Initialize a Scheduler.
+
+        Args:
+            clock: A function giving the current time in seconds since the epoch of
+                   `Moment.epoch_seconds`. Defaults to the local time.
+        """
+        self._clock = clock
+        self._heap: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    def now(self) -> float:
+        """Get the current time, in seconds since the epoch of `Moment.epoch_seconds`."""
+        return self._clock()
+
+    async def sleep_until(self, deadline: float) -> None:
+        """Sleep until the clock reaches `deadline`.
+
+        Args:
+            deadline: The time to wake up, in seconds since the epoch of `Moment.epoch_seconds`.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._heap, (deadline, next(self._counter), future))
+        if self._heap[0][2] is future:
+            self._arm(loop)
+        await future
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Set the timer for the earliest deadline."""
+        if self._timer is not None:
+            self._timer.cancel()
+        delay = max(0.0, self._heap[0][0] - self._clock())
+        self._timer = loop.call_at(loop.time() + delay, self._wake, loop)
+
+    def _wake(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Wake every sleeper whose deadline has passed, then re-arm the timer."""
+        self._timer = None
+        now = self._clock()
+        heap = self._heap
+        # cancelled sleepers are dropped when they reach the top of the heap
+        while heap and (heap[0][0] <= now or heap[0][2].done()):
+            _, _, future = heapq.heappop(heap)
+            if not future.done():
+                future.set_result(None)
+        if heap:
+            self._arm(loop)
+
+    async def ticks[T: CustomInterval](
+        self, interval_type: type[T], every: int = 1
+    ) -> AsyncIterator[T]:
+        """Yield each interval of a type as it starts, see `ticks`."""
+        if every < 1:
+            raise ValueError("ticks every must be positive")
+        index = interval_type._index_of(int(self.now()))
+        index += every - index % every
+        while True:
+            await self.sleep_until(interval_type._from_index(index).start.epoch_seconds)
+            # coalesce the ticks missed while the loop or the consumer was busy
+            current = interval_type._index_of(int(self.now()))
+            current -= current % every
+            yield interval_type._from_index(current)
+            index = current + every
+
+
+_schedulers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Scheduler] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def ticks[T: CustomInterval](
+    interval_type: type[T], every: int = 1, scheduler: Scheduler | None = None
+) -> AsyncIterator[T]:
+    """Yield each interval of a type as it starts, e.g. at the top of every minute.
+
+    Each boundary is computed arithmetically from the interval's index.
+    If a tick is late, because the event loop was blocked or the consumer was
+    still busy with the previous tick, the missed ticks are coalesced:
+    the next tick is the latest interval to have started.
+
+    Args:
+        interval_type: The type of interval to tick on, e.g. `Minute`.
+        every: Only tick on every `every`-th interval, aligned to the interval index,
+               e.g. `every=15` with `Minute` ticks at :00, :15, :30 and :45.
+        scheduler: The scheduler to sleep on.
+                   If not given, all ticks on an event loop share one scheduler.
+
+    Returns:
+        An async iterator of the intervals as they start.
+
+    Example:
+        ```python
+        >>> import asyncio
+        >>> import when_exactly as wnx
+        >>> async def main():
+        ...     async for second in wnx.ticks(wnx.Second):
+        ...         return second == wnx.Second.from_moment(second.start)
+        >>> asyncio.run(main())
+        True
+
+        ```
+    """
+    if scheduler is None:
+        loop = asyncio.get_running_loop()
+        scheduler = _schedulers.get(loop)
+        if scheduler is None:
+            scheduler = _schedulers[loop] = Scheduler()
+    return scheduler.ticks(interval_type, every)
@@ -1,16 +1,70 @@
 from __future__ import annotations
 
-from typing import Iterable, NoReturn, final, overload
+import csv
+import os
+import re
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, batched, islice, pairwise
+from operator import attrgetter, eq, itemgetter
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Self,
+    Sequence,
+    TextIO,
+    final,
+    overload,
+)
 
+from when_exactly.core import iso, packed
 from when_exactly.core.interval import Interval
+from when_exactly.core.moment import Moment
+
+
+def _sort_key(interval: Interval) -> tuple[int, int]:
+    return interval.start.epoch_seconds, interval.stop.epoch_seconds
+
+
+_FORMAT_CHUNK = 65536  # intervals formatted at a time when exporting
+_REPR_LIMIT = 100  # intervals shown by repr before it is truncated
+
+_start_seconds = attrgetter("start._epoch_seconds")
+_stop_seconds = attrgetter("stop._epoch_seconds")
+
+
+def _sort_unique[T: Interval](
+    values: list[T], keys: list[tuple[int, int]]
+) -> tuple[list[T], list[tuple[int, int]]]:
+    """Sort `values` by their `keys` and drop duplicates.
+
+    Sorting compares the integer keys only, and duplicates are found by scanning
+    runs of equal keys, so intervals are never hashed.
+    """
+    unique_values: list[T] = []
+    unique_keys: list[tuple[int, int]] = []
+    run: list[T] = []  # the values sharing the current key
+    for key, value in sorted(zip(keys, values), key=itemgetter(0)):
+        if unique_keys and key == unique_keys[-1]:
+            if value in run:
+                continue
+            run.append(value)
+        else:
+            run = [value]
+        unique_values.append(value)
+        unique_keys.append(key)
+    return unique_values, unique_keys
 
 
 class Collection[T: Interval]:
     """A Collection is an ordered, deduplicated set of Intervals.
 
-    Collections automatically sort their values and remove duplicates. They provide
-    iteration, indexing, slicing, and membership testing operations. Collections are
-    the base class for concrete types like Days, Months, Years, etc.
+    Collections automatically sort their values by start, then stop, and remove duplicates.
+    They provide iteration, indexing, slicing, and membership testing operations.
+    Membership tests and lookups use binary search.
+    Set operations (`|`, `&`, `-`, `^`) merge the sorted values in linear time.
+    Collections are the base class for concrete types like Days, Months, Years, etc.
 
     Type Parameters:
         T: The type of Interval this collection holds.
@@ -46,35 +100,588 @@ class Collection[T: Interval]:
             values: An iterable of intervals. Duplicates will be removed and
                     the intervals will be sorted.
         """
-        self._values: list[T] = sorted(set(values))
-        self._counter = 0
+        values = list(values)
+        keys = list(map(_sort_key, values))
+        if not all(a < b for a, b in pairwise(keys)):
+            values, keys = _sort_unique(values, keys)
+        self._values: Sequence[T] = values
+        self._keys: list[tuple[int, int]] | None = keys
+        self._max_stops: list[int] | None = None
+
+    @classmethod
+    def _from_values(cls, values: Sequence[T]) -> Self:
+        """Create a collection that uses `values` as is.
+
+        `values` must already be sorted and free of duplicates.
+        It can be any sequence, e.g. a lazy `IntervalRange`.
+        """
+        collection = cls.__new__(cls)
+        collection._values = values
+        collection._keys = None
+        collection._max_stops = None
+        return collection
+
+    @classmethod
+    def from_sorted(cls, values: Iterable[T]) -> Self:
+        """Create a collection from intervals that are already sorted and unique.
+
+        This skips sorting and deduplication entirely, so it runs in linear time.
+        The intervals must be strictly increasing by start, then stop;
+        otherwise the collection will not behave correctly.
+
+        Args:
+            values: Strictly increasing intervals.
+
+        Returns:
+            A collection of the intervals.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> wnx.Days.from_sorted([wnx.Day(2025, 1, 1), wnx.Day(2025, 1, 2)])
+            Days([Day(2025, 1, 1), Day(2025, 1, 2)])
+
+            ```
+        """
+        return cls._from_values(list(values))
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """Write this collection to a file in a compact binary format.
+
+        The file holds the name of the interval type and one or two 64-bit
+        integers per interval, so it is much smaller and faster to write than a pickle.
+        Read it back with `load`.
+
+        Args:
+            path: The file to write.
+
+        Raises:
+            TypeError: If the collection holds interval types that cannot be packed.
+
+        Example:
+            ```python
+            >>> import os, tempfile
+            >>> import when_exactly as wnx
+            >>> path = os.path.join(tempfile.mkdtemp(), "days.wnx")
+            >>> wnx.Days.range(wnx.Day(2025, 1, 1), 365).dump(path)
+            >>> days = wnx.Days.load(path)
+            >>> len(days), days[-1]
+            (365, Day(2025, 12, 31))
+
+            ```
+        """
+        name, data = self._pack()
+        packed.write(path, name, data)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], mmap: bool = True) -> Self:
+        """Read a collection written by `dump`.
+
+        Collections of custom intervals, like Days, are opened lazily:
+        with `mmap` the file is memory-mapped, and intervals are only
+        created when they are accessed.
+        Membership and lookups search the file's sorted integers directly.
+        Call `close`, or use the collection as a context manager, to release
+        the file; a closed collection can no longer be read.
+
+        Args:
+            path: The file to read.
+            mmap: Whether to memory-map the file instead of reading it into memory.
+
+        Returns:
+            A collection of this type.
+
+        Raises:
+            ValueError: If the file is not a packed collection of this type,
+                or its intervals are not sorted and unique.
+        """
+        name, data = packed.read(path, use_mmap=mmap)
+        try:
+            return cls._unpack(name, data)
+        except Exception:
+            packed.close(data)
+            raise
+
+    def close(self) -> None:
+        """Release the file memory-mapped by `load`, if any.
+
+        Slices of this collection share the mapping, and the file is
+        released once none of them remain.
+        """
+        if isinstance(self._values, packed.PackedIntervals):
+            self._values.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _pack(self) -> tuple[str, array[int]]:
+        """The name of the interval type, and the integers to write for the values."""
+        data = array("q")
+        for value in self._values:
+            if type(value) is not Interval:
+                raise TypeError(
+                    f"{self.__class__.__name__} can only pack Interval values, "
+                    f"not {type(value).__name__}"
+                )
+            data.extend(_sort_key(value))
+        return Interval.__name__, data
+
+    @classmethod
+    def _unpack(cls, name: str, data: Sequence[int]) -> Self:
+        """Create a collection from the integers written by `_pack`.
+
+        Raises:
+            ValueError: If the intervals are not sorted and unique.
+        """
+        if name != Interval.__name__:
+            raise ValueError(f"Cannot load {name} values into {cls.__name__}")
+        from_epoch_seconds = Moment.from_epoch_seconds
+        keys = list(zip(data[::2], data[1::2]))
+        packed.check_sorted(keys)
+        packed.close(data)  # the values are read eagerly
+        collection = cls._from_values(
+            [
+                Interval(from_epoch_seconds(start), from_epoch_seconds(stop))
+                for start, stop in keys
+            ]
+        )
+        collection._keys = keys
+        return collection
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        # pickle the same integers as `dump` when the values can be packed
+        try:
+            return self._unpack, self._pack()
+        except (TypeError, NotImplementedError):
+            return self.from_sorted, (self.values,)
+
+    def __copy__(self) -> Self:
+        collection = self._from_values(self._values)
+        collection._keys = self._keys
+        collection._max_stops = self._max_stops
+        return collection
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        # intervals are immutable, so only the list holding them needs copying
+        collection = self.__copy__()
+        if isinstance(self._values, list):
+            collection._values = list(self._values)
+        return collection
+
+    def _labels(
+        self, values: Sequence[T], starts: list[str], stops: list[str] | None
+    ) -> list[str]:
+        """The `str` of each of `values`, given their formatted starts, and stops if known."""
+        if stops is None:
+            stops = iso.format_moments(map(_stop_seconds, values))
+        return [
+            f"{start}/{stop}" if type(value) is Interval else str(value)
+            for value, start, stop in zip(values, starts, stops)
+        ]
+
+    def format_many(self) -> list[str]:
+        """Format every interval in this collection, like `str` of each interval.
+
+        Intervals are formatted in chunks, from lookup tables of zero-padded fields,
+        which is much faster than calling `str` on each interval.
+
+        Returns:
+            A string for each interval, in order.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> wnx.Hours.range(wnx.Hour(2025, 1, 1, 23), 2).format_many()
+            ['2025-01-01T23', '2025-01-02T00']
+
+            ```
+        """
+        labels: list[str] = []
+        for chunk in batched(self._values, _FORMAT_CHUNK):
+            starts = iso.format_moments(map(_start_seconds, chunk))
+            labels.extend(self._labels(chunk, starts, None))
+        return labels
+
+    def to_csv(
+        self,
+        file: str | os.PathLike[str] | TextIO,
+        delimiter: str = ",",
+        header: bool = True,
+    ) -> None:
+        """Write the start, stop and label of each interval as CSV.
+
+        Rows are formatted and written in chunks, and joined directly.
+        Only chunks with a field that needs quoting, e.g. the label of a custom
+        interval containing the delimiter, are written with the `csv` module.
+
+        Args:
+            file: A path, or a text file to write to.
+            delimiter: The separator between columns, e.g. `"\t"` for TSV.
+            header: Whether to write a `start,stop,label` header row first.
+
+        Example:
+            ```python
+            >>> import io
+            >>> import when_exactly as wnx
+            >>> buffer = io.StringIO()
+            >>> wnx.Days.range(wnx.Day(2025, 1, 1), 2).to_csv(buffer)
+            >>> print(buffer.getvalue(), end="")
+            start,stop,label
+            2025-01-01T00:00:00,2025-01-02T00:00:00,2025-01-01
+            2025-01-02T00:00:00,2025-01-03T00:00:00,2025-01-02
+
+            ```
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w", newline="", buffering=1 << 20) as f:
+                self.to_csv(f, delimiter, header)
+            return
+        writer = csv.writer(file, delimiter=delimiter, lineterminator="\n")
+        needs_quoting = re.compile(f'[{re.escape(delimiter)}"\r\n]').search
+        if header:
+            writer.writerow(["start", "stop", "label"])
+        for chunk in batched(self._values, _FORMAT_CHUNK):
+            starts = iso.format_moments(map(_start_seconds, chunk))
+            stops = iso.format_moments(map(_stop_seconds, chunk))
+            labels = self._labels(chunk, starts, stops)
+            rows = zip(starts, stops, labels)
+            # every start and stop has the same layout, so checking one is enough
+            if needs_quoting(starts[0]) or any(map(needs_quoting, labels)):
+                writer.writerows(rows)
+            else:
+                file.write("\n".join(map(delimiter.join, rows)) + "\n")
 
     @property
     def values(self) -> list[T]:
         """Get the sorted list of unique intervals in this collection.
 
+        Lazy collections create all of their intervals the first time this is accessed.
+
         Returns:
             A sorted list of intervals.
         """
+        if not isinstance(self._values, list):
+            self._values = list(self._values)
         return self._values
 
     @final
-    def __iter__(self) -> Collection[T]:
-        return self
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._values)
 
     @final
-    def __next__(self) -> T:
-        try:
-            value = self._values[self._counter]
-            self._counter += 1
-            return value
-        except IndexError:
-            self._counter = 0
-            raise StopIteration
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._values)
+
+    def _sort_keys(self) -> list[tuple[int, int]]:
+        """The sort keys of the values."""
+        if self._keys is None:
+            self._keys = list(map(_sort_key, self._values))
+        return self._keys
+
+    def _lookup_keys(self) -> tuple[list[tuple[int, int]], list[int]]:
+        """The sort keys of the values, and the running maximum of their stops."""
+        keys = self._sort_keys()
+        if self._max_stops is None:
+            self._max_stops = list(accumulate((stop for _, stop in keys), max))
+        return keys, self._max_stops
+
+    def _merge_operand(self) -> tuple[list[T], list[tuple[int, int]]]:
+        """The values and their sort keys, without storing either on this collection."""
+        values = self._values if isinstance(self._values, list) else list(self._values)
+        keys = self._keys if self._keys is not None else list(map(_sort_key, values))
+        return values, keys
+
+    def _merges_with(self, other: Collection[Any]) -> bool:
+        """Whether set operations with `other` give a collection of this type."""
+        return True
+
+    def _merge(self, other: Collection[T], left: bool, both: bool, right: bool) -> Self:
+        """Merge two collections in a single pass over their sort keys.
+
+        The result keeps the intervals only in this collection if `left`,
+        the intervals in both if `both`, and the intervals only in `other` if `right`.
+
+        Raises:
+            TypeError: If the result could hold intervals of another type than this collection's.
+        """
+        if not self._merges_with(other):
+            raise TypeError(
+                f"Cannot combine {self.__class__.__name__} "
+                f"with {other.__class__.__name__}"
+            )
+        # lazy operands are only read, so they stay lazy
+        a, a_keys = self._merge_operand()
+        b, b_keys = other._merge_operand()
+        values: list[T] = []
+        keys: list[tuple[int, int]] = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            a_key, b_key = a_keys[i], b_keys[j]
+            if a_key < b_key:
+                if left:
+                    values.append(a[i])
+                    keys.append(a_key)
+                i += 1
+            elif b_key < a_key:
+                if right:
+                    values.append(b[j])
+                    keys.append(b_key)
+                j += 1
+            else:
+                # different kinds of intervals can share the same start and stop
+                i_end, j_end = i + 1, j + 1
+                while i_end < len(a) and a_keys[i_end] == a_key:
+                    i_end += 1
+                while j_end < len(b) and b_keys[j_end] == b_key:
+                    j_end += 1
+                a_run, b_run = a[i:i_end], b[j:j_end]
+                for value in a_run:
+                    in_b = value in b_run
+                    if (both and in_b) or (left and not in_b):
+                        values.append(value)
+                        keys.append(a_key)
+                if right:
+                    for value in b_run:
+                        if value not in a_run:
+                            values.append(value)
+                            keys.append(b_key)
+                i, j = i_end, j_end
+        if left:
+            values.extend(a[i:])
+            keys.extend(a_keys[i:])
+        if right:
+            values.extend(b[j:])
+            keys.extend(b_keys[j:])
+        collection = self._from_values(values)
+        collection._keys = keys
+        return collection
+
+    def union(self, other: Collection[T]) -> Self:
+        """Get the intervals in either collection.
+
+        Both collections are already sorted, so this is a single linear merge.
+        The operator form is `a | b`.
+
+        Args:
+            other: Another collection.
+
+        Returns:
+            A collection of the same type as this one.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> a = wnx.Days([wnx.Day(2025, 1, 1), wnx.Day(2025, 1, 2)])
+            >>> b = wnx.Days([wnx.Day(2025, 1, 2), wnx.Day(2025, 1, 3)])
+            >>> a | b
+            Days([Day(2025, 1, 1), Day(2025, 1, 2), Day(2025, 1, 3)])
+
+            ```
+        """
+        return self._merge(other, left=True, both=True, right=True)
+
+    def intersection(self, other: Collection[T]) -> Self:
+        """Get the intervals in both collections.
+
+        The operator form is `a & b`.
+
+        Args:
+            other: Another collection.
+
+        Returns:
+            A collection of the same type as this one.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> a = wnx.Days([wnx.Day(2025, 1, 1), wnx.Day(2025, 1, 2)])
+            >>> b = wnx.Days([wnx.Day(2025, 1, 2), wnx.Day(2025, 1, 3)])
+            >>> a & b
+            Days([Day(2025, 1, 2)])
+
+            ```
+        """
+        return self._merge(other, left=False, both=True, right=False)
+
+    def difference(self, other: Collection[T]) -> Self:
+        """Get the intervals in this collection that are not in `other`.
+
+        The operator form is `a - b`.
+
+        Args:
+            other: Another collection.
+
+        Returns:
+            A collection of the same type as this one.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> working_days = wnx.Days.range(wnx.Day(2025, 12, 22), 5)
+            >>> holidays = wnx.Days([wnx.Day(2025, 12, 25), wnx.Day(2025, 12, 26)])
+            >>> working_days - holidays
+            Days([Day(2025, 12, 22), Day(2025, 12, 23), Day(2025, 12, 24)])
+
+            ```
+        """
+        return self._merge(other, left=True, both=False, right=False)
+
+    def symmetric_difference(self, other: Collection[T]) -> Self:
+        """Get the intervals in exactly one of the collections.
+
+        The operator form is `a ^ b`.
+
+        Args:
+            other: Another collection.
+
+        Returns:
+            A collection of the same type as this one.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> a = wnx.Days([wnx.Day(2025, 1, 1), wnx.Day(2025, 1, 2)])
+            >>> b = wnx.Days([wnx.Day(2025, 1, 2), wnx.Day(2025, 1, 3)])
+            >>> a ^ b
+            Days([Day(2025, 1, 1), Day(2025, 1, 3)])
+
+            ```
+        """
+        return self._merge(other, left=True, both=False, right=True)
+
+    def issubset(self, other: Collection[T]) -> bool:
+        """Check whether every interval in this collection is also in `other`.
+
+        Args:
+            other: Another collection.
+
+        Returns:
+            True if this collection is a subset of `other`.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> days = wnx.Days.range(wnx.Day(2025, 1, 1), 31)
+            >>> wnx.Days([wnx.Day(2025, 1, 15)]).issubset(days)
+            True
+            >>> wnx.Days([wnx.Day(2025, 2, 1)]).issubset(days)
+            False
+
+            ```
+        """
+        if len(self) > len(other):
+            return False
+        return len(self._merge(other, left=True, both=False, right=False)) == 0
+
+    @final
+    def __or__(self, other: object) -> Self:
+        if not isinstance(other, Collection) or not self._merges_with(other):
+            return NotImplemented
+        return self.union(other)
+
+    @final
+    def __and__(self, other: object) -> Self:
+        if not isinstance(other, Collection) or not self._merges_with(other):
+            return NotImplemented
+        return self.intersection(other)
+
+    @final
+    def __sub__(self, other: object) -> Self:
+        if not isinstance(other, Collection) or not self._merges_with(other):
+            return NotImplemented
+        return self.difference(other)
+
+    @final
+    def __xor__(self, other: object) -> Self:
+        if not isinstance(other, Collection) or not self._merges_with(other):
+            return NotImplemented
+        return self.symmetric_difference(other)
 
     @final
     def __contains__(self, x: object) -> bool:
-        return self._values.__contains__(x)
+        if type(self._values) is not list:
+            return x in self._values
+        if not isinstance(x, Interval):
+            return False
+        try:
+            self.index(x)  # type: ignore
+        except ValueError:
+            return False
+        return True
+
+    def index(self, interval: T) -> int:
+        """Get the position of an interval in this collection.
+
+        Args:
+            interval: The interval to look for.
+
+        Returns:
+            The index of the interval.
+
+        Raises:
+            ValueError: If the interval is not in this collection.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> days = wnx.Days([wnx.Day(2025, 1, 1), wnx.Day(2025, 1, 15)])
+            >>> days.index(wnx.Day(2025, 1, 15))
+            1
+
+            ```
+        """
+        if type(self._values) is not list:
+            return self._values.index(interval)
+
+        keys, _ = self._lookup_keys()
+        key = _sort_key(interval)
+        i = bisect_left(keys, key)
+        # different kinds of intervals can share the same start and stop
+        while i < len(keys) and keys[i] == key:
+            if self._values[i] == interval:
+                return i
+            i += 1
+        raise ValueError(f"{interval!r} is not in {self.__class__.__name__}")
+
+    def find_containing(self, moment: Moment) -> T | None:
+        """Find the interval containing a moment.
+
+        When several intervals contain the moment, the one that starts last is returned.
+
+        Args:
+            moment: The moment to look for.
+
+        Returns:
+            The interval containing the moment, or `None` if there is none.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> days = wnx.Days([wnx.Day(2025, 1, 1), wnx.Day(2025, 1, 15)])
+            >>> days.find_containing(wnx.Moment(2025, 1, 15, 12, 0, 0))
+            Day(2025, 1, 15)
+            >>> days.find_containing(wnx.Moment(2025, 1, 14, 12, 0, 0)) is None
+            True
+
+            ```
+        """
+        if type(self._values) is not list:
+            return self._values.find_containing(moment)  # type: ignore
+
+        keys, max_stops = self._lookup_keys()
+        seconds = moment.epoch_seconds
+        i = (
+            bisect_left(keys, (seconds + 1,)) - 1
+        )  # the last interval starting at or before
+        # walk back only while an earlier interval could still reach the moment
+        while i >= 0 and max_stops[i] > seconds:
+            if keys[i][1] > seconds:
+                return self._values[i]
+            i -= 1
+        return None
 
     @overload
     def __getitem__(self, index: int) -> T: ...
@@ -89,13 +696,20 @@ class Collection[T: Interval]:
         self, index: int | slice[int, int | None, int | None]
     ) -> T | Collection[T]:
         if isinstance(index, slice):
-            return self.__class__(self._values[index])
+            values = self._values[index]
+            if index.step is not None and index.step < 0:
+                values = values[::-1]
+            return self._from_values(values)
         else:
             return self._values[index]
 
     @final
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self._values})"
+        # built by iteration, so a lazy collection is not materialized
+        values = ", ".join(map(repr, islice(self._values, _REPR_LIMIT)))
+        if len(self._values) > _REPR_LIMIT:
+            values += ", ..."
+        return f"{self.__class__.__name__}([{values}])"
 
     @overload
     def __eq__(self, other: Collection[T]) -> bool: ...
@@ -111,10 +725,12 @@ class Collection[T: Interval]:
         if not isinstance(other, self.__class__):
             return False
 
-        return self._values == other.values
-
-    def __reversed__(self) -> NoReturn:
-        raise NotImplementedError
+        if type(self._values) is type(other._values):
+            return self._values == other._values
+        # compare by iteration, so neither side is materialized
+        return len(self._values) == len(other._values) and all(
+            map(eq, self._values, other._values)
+        )
 
     @final
     def __len__(self) -> int:
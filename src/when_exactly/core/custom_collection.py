@@ -1,6 +1,154 @@
+from __future__ import annotations
+
+from array import array
+from types import get_original_bases
+from typing import Any, Self, Sequence, get_args
+
 from when_exactly.core.collection import Collection
 from when_exactly.core.custom_interval import CustomInterval
+from when_exactly.core.interval_range import IntervalRange
+from when_exactly.core.packed import PackedIntervals, check_sorted
 
 
 class CustomCollection[T: CustomInterval](Collection[T]):
-    pass
+    @classmethod
+    def _interval_type(cls) -> type[T]:
+        """The interval type of this collection, e.g. `Day` for `Days`."""
+        for klass in cls.__mro__:
+            for base in get_original_bases(klass):
+                args = get_args(base)
+                if args and isinstance(args[0], type):
+                    return args[0]
+        raise TypeError(f"{cls.__name__} does not declare its interval type")
+
+    @classmethod
+    def range(cls, start: T, count: int, step: int = 1) -> Self:
+        """Create a collection of `count` consecutive intervals, beginning with `start`.
+
+        The collection is lazy: its length, indexing, slicing and membership are
+        computed arithmetically, and intervals are only created when accessed.
+
+        Args:
+            start: The first interval.
+            count: The number of intervals.
+            step: Take every `step`-th interval.
+
+        Returns:
+            A collection of the intervals.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> days = wnx.Days.range(wnx.Day(2020, 1, 1), 3653)
+            >>> len(days)
+            3653
+            >>> days[-1]
+            Day(2029, 12, 31)
+            >>> wnx.Day(2025, 6, 15) in days
+            True
+            >>> wnx.Days.range(wnx.Day(2020, 1, 1), 3, step=7)
+            Days([Day(2020, 1, 1), Day(2020, 1, 8), Day(2020, 1, 15)])
+
+            ```
+        """
+        return cls._from_values(IntervalRange.from_start(start, count, step))
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        if isinstance(self._values, IntervalRange):
+            return self._from_values, (self._values,)  # just the range
+        return super().__reduce__()
+
+    def _pack(self) -> tuple[str, array[int]]:
+        """The name of the interval type, and the index of each value."""
+        interval_type = self._interval_type()
+        indexes = self._indexes(interval_type)
+        if indexes is None:
+            raise TypeError(
+                f"{self.__class__.__name__} can only pack {interval_type.__name__} values"
+            )
+        return interval_type.__name__, array("q", indexes)
+
+    @classmethod
+    def _unpack(cls, name: str, data: Sequence[int]) -> Self:
+        """Create a lazy collection over the indexes written by `_pack`.
+
+        Raises:
+            ValueError: If the indexes are not strictly increasing.
+        """
+        interval_type = cls._interval_type()
+        if name != interval_type.__name__:
+            raise ValueError(f"Cannot load {name} values into {cls.__name__}")
+        check_sorted(data)
+        return cls._from_values(PackedIntervals(interval_type, data))
+
+    def _indexes(self, interval_type: type[T]) -> Sequence[int] | None:
+        """The index of each value, or `None` if not every value is an `interval_type`."""
+        if isinstance(self._values, (IntervalRange, PackedIntervals)):
+            if self._values._interval_type is interval_type:
+                return self._values._indexes
+            return None
+        if all(type(value) is interval_type for value in self._values):
+            return [value._index for value in self._values]
+        return None
+
+    def _merges_with(self, other: Collection[Any]) -> bool:
+        """Collections that declare different interval types cannot be combined."""
+        if not isinstance(other, CustomCollection):
+            return True
+        try:
+            return self._interval_type() is other._interval_type()
+        except TypeError:  # a collection that does not declare its interval type
+            return True
+
+    def _merge(self, other: Collection[T], left: bool, both: bool, right: bool) -> Self:
+        """Merge lazy collections by their interval indexes, so the result is lazy too."""
+        lazy = (IntervalRange, PackedIntervals)
+        if not isinstance(other, CustomCollection) or not (
+            isinstance(self._values, lazy) or isinstance(other._values, lazy)
+        ):
+            return super()._merge(other, left, both, right)
+        try:
+            interval_type = self._interval_type()
+        except TypeError:  # a collection that does not declare its interval type
+            return super()._merge(other, left, both, right)
+        a = self._indexes(interval_type)
+        b = other._indexes(interval_type)
+        if a is None or b is None:
+            return super()._merge(other, left, both, right)
+
+        indexes = array("q")
+        append = indexes.append
+        i = j = 0
+        while i < len(a) and j < len(b):
+            a_index, b_index = a[i], b[j]
+            if a_index < b_index:
+                if left:
+                    append(a_index)
+                i += 1
+            elif b_index < a_index:
+                if right:
+                    append(b_index)
+                j += 1
+            else:
+                if both:
+                    append(a_index)
+                i += 1
+                j += 1
+        if left:
+            indexes.extend(a[i:])
+        if right:
+            indexes.extend(b[j:])
+        return self._from_values(PackedIntervals(interval_type, indexes))
+
+    def _labels(
+        self, values: Sequence[T], starts: list[str], stops: list[str]
+    ) -> list[str]:
+        """Slice the labels out of the formatted starts, when the interval type allows it."""
+        try:
+            interval_type = self._interval_type()
+        except TypeError:
+            return super()._labels(values, starts, stops)
+        width = interval_type._label_width()
+        if width is None or not all(type(value) is interval_type for value in values):
+            return super()._labels(values, starts, stops)
+        return [start[:width] for start in starts]
@@ -1,22 +1,40 @@
 from __future__ import annotations
 
+import copyreg
 import dataclasses
-from copy import deepcopy
-from typing import Any
+import datetime
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Self, SupportsIndex
 
+from when_exactly.core import gregorian, iso
+from when_exactly.core.interning import InternedMeta
 from when_exactly.core.interval import Interval
 from when_exactly.core.moment import Moment
 
+_MISSING: Any = object()
+
+
+def _epoch_seconds(value: Moment | datetime.datetime) -> int:
+    if isinstance(value, Moment):
+        return value.epoch_seconds
+    return gregorian.datetime_to_epoch_seconds(value)
+
 
 @dataclasses.dataclass(frozen=True, init=False, repr=False)
-class CustomInterval(Interval):
+class CustomInterval(Interval, metaclass=InternedMeta):
     """A custom intervval.
 
     This class serves as a base class from which custom intervals can be derived.
     It provides the necessary interface and methods to be implemented by subclasses.
 
+    Custom intervals take part in [interning](interning.md) when it is enabled.
+
     """
 
+    __slots__ = ("_cached",)
+
+    # the fixed-width form that `str` renders, with fields in constructor order
+    _iso_layout: ClassVar[iso.Layout | None] = None
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         Interval.__init__(self, *args, **kwargs)
 
@@ -24,6 +42,259 @@ class CustomInterval(Interval):
     def from_moment(cls, moment: Moment) -> CustomInterval:
         raise NotImplementedError("CustomInterval from_moment not implemented")
 
+    @classmethod
+    def _from_iso_fields(cls, *fields: int) -> Self:
+        """The interval with the fields of `_iso_layout`."""
+        return cls(*fields)
+
+    @classmethod
+    def _label_width(cls) -> int | None:
+        """The length of `str` of this type, if it is always a prefix of `str` of its start."""
+        layout = cls._iso_layout
+        if layout is not None and iso.MOMENT.template.startswith(layout.template):
+            return len(layout.template)
+        return None
+
+    @classmethod
+    def parse(cls, text: str) -> Self:
+        """Create an interval from its ISO 8601 string, as rendered by `str`.
+
+        The string is checked against the fixed-width form of the interval type,
+        and its fields are passed straight to the constructor.
+
+        Args:
+            text: The string to parse.
+
+        Returns:
+            A new interval.
+
+        Raises:
+            ValueError: If the string is not a valid interval of this type.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> wnx.Day.parse("2025-01-15")
+            Day(2025, 1, 15)
+            >>> wnx.Weekday.parse("2020-W01-1")
+            Weekday(2020, 1, 1)
+            >>> wnx.OrdinalDay.parse("2020-001")
+            OrdinalDay(2020, 1)
+            >>> wnx.Minute.parse("2020-01-01T00:00")
+            Minute(2020, 1, 1, 0, 0)
+
+            ```
+        """
+        if cls._iso_layout is None:
+            raise NotImplementedError(f"{cls.__name__} parse not implemented")
+        return iso.parse(cls._iso_layout, cls._from_iso_fields, text, cls.__name__)
+
+    @classmethod
+    def parse_many(
+        cls, texts: Iterable[str]
+    ) -> tuple[list[Self], list[iso.ParseFailure]]:
+        """Parse many ISO 8601 strings, collecting the ones that fail instead of raising.
+
+        Args:
+            texts: The strings to parse, e.g. a list or the lines of a file.
+
+        Returns:
+            The parsed intervals, in order, and a failure for each string that could not be parsed.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> days, failures = wnx.Day.parse_many(["2025-01-15", "2025-02-30", "yesterday"])
+            >>> days
+            [Day(2025, 1, 15)]
+            >>> [(failure.row, failure.text) for failure in failures]
+            [(1, '2025-02-30'), (2, 'yesterday')]
+
+            ```
+        """
+        if cls._iso_layout is None:
+            raise NotImplementedError(f"{cls.__name__} parse_many not implemented")
+        return iso.parse_many(
+            cls._iso_layout, cls._from_iso_fields, texts, cls.__name__
+        )
+
+    @classmethod
+    def _index_of(cls, epoch_seconds: int) -> int:
+        """The index of the interval containing `epoch_seconds`.
+
+        Indexes number the intervals of a type consecutively,
+        so adjacent intervals have adjacent indexes.
+        """
+        raise NotImplementedError("CustomInterval _index_of not implemented")
+
+    @classmethod
+    def _from_index(cls, index: int) -> Self:
+        """The interval with the given index, see `_index_of`."""
+        raise NotImplementedError("CustomInterval _from_index not implemented")
+
+    @property
+    def _index(self) -> int:
+        """The index of this interval, see `_index_of`."""
+        return self._index_of(self.start.epoch_seconds)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        try:
+            index = self._index
+        except NotImplementedError:
+            # without interval indexes, e.g. user-defined intervals, pickle the slots
+            return copyreg.__newobj__, (type(self),), self.__getstate__()
+        # pickle only the index; unpickling goes through the constructor,
+        # so interned intervals stay interned
+        return self._from_index, (index,)
+
+    @classmethod
+    def bucket_ids(cls, values: Iterable[Moment | datetime.datetime]) -> list[int]:
+        """Get the integer id of the interval containing each value.
+
+        Ids are computed arithmetically from the epoch seconds of each value,
+        without creating any intervals.
+        Ids are consecutive: adjacent intervals have ids that differ by one.
+
+        Args:
+            values: The moments or naive datetimes to bucket.
+
+        Returns:
+            The bucket id of each value, in the same order.
+
+        Example:
+            ```python
+            >>> import datetime
+            >>> import when_exactly as wnx
+            >>> a, b, c = wnx.Day.bucket_ids([
+            ...     wnx.Moment(2025, 1, 1, 8, 0, 0),
+            ...     datetime.datetime(2025, 1, 1, 23, 59, 59),
+            ...     wnx.Moment(2025, 1, 2, 0, 0, 0),
+            ... ])
+            >>> a == b, c - a
+            (True, 1)
+
+            ```
+        """
+        index_of = cls._index_of
+        return [index_of(_epoch_seconds(value)) for value in values]
+
+    @classmethod
+    def bucket_many(cls, values: Iterable[Moment | datetime.datetime]) -> list[Self]:
+        """Get the interval containing each value.
+
+        This is the bulk version of `from_moment`.
+        Each distinct interval is only created once and shared between the values it contains.
+
+        Args:
+            values: The moments or naive datetimes to bucket.
+
+        Returns:
+            The interval containing each value, in the same order.
+
+        Example:
+            ```python
+            >>> import datetime
+            >>> import when_exactly as wnx
+            >>> wnx.Hour.bucket_many([
+            ...     wnx.Moment(2025, 1, 1, 8, 15, 0),
+            ...     datetime.datetime(2025, 1, 1, 8, 45, 0),
+            ...     wnx.Moment(2025, 1, 1, 9, 0, 0),
+            ... ])
+            [Hour(2025, 1, 1, 8), Hour(2025, 1, 1, 8), Hour(2025, 1, 1, 9)]
+
+            ```
+        """
+        buckets: dict[int, Self] = {}
+        result = []
+        for index in cls.bucket_ids(values):
+            bucket = buckets.get(index)
+            if bucket is None:
+                bucket = buckets[index] = cls._from_index(index)
+            result.append(bucket)
+        return result
+
+    @classmethod
+    def aggregate[V, A](
+        cls,
+        pairs: Iterable[tuple[Moment | datetime.datetime, V]],
+        reduce: Callable[[A, V], A],
+        initial: A = _MISSING,
+        ordered: bool = True,
+    ) -> Iterator[tuple[Self, A]]:
+        """Group a stream of timestamped values by interval, and reduce each group.
+
+        With `ordered=True` the pairs must be sorted by time. Each group is yielded
+        as soon as a pair falls after it, so the stream is consumed lazily and
+        only one group is held in memory at a time.
+        With `ordered=False` the pairs can come in any order; every group is kept
+        until the stream ends, and the groups are then yielded in order.
+
+        Args:
+            pairs: `(moment, value)` pairs, where moments can also be naive datetimes.
+            reduce: A function combining a group's accumulated result with its next value,
+                    e.g. `operator.add`, `min`, `max` or `lambda count, _: count + 1`.
+            initial: The starting result of each group.
+                     If not given, the first value of each group is used.
+            ordered: Whether the pairs are sorted by time.
+
+        Returns:
+            An iterator of `(interval, result)` pairs for the intervals that have values.
+
+        Raises:
+            ValueError: If `ordered` is true and the pairs are not sorted.
+
+        Example:
+            ```python
+            >>> import operator
+            >>> import when_exactly as wnx
+            >>> readings = iter([
+            ...     (wnx.Moment(2025, 1, 1, 8, 0, 0), 3),
+            ...     (wnx.Moment(2025, 1, 1, 20, 0, 0), 4),
+            ...     (wnx.Moment(2025, 1, 3, 9, 0, 0), 5),
+            ... ])
+            >>> list(wnx.Day.aggregate(readings, operator.add))
+            [(Day(2025, 1, 1), 7), (Day(2025, 1, 3), 5)]
+            >>> counts = wnx.Day.aggregate(
+            ...     [(wnx.Moment(2025, 1, 2, 0, 0, 0), "b"), (wnx.Moment(2025, 1, 1, 0, 0, 0), "a")],
+            ...     lambda count, _: count + 1,
+            ...     initial=0,
+            ...     ordered=False,
+            ... )
+            >>> list(counts)
+            [(Day(2025, 1, 1), 1), (Day(2025, 1, 2), 1)]
+
+            ```
+        """
+        if not ordered:
+            results: dict[int, A] = {}
+            for moment, value in pairs:
+                index = cls._index_of(_epoch_seconds(moment))
+                result = results.get(index, initial)
+                results[index] = value if result is _MISSING else reduce(result, value)  # type: ignore
+            for index in sorted(results):
+                yield cls._from_index(index), results[index]
+            return
+
+        bucket: Self | None = None
+        start = stop = 0
+        result = initial
+        for moment, value in pairs:
+            seconds = _epoch_seconds(moment)
+            if not start <= seconds < stop:
+                if bucket is not None:
+                    if seconds < start:
+                        raise ValueError(
+                            f"{moment} is before {bucket!r}; "
+                            "pass ordered=False for unsorted input"
+                        )
+                    yield bucket, result
+                bucket = cls._from_index(cls._index_of(seconds))
+                start, stop = bucket.start.epoch_seconds, bucket.stop.epoch_seconds
+                result = initial
+            result = value if result is _MISSING else reduce(result, value)  # type: ignore
+        if bucket is not None:
+            yield bucket, result
+
     @property
     def next(self) -> CustomInterval:
         raise NotImplementedError("CustomInterval next not implemented")
@@ -38,14 +309,46 @@ class CustomInterval(Interval):
     def __str__(self) -> str:
         raise NotImplementedError("CustomInterval str not implemented")
 
-    def __add__(self, value: int) -> CustomInterval:
-        next_value = deepcopy(self)
-        for _ in range(value):
-            next_value = next_value.next
-        return next_value
-
-    def __sub__(self, value: int) -> CustomInterval:
-        prev_value = deepcopy(self)
-        for _ in range(value):
-            prev_value = prev_value.previous
-        return prev_value
+    def _offset(self, steps: int) -> Self:
+        """The interval `steps` intervals after this one, or before it when negative.
+
+        Intervals implementing `_index_of` and `_from_index` jump there directly.
+        Otherwise this walks `next` or `previous` one step at a time;
+        subclasses can override it with a direct computation.
+        """
+        try:
+            index = self._index
+        except NotImplementedError:
+            value = self
+            for _ in range(abs(steps)):
+                value = value.next if steps > 0 else value.previous
+            return value  # type: ignore
+        return self._from_index(index + steps)
+
+    def __add__(self, value: int) -> Self:
+        """The interval `value` intervals after this one.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> wnx.Day(2025, 1, 1) + 36500
+            Day(2124, 12, 8)
+            >>> wnx.Month(2025, 1) + -1
+            Month(2024, 12)
+
+            ```
+        """
+        return self._offset(value)
+
+    def __sub__(self, value: int) -> Self:
+        """The interval `value` intervals before this one.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> wnx.Week(2025, 1) - 1
+            Week(2024, 52)
+
+            ```
+        """
+        return self._offset(-value)
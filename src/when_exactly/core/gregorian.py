@@ -0,0 +1,150 @@
+"""Integer arithmetic on the proleptic Gregorian calendar.
+
+Hot paths work on plain integers instead of building `datetime.datetime` objects.
+Conversions between dates and day ordinals go through `datetime.date`,
+whose C implementation is faster than the equivalent pure-Python arithmetic.
+
+Day ordinals follow `datetime.date.toordinal`: _January 1 of year 1_ is day 1.
+"""
+
+from __future__ import annotations
+
+import datetime
+from functools import cache
+
+MINYEAR = datetime.MINYEAR
+MAXYEAR = datetime.MAXYEAR
+
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_HOUR = 60 * SECONDS_PER_MINUTE
+SECONDS_PER_DAY = 24 * SECONDS_PER_HOUR
+SECONDS_PER_WEEK = 7 * SECONDS_PER_DAY  # the epoch is a Monday, so weeks align with it
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def is_leap(year: int) -> bool:
+    """Whether `year` is a leap year."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year: int, month: int) -> int:
+    """The number of days in `month` of `year`."""
+    if month == 2 and is_leap(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+def day_of_year(year: int, month: int, day: int) -> int:
+    """The day of the year (1-366) of a valid (year, month, day) date."""
+    return _DAYS_BEFORE_MONTH[month] + (month > 2 and is_leap(year)) + day
+
+
+def ymd_to_ordinal(year: int, month: int, day: int) -> int:
+    """The day ordinal of a (year, month, day) date.
+
+    Raises:
+        ValueError: If the date is invalid.
+
+    Example:
+        ```python
+        >>> import datetime
+        >>> from when_exactly.core.gregorian import ymd_to_ordinal
+        >>> ymd_to_ordinal(2025, 1, 30) == datetime.date(2025, 1, 30).toordinal()
+        True
+
+        ```
+    """
+    return datetime.date(year, month, day).toordinal()
+
+
+def datetime_to_epoch_seconds(dt: datetime.datetime) -> int:
+    """The number of whole seconds between the epoch and a naive `datetime`.
+
+    Any `tzinfo` is ignored, the same way `Moment.from_datetime` ignores it.
+    """
+    return (
+        (dt.toordinal() - 1) * SECONDS_PER_DAY
+        + dt.hour * SECONDS_PER_HOUR
+        + dt.minute * SECONDS_PER_MINUTE
+        + dt.second
+    )
+
+
+def ordinal_to_ymd(ordinal: int) -> tuple[int, int, int]:
+    """The (year, month, day) date of a day ordinal.
+
+    Raises:
+        ValueError: If the ordinal is outside of the supported range of years.
+
+    Example:
+        ```python
+        >>> from when_exactly.core.gregorian import ordinal_to_ymd, ymd_to_ordinal
+        >>> ordinal_to_ymd(ymd_to_ordinal(2024, 2, 29))
+        (2024, 2, 29)
+
+        ```
+    """
+    date = datetime.date.fromordinal(ordinal)
+    return date.year, date.month, date.day
+
+
+@cache
+def iso_year_start(year: int) -> int:
+    """The day ordinal of the Monday starting week 1 of ISO week-numbering `year`.
+
+    Week 1 is the week containing January 4. Results are memoized per year.
+    """
+    jan_4 = ymd_to_ordinal(year, 1, 4)
+    return jan_4 - (jan_4 - 1) % 7  # day ordinal 1 is a Monday
+
+
+@cache
+def iso_weeks_in_year(year: int) -> int:
+    """The number of weeks (52 or 53) in ISO week-numbering `year`.
+
+    A year has 53 weeks when it starts on a Thursday,
+    or on a Wednesday in a leap year. Results are memoized per year.
+    """
+    jan_1_week_day = (ymd_to_ordinal(year, 1, 1) - 1) % 7 + 1
+    if jan_1_week_day == 4 or (jan_1_week_day == 3 and is_leap(year)):
+        return 53
+    return 52
+
+
+def iso_to_ordinal(year: int, week: int, week_day: int) -> int:
+    """The day ordinal of an ISO (year, week, week_day) date.
+
+    Raises:
+        ValueError: If the week or the week day is invalid.
+    """
+    if not 1 <= week <= iso_weeks_in_year(year):
+        raise ValueError(f"Invalid week: {week}")
+    if not 1 <= week_day <= 7:
+        raise ValueError(f"Invalid weekday: {week_day} (range is [1, 7])")
+    return iso_year_start(year) + 7 * (week - 1) + week_day - 1
+
+
+def ordinal_to_iso(ordinal: int) -> tuple[int, int, int]:
+    """The ISO (year, week, week_day) date of a day ordinal.
+
+    Example:
+        ```python
+        >>> import datetime
+        >>> from when_exactly.core.gregorian import ordinal_to_iso, ymd_to_ordinal
+        >>> ordinal_to_iso(ymd_to_ordinal(2019, 12, 30))
+        (2020, 1, 1)
+        >>> tuple(datetime.date(2019, 12, 30).isocalendar())
+        (2020, 1, 1)
+
+        ```
+    """
+    year = (ordinal - 1) * 400 // 146097 + 1  # 146097 days per 400 years
+    while year > MINYEAR and ordinal < iso_year_start(year):
+        year -= 1
+    week = (ordinal - iso_year_start(year)) // 7 + 1
+    while week > iso_weeks_in_year(year):
+        week -= iso_weeks_in_year(year)
+        year += 1
+    return year, week, (ordinal - 1) % 7 + 1
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class InternTable:
+    """A bounded, thread-safe, least-recently-used table of interned instances.
+
+    Attributes:
+        maxsize: The maximum number of instances kept in the table.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("InternTable maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._instances: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Get the instance stored under `key`, creating it with `factory` if needed."""
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                self._instances.move_to_end(key)
+                return instance
+
+        # create outside of the lock, other threads may race to create the same key
+        instance = factory()
+        with self._lock:
+            existing = self._instances.get(key)
+            if existing is not None:
+                return existing
+            self._instances[key] = instance
+            if len(self._instances) > self.maxsize:
+                self._instances.popitem(last=False)
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+
+_table: InternTable | None = None
+
+
+def enable_interning(maxsize: int = 4096) -> None:
+    """Intern custom intervals, so equal intervals are the same instance.
+
+    When enabled, creating a custom interval (e.g. `Day(2025, 1, 1)`) with the same
+    arguments as a recently created one returns the existing instance,
+    along with any of its already computed properties like `Day.month` or `Week.days`.
+    The most recently used `maxsize` intervals are kept.
+
+    Interning is disabled by default.
+    Calling `enable_interning` again replaces the table with an empty one.
+
+    Args:
+        maxsize: The maximum number of intervals to keep.
+
+    Example:
+        ```python
+        >>> import when_exactly as wnx
+        >>> wnx.enable_interning(maxsize=1000)
+        >>> wnx.Day(2025, 1, 1) is wnx.Day(2025, 1, 1)
+        True
+        >>> wnx.Day(2025, 1, 1) is wnx.Day(2024, 12, 31).next
+        True
+        >>> wnx.disable_interning()
+        >>> wnx.Day(2025, 1, 1) is wnx.Day(2025, 1, 1)
+        False
+
+        ```
+    """
+    global _table
+    _table = InternTable(maxsize)
+
+
+def disable_interning() -> None:
+    """Stop interning custom intervals and drop all interned instances."""
+    global _table
+    _table = None
+
+
+class InternedMeta(type):
+    """Metaclass that looks up instances in the intern table, when interning is enabled."""
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        table = _table
+        if table is None:
+            return super().__call__(*args, **kwargs)
+
+        key = (cls, args, tuple(sorted(kwargs.items()))) if kwargs else (cls, args)
+        try:
+            hash(key)
+        except TypeError:
+            return super().__call__(*args, **kwargs)
+        return table.get_or_create(
+            key, lambda: super(InternedMeta, cls).__call__(*args, **kwargs)
+        )
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
 import dataclasses
+from typing import Iterable, Self
 
+from when_exactly.core import iso
 from when_exactly.core.moment import Moment
+from when_exactly.core.slots import FrozenSlots
+
+_LAYOUT = iso.Layout("0000-00-00T00:00:00/0000-00-00T00:00:00")
 
 
 @dataclasses.dataclass(frozen=True)
-class Interval:
+class Interval(FrozenSlots):
     """An Interval represents a continuous span of time between two moments.
 
     An Interval is defined by a start moment (inclusive) and a stop moment (exclusive),
     following the half-open interval convention [start, stop). The start must always
     be before the stop.
 
+    Moments and intervals use `__slots__` and carry no instance `__dict__`.
+    On 64-bit CPython a `Second`, including its two moments,
+    takes at most 400 bytes.
+
     Attributes:
         start: The beginning moment of the interval (inclusive).
         stop: The ending moment of the interval (exclusive).
@@ -36,6 +45,8 @@ class Interval:
         ```
     """
 
+    __slots__ = ("start", "stop")
+
     start: Moment
     stop: Moment
 
@@ -43,6 +54,62 @@ class Interval:
         if self.start >= self.stop:
             raise ValueError("Interval start must be before stop")
 
+    def __reduce__(self) -> tuple[type[Self], tuple[Moment, Moment]]:
+        return type(self), (self.start, self.stop)
+
+    @classmethod
+    def _from_fields(cls, *fields: int) -> Self:
+        return cls(Moment(*fields[:6]), Moment(*fields[6:]))
+
+    @classmethod
+    def _from_isoformat(cls, text: str) -> Self:
+        start, separator, stop = text.partition("/")
+        if not separator:
+            raise ValueError("expected start/stop")
+        return cls(Moment.parse(start), Moment.parse(stop))
+
+    @classmethod
+    def parse(cls, text: str) -> Self:
+        """Create an Interval from an ISO 8601 `start/stop` string, as rendered by `str`.
+
+        Args:
+            text: The string to parse.
+                  `start` and `stop` can be any form that `Moment.parse` accepts.
+
+        Returns:
+            A new Interval.
+
+        Raises:
+            ValueError: If the string is not a valid interval.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> print(wnx.Interval.parse("2025-01-01T00:00:00/2025-01-02T12:00:00"))
+            2025-01-01T00:00:00/2025-01-02T12:00:00
+
+            ```
+        """
+        return iso.parse(
+            _LAYOUT, cls._from_fields, text, cls.__name__, cls._from_isoformat
+        )
+
+    @classmethod
+    def parse_many(
+        cls, texts: Iterable[str]
+    ) -> tuple[list[Self], list[iso.ParseFailure]]:
+        """Parse many `start/stop` strings, collecting the ones that fail instead of raising.
+
+        Args:
+            texts: The strings to parse, e.g. a list or the lines of a file.
+
+        Returns:
+            The parsed intervals, in order, and a failure for each string that could not be parsed.
+        """
+        return iso.parse_many(
+            _LAYOUT, cls._from_fields, texts, cls.__name__, cls._from_isoformat
+        )
+
     def __lt__(self, other: Interval) -> bool:
         return self.start < other.start or self.stop < other.stop
 
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from math import isqrt
+from operator import itemgetter
+from typing import Iterable, Iterator
+
+from when_exactly.core.interval import Interval
+from when_exactly.core.moment import Moment
+
+# subtrees at or below this level are scanned linearly
+_SCAN_LEVEL = 3
+
+
+def _sort_key(interval: Interval) -> tuple[int, int]:
+    return interval.start.epoch_seconds, interval.stop.epoch_seconds
+
+
+def _build_max_stops(keys: list[tuple[int, int]]) -> tuple[list[int], int]:
+    """Augment `keys` with the maximum stop of each subtree of an implicit tree.
+
+    The sorted keys are laid out as an implicit binary search tree:
+    leaves are at even positions, and the nodes of level `k` are at the
+    positions whose lowest `k` bits are all set.
+
+    Returns:
+        The maximum stop of the subtree rooted at each position, and the root level.
+    """
+    n = len(keys)
+    max_stops = [stop for _, stop in keys]
+    if n == 0:
+        return max_stops, -1
+    last_i = n - 1 if (n - 1) % 2 == 0 else n - 2
+    last = max_stops[last_i]
+    k = 1
+    while 1 << k <= n:
+        x = 1 << (k - 1)
+        for i in range((x << 1) - 1, n, x << 2):
+            right = max_stops[i + x] if i + x < n else last
+            max_stops[i] = max(max_stops[i], max_stops[i - x], right)
+        last_i = last_i - x if last_i >> k & 1 else last_i + x
+        if last_i < n and max_stops[last_i] > last:
+            last = max_stops[last_i]
+        k += 1
+    return max_stops, k - 1
+
+
+class IntervalIndex[T: Interval]:
+    """An IntervalIndex answers overlap and containment queries over many intervals.
+
+    The intervals are kept sorted by start, then stop, as an implicit binary tree
+    where every node knows the latest stop in its subtree.
+    `overlapping` and `containing` run in O(log n + k) for k results.
+
+    Unlike a Collection, an index may hold the same interval more than once,
+    and it can hold intervals of different types.
+
+    Inserted intervals are buffered, and removed ones are marked, until the tree
+    is rebuilt; this happens once the buffer grows to about the square root of the size.
+
+    Example:
+        ```python
+        >>> import when_exactly as wnx
+        >>> index = wnx.IntervalIndex([
+        ...     wnx.Day(2025, 1, 1),
+        ...     wnx.Week(2025, 1),
+        ...     wnx.Hour(2025, 1, 2, 9),
+        ... ])
+        >>> index.containing(wnx.Moment(2025, 1, 2, 9, 30, 0))
+        [Week(2025, 1), Hour(2025, 1, 2, 9)]
+        >>> index.overlapping(wnx.Day(2025, 1, 1))
+        [Week(2025, 1), Day(2025, 1, 1)]
+
+        ```
+    """
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        """Initialize an IntervalIndex with the given intervals.
+
+        Args:
+            values: An iterable of intervals.
+        """
+        self._keys: list[tuple[int, int]] = []
+        self._values: list[T | None] = []  # removed values are None
+        self._max_stops: list[int] = []
+        self._root_level = -1
+        self._pending: list[T] = list(values)
+        self._removed = 0
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        pairs = [
+            (key, value)
+            for key, value in zip(self._keys, self._values)
+            if value is not None
+        ]
+        pairs.extend((_sort_key(value), value) for value in self._pending)
+        pairs.sort(key=itemgetter(0))
+        self._keys = [key for key, _ in pairs]
+        self._values = [value for _, value in pairs]
+        self._max_stops, self._root_level = _build_max_stops(self._keys)
+        self._pending = []
+        self._removed = 0
+
+    def _maybe_rebuild(self) -> None:
+        if len(self._pending) + self._removed > max(32, isqrt(len(self._keys))):
+            self._rebuild()
+
+    def insert(self, interval: T) -> None:
+        """Add an interval to the index.
+
+        Args:
+            interval: The interval to add.
+        """
+        self._pending.append(interval)
+        self._maybe_rebuild()
+
+    def remove(self, interval: T) -> None:
+        """Remove one occurrence of an interval from the index.
+
+        Args:
+            interval: The interval to remove.
+
+        Raises:
+            ValueError: If the interval is not in the index.
+        """
+        try:
+            self._pending.remove(interval)
+            return
+        except ValueError:
+            pass
+        key = _sort_key(interval)
+        i = bisect_left(self._keys, key)
+        # different kinds of intervals can share the same start and stop
+        while i < len(self._keys) and self._keys[i] == key:
+            if self._values[i] is not None and self._values[i] == interval:
+                self._values[i] = None
+                self._removed += 1
+                self._maybe_rebuild()
+                return
+            i += 1
+        raise ValueError(f"{interval!r} is not in IntervalIndex")
+
+    def _query(self, start: int, stop: int) -> list[T]:
+        """The intervals overlapping `[start, stop)` in epoch seconds, in sorted order."""
+        keys, values, max_stops = self._keys, self._values, self._max_stops
+        n = len(keys)
+        result: list[T] = []
+        if n:
+            # each entry is (level, position, whether the left subtree is done)
+            stack = [(self._root_level, (1 << self._root_level) - 1, False)]
+            while stack:
+                k, x, left_done = stack.pop()
+                if k <= _SCAN_LEVEL:
+                    i = x >> k << k
+                    end = min(i + (1 << (k + 1)) - 1, n)
+                    while i < end and keys[i][0] < stop:
+                        if start < keys[i][1] and values[i] is not None:
+                            result.append(values[i])  # type: ignore
+                        i += 1
+                elif not left_done:
+                    stack.append((k, x, True))
+                    left = x - (1 << (k - 1))
+                    if left >= n or max_stops[left] > start:
+                        stack.append((k - 1, left, False))
+                elif x < n and keys[x][0] < stop:
+                    if start < keys[x][1] and values[x] is not None:
+                        result.append(values[x])  # type: ignore
+                    stack.append((k - 1, x + (1 << (k - 1)), False))
+        if self._pending:
+            pending = [
+                value
+                for value in self._pending
+                if value.start.epoch_seconds < stop and start < value.stop.epoch_seconds
+            ]
+            if pending:
+                result.extend(pending)
+                result.sort(key=_sort_key)
+        return result
+
+    def overlapping(self, interval: Interval) -> list[T]:
+        """Get the intervals that overlap an interval.
+
+        Intervals that only touch, where one stops as the other starts, do not overlap.
+
+        Args:
+            interval: The interval to query.
+
+        Returns:
+            The overlapping intervals, sorted by start, then stop.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> index = wnx.IntervalIndex(wnx.Days.range(wnx.Day(2025, 1, 1), 365))
+            >>> index.overlapping(wnx.Week(2025, 2))
+            [Day(2025, 1, 6), Day(2025, 1, 7), Day(2025, 1, 8), Day(2025, 1, 9), Day(2025, 1, 10), Day(2025, 1, 11), Day(2025, 1, 12)]
+
+            ```
+        """
+        return self._query(interval.start.epoch_seconds, interval.stop.epoch_seconds)
+
+    def containing(self, moment: Moment) -> list[T]:
+        """Get the intervals that contain a moment.
+
+        Args:
+            moment: The moment to query.
+
+        Returns:
+            The intervals containing the moment, sorted by start, then stop.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> index = wnx.IntervalIndex([wnx.Month(2025, 1), wnx.Day(2025, 1, 31)])
+            >>> index.containing(wnx.Moment(2025, 1, 31, 12, 0, 0))
+            [Month(2025, 1), Day(2025, 1, 31)]
+            >>> index.containing(wnx.Moment(2025, 2, 1, 0, 0, 0))
+            []
+
+            ```
+        """
+        seconds = moment.epoch_seconds
+        return self._query(seconds, seconds + 1)
+
+    def overlapping_many(self, intervals: Iterable[Interval]) -> list[list[T]]:
+        """Get the intervals that overlap each of several intervals.
+
+        Args:
+            intervals: The intervals to query.
+
+        Returns:
+            The result of `overlapping` for each interval, in the same order.
+        """
+        return [self.overlapping(interval) for interval in intervals]
+
+    def containing_many(self, moments: Iterable[Moment]) -> list[list[T]]:
+        """Get the intervals that contain each of several moments.
+
+        Args:
+            moments: The moments to query.
+
+        Returns:
+            The result of `containing` for each moment, in the same order.
+        """
+        return [self.containing(moment) for moment in moments]
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._removed + len(self._pending)
+
+    def __iter__(self) -> Iterator[T]:
+        if self._pending or self._removed:
+            self._rebuild()
+        return iter(self._values)  # type: ignore
+
+    def __contains__(self, x: object) -> bool:
+        if not isinstance(x, Interval):
+            return False
+        return x in self.overlapping(x)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Iterator, Sequence, overload
+
+from when_exactly.core.custom_interval import CustomInterval
+from when_exactly.core.moment import Moment
+
+
+class IntervalRange[T: CustomInterval](Sequence[T]):
+    """A contiguous run of custom intervals, stored as a `range` of interval indexes.
+
+    Length, indexing, slicing and membership are computed arithmetically;
+    intervals are only created when they are accessed.
+    """
+
+    def __init__(self, interval_type: type[T], indexes: range) -> None:
+        if indexes.step < 1:
+            raise ValueError("IntervalRange step must be positive")
+        self._interval_type = interval_type
+        self._indexes = indexes
+
+    @classmethod
+    def from_start(cls, start: T, count: int, step: int = 1) -> IntervalRange[T]:
+        """The `count` intervals from `start`, taking every `step`-th interval."""
+        index = start._index
+        return cls(type(start), range(index, index + count * step, step))
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> IntervalRange[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | IntervalRange[T]:
+        if isinstance(index, slice):
+            indexes = self._indexes[index]
+            if indexes.step < 0:
+                indexes = indexes[::-1]
+            return IntervalRange(self._interval_type, indexes)
+        return self._interval_type._from_index(self._indexes[index])
+
+    def __iter__(self) -> Iterator[T]:
+        from_index = self._interval_type._from_index
+        for index in self._indexes:
+            yield from_index(index)
+
+    def __reversed__(self) -> Iterator[T]:
+        from_index = self._interval_type._from_index
+        for index in reversed(self._indexes):
+            yield from_index(index)
+
+    def __contains__(self, x: object) -> bool:
+        return type(x) is self._interval_type and x._index in self._indexes  # type: ignore
+
+    def index(self, value: object) -> int:  # type: ignore
+        if value in self:
+            return self._indexes.index(value._index)  # type: ignore
+        raise ValueError(f"{value!r} is not in IntervalRange")
+
+    def find_containing(self, moment: Moment) -> T | None:
+        index = self._interval_type._index_of(moment.epoch_seconds)
+        if index in self._indexes:
+            return self._interval_type._from_index(index)
+        return None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IntervalRange):
+            return (
+                self._interval_type is other._interval_type
+                and self._indexes == other._indexes
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IntervalRange({self._interval_type.__name__}, {self._indexes})"
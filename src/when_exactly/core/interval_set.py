@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Self
+
+from when_exactly.core.custom_collection import CustomCollection
+from when_exactly.core.delta import Delta
+from when_exactly.core.interval import Interval
+from when_exactly.core.moment import Moment
+
+
+def _coalesce(spans: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """Sweep sorted `(start, stop)` spans, merging the ones that overlap or touch."""
+    starts: list[int] = []
+    stops: list[int] = []
+    for start, stop in spans:
+        if stops and start <= stops[-1]:
+            if stop > stops[-1]:
+                stops[-1] = stop
+        else:
+            starts.append(start)
+            stops.append(stop)
+    return starts, stops
+
+
+def _boundaries(starts: list[int], stops: list[int]) -> list[int]:
+    """Interleave starts and stops; membership flips at each boundary."""
+    boundaries = [0] * (2 * len(starts))
+    boundaries[::2] = starts
+    boundaries[1::2] = stops
+    return boundaries
+
+
+class IntervalSet:
+    """An IntervalSet is a set of moments, stored as disjoint spans of time.
+
+    Intervals that overlap or touch are coalesced into a single span,
+    so contiguous Hours become one shift.
+    The spans are kept as sorted lists of epoch seconds, and set operations
+    sweep both sets' boundaries once, in linear time.
+
+    Example:
+        ```python
+        >>> import when_exactly as wnx
+        >>> shifts = wnx.IntervalSet([
+        ...     wnx.Hour(2025, 1, 1, 9),
+        ...     wnx.Hour(2025, 1, 1, 10),
+        ...     wnx.Hour(2025, 1, 1, 14),
+        ... ])
+        >>> for span in shifts:
+        ...     print(span)
+        2025-01-01T09:00:00/2025-01-01T11:00:00
+        2025-01-01T14:00:00/2025-01-01T15:00:00
+        >>> shifts.total_duration
+        Delta(years=0, months=0, weeks=0, days=0, hours=0, minutes=0, seconds=10800)
+
+        ```
+    """
+
+    def __init__(self, values: Iterable[Interval] = ()) -> None:
+        """Initialize an IntervalSet covering the given intervals.
+
+        Args:
+            values: An iterable of intervals, in any order.
+        """
+        spans = [
+            (value.start.epoch_seconds, value.stop.epoch_seconds) for value in values
+        ]
+        spans.sort(key=itemgetter(0))
+        self._starts, self._stops = _coalesce(spans)
+
+    @classmethod
+    def _from_spans(cls, starts: list[int], stops: list[int]) -> Self:
+        """Create a set from spans that are already sorted, disjoint and coalesced."""
+        interval_set = cls.__new__(cls)
+        interval_set._starts = starts
+        interval_set._stops = stops
+        return interval_set
+
+    def _combine(self, other: IntervalSet, keep: Callable[[bool, bool], bool]) -> Self:
+        """Sweep the boundaries of both sets, keeping the moments where `keep` is true.
+
+        `keep` is called with whether a moment is in this set, and whether it is in `other`.
+        """
+        a = _boundaries(self._starts, self._stops)
+        b = _boundaries(other._starts, other._stops)
+        starts: list[int] = []
+        stops: list[int] = []
+        inside = False
+        i = j = 0
+        while i < len(a) or j < len(b):
+            if j == len(b) or (i < len(a) and a[i] < b[j]):
+                x = a[i]
+            else:
+                x = b[j]
+            # the spans of one set never share a boundary, so each advances at most once
+            if i < len(a) and a[i] == x:
+                i += 1
+            if j < len(b) and b[j] == x:
+                j += 1
+            kept = keep(i % 2 == 1, j % 2 == 1)
+            if kept != inside:
+                (starts if kept else stops).append(x)
+                inside = kept
+        return self._from_spans(starts, stops)
+
+    def union(self, other: IntervalSet) -> Self:
+        """Get the moments in either set.
+
+        The operator form is `a | b`.
+
+        Args:
+            other: Another interval set.
+
+        Returns:
+            A new interval set.
+        """
+        return self._combine(other, lambda in_a, in_b: in_a or in_b)
+
+    def intersection(self, other: IntervalSet) -> Self:
+        """Get the moments in both sets.
+
+        The operator form is `a & b`.
+
+        Args:
+            other: Another interval set.
+
+        Returns:
+            A new interval set.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> open_hours = wnx.IntervalSet(wnx.Day(2025, 1, 1).hour(h) for h in range(9, 17))
+            >>> meeting = wnx.IntervalSet([wnx.Interval(
+            ...     wnx.Moment(2025, 1, 1, 16, 30, 0), wnx.Moment(2025, 1, 1, 18, 0, 0)
+            ... )])
+            >>> print(*open_hours & meeting)
+            2025-01-01T16:30:00/2025-01-01T17:00:00
+
+            ```
+        """
+        return self._combine(other, lambda in_a, in_b: in_a and in_b)
+
+    def difference(self, other: IntervalSet) -> Self:
+        """Get the moments in this set that are not in `other`.
+
+        The operator form is `a - b`.
+
+        Args:
+            other: Another interval set.
+
+        Returns:
+            A new interval set.
+        """
+        return self._combine(other, lambda in_a, in_b: in_a and not in_b)
+
+    def symmetric_difference(self, other: IntervalSet) -> Self:
+        """Get the moments in exactly one of the sets.
+
+        The operator form is `a ^ b`.
+
+        Args:
+            other: Another interval set.
+
+        Returns:
+            A new interval set.
+        """
+        return self._combine(other, lambda in_a, in_b: in_a != in_b)
+
+    def complement(self, within: Interval) -> Self:
+        """Get the moments of an interval that are not in this set.
+
+        Args:
+            within: The interval to take the complement in.
+
+        Returns:
+            A new interval set.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> busy = wnx.IntervalSet([wnx.Hour(2025, 1, 1, 12)])
+            >>> for span in busy.complement(wnx.Day(2025, 1, 1)):
+            ...     print(span)
+            2025-01-01T00:00:00/2025-01-01T12:00:00
+            2025-01-01T13:00:00/2025-01-02T00:00:00
+
+            ```
+        """
+        return type(self)([within])._combine(self, lambda in_a, in_b: in_a and not in_b)
+
+    def __or__(self, other: object) -> Self:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other: object) -> Self:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other: object) -> Self:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other: object) -> Self:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    @property
+    def total_duration(self) -> Delta:
+        """Get the total length of the spans in this set, in seconds."""
+        return Delta(seconds=sum(self._stops) - sum(self._starts))
+
+    def to_collection[C: CustomCollection](self, collection_type: type[C]) -> C:  # type: ignore
+        """Get the custom intervals that overlap this set, as a collection.
+
+        Args:
+            collection_type: The type of collection to create, e.g. `Hours` or `Days`.
+
+        Returns:
+            A collection of every interval of the collection's type that overlaps a span.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> shift = wnx.IntervalSet([wnx.Interval(
+            ...     wnx.Moment(2025, 1, 1, 22, 0, 0), wnx.Moment(2025, 1, 2, 6, 0, 0)
+            ... )])
+            >>> shift.to_collection(wnx.Days)
+            Days([Day(2025, 1, 1), Day(2025, 1, 2)])
+
+            ```
+        """
+        interval_type = collection_type._interval_type()
+        index_of = interval_type._index_of
+        indexes: list[int] = []
+        for start, stop in zip(self._starts, self._stops):
+            first = index_of(start)
+            if indexes and first <= indexes[-1]:
+                first = indexes[-1] + 1  # spans can share an interval
+            indexes.extend(range(first, index_of(stop - 1) + 1))
+        return collection_type.from_sorted(map(interval_type._from_index, indexes))
+
+    def __iter__(self) -> Iterator[Interval]:
+        from_epoch_seconds = Moment.from_epoch_seconds
+        for start, stop in zip(self._starts, self._stops):
+            yield Interval(from_epoch_seconds(start), from_epoch_seconds(stop))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __contains__(self, x: object) -> bool:
+        if isinstance(x, Moment):
+            start = stop = x.epoch_seconds
+        elif isinstance(x, Interval):
+            start, stop = x.start.epoch_seconds, x.stop.epoch_seconds - 1
+        else:
+            return False
+        i = bisect_right(self._starts, start) - 1
+        return i >= 0 and stop < self._stops[i]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._stops == other._stops
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(str(span) for span in self) + "}"
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import dataclasses
+import re
+from typing import Callable, Iterable
+
+from when_exactly.core import gregorian
+from when_exactly.core.errors import InvalidMomentError
+
+_TWO_DIGITS = [f"{i:02}" for i in range(100)]
+_MINUTES_SECONDS = [f"{m:02}:{s:02}" for m in range(60) for s in range(60)]
+
+
+@dataclasses.dataclass(frozen=True)
+class ParseFailure:
+    """A string that `parse_many` could not parse.
+
+    Attributes:
+        row: The position of the string in the input, counting from 0.
+        text: The string.
+        reason: Why it could not be parsed.
+    """
+
+    row: int
+    text: str
+    reason: str
+
+
+class Layout:
+    """A fixed-width layout of digit fields and literal characters.
+
+    In the template, each run of `0` is a field of that many ASCII digits,
+    and every other character must appear as is, e.g. `0000-W00-0`.
+    """
+
+    __slots__ = ("template", "_fields", "_literals")
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self._fields = tuple(
+            (match.start(), match.end()) for match in re.finditer("0+", template)
+        )
+        self._literals = tuple(
+            (i, char) for i, char in enumerate(template) if char != "0"
+        )
+
+    def match(self, text: str) -> list[int] | None:
+        """The integer fields of `text`, or `None` if it does not fit the layout."""
+        if len(text) != len(self.template) or not text.isascii():
+            return None
+        for i, char in self._literals:
+            if text[i] != char:
+                return None
+        fields: list[int] = []
+        for start, stop in self._fields:
+            digits = text[start:stop]
+            if not digits.isdigit():
+                return None
+            fields.append(int(digits))
+        return fields
+
+
+MOMENT = Layout("0000-00-00T00:00:00")
+
+
+def format_moments(epoch_seconds: Iterable[int]) -> list[str]:
+    """Format epoch seconds as `YYYY-MM-DDTHH:MM:SS`, like `str` of a `Moment`.
+
+    The date is computed once per run of values on the same day,
+    and the time is assembled from tables of zero-padded fields.
+    """
+    strings: list[str] = []
+    append = strings.append
+    last_day = None
+    date = ""
+    for seconds in epoch_seconds:
+        day, time = divmod(seconds, gregorian.SECONDS_PER_DAY)
+        if day != last_day:
+            year, month, day_of_month = gregorian.ordinal_to_ymd(day + 1)
+            date = f"{year:04}-{_TWO_DIGITS[month]}-{_TWO_DIGITS[day_of_month]}T"
+            last_day = day
+        hour, time = divmod(time, gregorian.SECONDS_PER_HOUR)
+        append(date + _TWO_DIGITS[hour] + ":" + _MINUTES_SECONDS[time])
+    return strings
+
+
+def invalid_message(type_name: str, text: str) -> str:
+    """The message for a string that cannot be parsed as `type_name`."""
+    return f"Invalid isoformat string for {type_name}: {text!r}"
+
+
+def parse[T](
+    layout: Layout,
+    make: Callable[..., T],
+    text: str,
+    type_name: str,
+    fallback: Callable[[str], T] | None = None,
+) -> T:
+    """Parse `text` by calling `make` with the fields of `layout`.
+
+    Strings that do not fit the layout are passed to `fallback`, if given.
+    `make` and `fallback` report invalid values by raising `ValueError`
+    or `InvalidMomentError`.
+
+    Raises:
+        ValueError: If `text` cannot be parsed.
+    """
+    fields = layout.match(text)
+    try:
+        if fields is not None:
+            return make(*fields)
+        if fallback is not None:
+            return fallback(text)
+    except (ValueError, InvalidMomentError) as e:
+        raise ValueError(f"{invalid_message(type_name, text)}: {e}") from e
+    raise ValueError(invalid_message(type_name, text))
+
+
+def parse_many[T](
+    layout: Layout,
+    make: Callable[..., T],
+    texts: Iterable[str],
+    type_name: str,
+    fallback: Callable[[str], T] | None = None,
+) -> tuple[list[T], list[ParseFailure]]:
+    """Parse each string like `parse`, collecting failures instead of raising."""
+    match = layout.match
+    values: list[T] = []
+    failures: list[ParseFailure] = []
+    for row, text in enumerate(texts):
+        fields = match(text)
+        try:
+            if fields is not None:
+                values.append(make(*fields))
+            elif fallback is not None:
+                values.append(fallback(text))
+            else:
+                failures.append(
+                    ParseFailure(row, text, invalid_message(type_name, text))
+                )
+        except (ValueError, InvalidMomentError) as e:
+            failures.append(
+                ParseFailure(row, text, f"{invalid_message(type_name, text)}: {e}")
+            )
+    return values, failures
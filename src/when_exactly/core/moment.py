@@ -2,13 +2,27 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+from typing import Callable, Iterable
 
+from when_exactly.core import gregorian, iso
 from when_exactly.core.delta import Delta
 from when_exactly.core.errors import InvalidMomentError
+from when_exactly.core.slots import FrozenSlots
+
+
+def _from_isoformat(text: str) -> Moment:
+    """Parse the ISO 8601 forms that `datetime.datetime.fromisoformat` accepts."""
+    try:
+        dt = datetime.datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError("not an ISO 8601 date and time") from None
+    if dt.tzinfo is not None:
+        raise ValueError("a Moment has no time zone")
+    return Moment.from_datetime(dt)
 
 
 @dataclasses.dataclass(frozen=True)
-class Moment:
+class Moment(FrozenSlots):
     """A Moment represents a specific point in time with year, month, day, hour, minute, and second.
 
     The `Moment` is analogous to the builtin [`datetime.datetime`](https://docs.python.org/3/library/datetime.html#datetime.datetime) class,
@@ -22,6 +36,10 @@ class Moment:
         minute: The minute (0-59)
         second: The second (0-59)
 
+    Moments are ordered, compared and hashed by their
+    [`epoch_seconds`](#when_exactly.Moment.epoch_seconds),
+    a single integer computed once when the moment is created.
+
     Raises:
         InvalidMomentError: If the provided values don't represent a valid date/time.
 
@@ -40,6 +58,17 @@ class Moment:
 
     """
 
+    __slots__ = (
+        "year",
+        "month",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "_epoch_seconds",
+        "_iso",
+    )
+
     year: int
     month: int
     day: int
@@ -88,17 +117,150 @@ class Moment:
         """
         return cls(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
 
+    @classmethod
+    def from_epoch_seconds(cls, epoch_seconds: int) -> Moment:
+        """Create a Moment from a number of seconds since the epoch.
+
+        The epoch is _January 1 of year 1, 00:00:00_ in the proleptic Gregorian calendar.
+
+        Args:
+            epoch_seconds: The number of seconds since the epoch.
+
+        Returns:
+            A new Moment `epoch_seconds` after the epoch.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> moment = wnx.Moment(2025, 1, 30, 15, 25, 30)
+            >>> wnx.Moment.from_epoch_seconds(moment.epoch_seconds)
+            Moment(year=2025, month=1, day=30, hour=15, minute=25, second=30)
+
+            ```
+        """
+        days, seconds = divmod(epoch_seconds, gregorian.SECONDS_PER_DAY)
+        hour, seconds = divmod(seconds, gregorian.SECONDS_PER_HOUR)
+        minute, second = divmod(seconds, gregorian.SECONDS_PER_MINUTE)
+        try:
+            year, month, day = gregorian.ordinal_to_ymd(days + 1)
+        except ValueError as e:
+            raise InvalidMomentError(str(e)) from e
+        return cls(year, month, day, hour, minute, second)
+
+    @classmethod
+    def parse(cls, text: str) -> Moment:
+        """Create a Moment from an ISO 8601 string.
+
+        Strings in the form that `str` renders, `YYYY-MM-DDTHH:MM:SS`, are parsed
+        directly from their fixed-width fields.
+        Other forms that `datetime.datetime.fromisoformat` accepts, such as dates
+        or fractional seconds, are parsed through `datetime`; time zones are not allowed.
+
+        Args:
+            text: The string to parse.
+
+        Returns:
+            A new Moment.
+
+        Raises:
+            ValueError: If the string is not a valid ISO 8601 date and time.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> wnx.Moment.parse("2025-01-30T15:25:30")
+            Moment(year=2025, month=1, day=30, hour=15, minute=25, second=30)
+            >>> wnx.Moment.parse("2025-01-30")
+            Moment(year=2025, month=1, day=30, hour=0, minute=0, second=0)
+
+            ```
+        """
+        return iso.parse(iso.MOMENT, cls, text, cls.__name__, _from_isoformat)
+
+    @classmethod
+    def parse_many(
+        cls, texts: Iterable[str]
+    ) -> tuple[list[Moment], list[iso.ParseFailure]]:
+        """Parse many ISO 8601 strings, collecting the ones that fail instead of raising.
+
+        Args:
+            texts: The strings to parse, e.g. a list or the lines of a file.
+
+        Returns:
+            The parsed moments, in order, and a failure for each string that could not be parsed.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> moments, failures = wnx.Moment.parse_many(["2025-01-30T15:25:30", "2025-02-30T00:00:00"])
+            >>> moments
+            [Moment(year=2025, month=1, day=30, hour=15, minute=25, second=30)]
+            >>> failures[0].row
+            1
+
+            ```
+        """
+        return iso.parse_many(iso.MOMENT, cls, texts, cls.__name__, _from_isoformat)
+
     def __post_init__(self) -> None:
+        hour, minute, second = self.hour, self.minute, self.second
         try:
-            self.to_datetime()
+            if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
+                self.to_datetime()  # let datetime produce the error message
+            ordinal = gregorian.ymd_to_ordinal(self.year, self.month, self.day)
         except ValueError as e:
             raise InvalidMomentError(str(e)) from e
 
+        object.__setattr__(
+            self,
+            "_epoch_seconds",
+            (ordinal - 1) * gregorian.SECONDS_PER_DAY
+            + hour * gregorian.SECONDS_PER_HOUR
+            + minute * gregorian.SECONDS_PER_MINUTE
+            + second,
+        )
+
+    def __reduce__(self) -> tuple[Callable[[int], Moment], tuple[int]]:
+        # pickle only the epoch seconds, not the fields and cached values
+        return self.from_epoch_seconds, (self._epoch_seconds,)  # type: ignore
+
+    @property
+    def epoch_seconds(self) -> int:
+        """The number of seconds since _January 1 of year 1, 00:00:00_.
+
+        This integer key is what Moments are ordered, compared and hashed by.
+
+        Example:
+            ```python
+            >>> import when_exactly as wnx
+            >>> wnx.Moment(1, 1, 1, 0, 0, 0).epoch_seconds
+            0
+            >>> wnx.Moment(1, 1, 2, 0, 0, 1).epoch_seconds
+            86401
+
+            ```
+        """
+        return self._epoch_seconds  # type: ignore
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._epoch_seconds == other._epoch_seconds  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self._epoch_seconds)  # type: ignore
+
     def __lt__(self, other: Moment) -> bool:
-        return self.to_datetime() < other.to_datetime()
+        return self._epoch_seconds < other._epoch_seconds  # type: ignore
 
     def __le__(self, other: Moment) -> bool:
-        return self.to_datetime() <= other.to_datetime()
+        return self._epoch_seconds <= other._epoch_seconds  # type: ignore
+
+    def __gt__(self, other: Moment) -> bool:
+        return self._epoch_seconds > other._epoch_seconds  # type: ignore
+
+    def __ge__(self, other: Moment) -> bool:
+        return self._epoch_seconds >= other._epoch_seconds  # type: ignore
 
     def __add__(self, delta: Delta) -> Moment:
         """Add a Delta to this Moment to get a new Moment.
@@ -120,45 +282,28 @@ class Moment:
 
             ```
         """
-        new_moment_kwargs = {
-            "year": self.year,
-            "month": self.month,
-            "day": self.day,
-            "hour": self.hour,
-            "minute": self.minute,
-            "second": self.second,
-        }
-        if delta.years != 0:
-            new_moment_kwargs["year"] += delta.years
-
-        if delta.months != 0:
-            new_moment_kwargs["month"] += delta.months
-            while new_moment_kwargs["month"] > 12:
-                new_moment_kwargs["month"] -= 12
-                new_moment_kwargs["year"] += 1
-
-            while new_moment_kwargs["month"] < 1:
-                new_moment_kwargs["month"] += 12
-                new_moment_kwargs["year"] -= 1
-
-        while (
-            new_moment_kwargs["day"] > 28
-        ):  # if the day is too large for the month, wnx need to decrement it until it is valid
+        epoch_seconds = self._epoch_seconds  # type: ignore
+        if delta.years or delta.months:
+            year_carry, month_index = divmod(self.month - 1 + delta.months, 12)
+            year = self.year + delta.years + year_carry
+            month = month_index + 1
+            # clamp to the end of the month, e.g. Jan 31 + 1 month -> Feb 28
+            day = min(self.day, gregorian.days_in_month(year, month))
             try:
-                Moment(**new_moment_kwargs)  # type: ignore
-                break
-            except InvalidMomentError:
-                new_moment_kwargs["day"] -= 1
-
-        dt = Moment(**new_moment_kwargs).to_datetime()  # type: ignore
-
-        dt += datetime.timedelta(weeks=delta.weeks)
-        dt += datetime.timedelta(days=delta.days)
-        dt += datetime.timedelta(hours=delta.hours)
-        dt += datetime.timedelta(minutes=delta.minutes)
-        dt += datetime.timedelta(seconds=delta.seconds)
-
-        return Moment.from_datetime(dt)
+                ordinal = gregorian.ymd_to_ordinal(year, month, day)
+            except ValueError as e:
+                raise InvalidMomentError(str(e)) from e
+            epoch_seconds = (
+                ordinal - 1
+            ) * gregorian.SECONDS_PER_DAY + epoch_seconds % gregorian.SECONDS_PER_DAY
+
+        epoch_seconds += (
+            (delta.weeks * 7 + delta.days) * gregorian.SECONDS_PER_DAY
+            + delta.hours * gregorian.SECONDS_PER_HOUR
+            + delta.minutes * gregorian.SECONDS_PER_MINUTE
+            + delta.seconds
+        )
+        return Moment.from_epoch_seconds(epoch_seconds)
 
     def __sub__(self, delta: Delta) -> Moment:
         """Subtract a Delta from this Moment to get a new Moment.
@@ -191,6 +336,21 @@ class Moment:
     def __str__(self) -> str:
         return self.to_datetime().isoformat()
 
+    @property
+    def _ordinal(self) -> int:
+        """The day ordinal of this moment, see `gregorian`."""
+        return self._epoch_seconds // gregorian.SECONDS_PER_DAY + 1  # type: ignore
+
+    @property
+    def _iso_calendar(self) -> tuple[int, int, int]:
+        """The ISO (year, week, week_day) of this moment, computed on first access."""
+        try:
+            return self._iso  # type: ignore
+        except AttributeError:
+            iso = gregorian.ordinal_to_iso(self._ordinal)
+            object.__setattr__(self, "_iso", iso)
+            return iso
+
     @property
     def week_year(self) -> int:
         """The ISO week-numbering year of this moment.
@@ -208,7 +368,7 @@ class Moment:
 
             ```
         """
-        return self.to_datetime().isocalendar()[0]
+        return self._iso_calendar[0]
 
     @property
     def week(self) -> int:
@@ -226,7 +386,7 @@ class Moment:
 
             ```
         """
-        return self.to_datetime().isocalendar()[1]
+        return self._iso_calendar[1]
 
     @property
     def week_day(self) -> int:
@@ -245,7 +405,7 @@ class Moment:
 
             ```
         """
-        return self.to_datetime().isocalendar()[2]
+        return self._iso_calendar[2]
 
     @property
     def ordinal_day(self) -> int:
@@ -266,8 +426,4 @@ class Moment:
 
             ```
         """
-        return (
-            self.to_datetime().toordinal()
-            - datetime.date(self.year, 1, 1).toordinal()
-            + 1
-        )
+        return gregorian.day_of_year(self.year, self.month, self.day)
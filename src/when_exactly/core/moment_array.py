@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, overload
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "MomentArray requires numpy, install it with `pip install when-exactly[numpy]`"
+    ) from e
+
+from when_exactly.core import gregorian
+from when_exactly.core.delta import Delta
+from when_exactly.core.errors import InvalidMomentError
+from when_exactly.core.moment import Moment
+
+_UNIX_EPOCH_SECONDS = Moment(1970, 1, 1, 0, 0, 0).epoch_seconds
+_UNIX_EPOCH_DAYS = _UNIX_EPOCH_SECONDS // gregorian.SECONDS_PER_DAY
+_MAX_EPOCH_SECONDS = Moment(gregorian.MAXYEAR, 12, 31, 23, 59, 59).epoch_seconds
+
+
+class MomentArray:
+    """A MomentArray is a one-dimensional array of Moments backed by NumPy.
+
+    Moments are stored as a single `int64` buffer of
+    [`epoch_seconds`](moment.md#when_exactly.Moment.epoch_seconds),
+    so bulk arithmetic and calendar fields are computed for the whole array at once.
+    The properties mirror those of [`Moment`](moment.md) but return `numpy` arrays.
+
+    `MomentArray` requires the optional `numpy` dependency
+    (`pip install when-exactly[numpy]`).
+
+    Raises:
+        InvalidMomentError: If any value is outside of the range of valid moments.
+
+    Example:
+        ```python
+        >>> import numpy as np
+        >>> import when_exactly as wnx
+        >>> moments = wnx.MomentArray.from_moments([
+        ...     wnx.Moment(2019, 12, 31, 0, 0, 0),
+        ...     wnx.Moment(2025, 1, 31, 12, 30, 0),
+        ... ])
+        >>> len(moments)
+        2
+        >>> moments[1]
+        Moment(year=2025, month=1, day=31, hour=12, minute=30, second=0)
+        >>> moments.week_year
+        array([2020, 2025])
+        >>> (moments + wnx.Delta(months=1)).day
+        array([31, 28])
+        >>> moments < wnx.Moment(2020, 1, 1, 0, 0, 0)
+        array([ True, False])
+
+        ```
+    """
+
+    def __init__(self, epoch_seconds: npt.ArrayLike) -> None:
+        """Create a MomentArray from seconds since the epoch.
+
+        Args:
+            epoch_seconds: A one-dimensional array-like of
+                [`Moment.epoch_seconds`](moment.md#when_exactly.Moment.epoch_seconds) values.
+                The values are copied, so later changes to `epoch_seconds` are not seen.
+        """
+        values = np.array(epoch_seconds, dtype=np.int64, copy=True)
+        if values.ndim != 1:
+            raise ValueError("MomentArray must be one-dimensional")
+        if values.size and (values.min() < 0 or values.max() > _MAX_EPOCH_SECONDS):
+            raise InvalidMomentError("epoch seconds out of range")
+        values.flags.writeable = False
+        self._epoch_seconds = values
+
+    @classmethod
+    def from_moments(cls, moments: Iterable[Moment]) -> MomentArray:
+        """Create a MomentArray from Moments.
+
+        Args:
+            moments: The moments to store.
+
+        Returns:
+            A new MomentArray holding the moments in the same order.
+        """
+        return cls(np.fromiter((m.epoch_seconds for m in moments), dtype=np.int64))
+
+    @classmethod
+    def from_datetime64(cls, values: npt.ArrayLike) -> MomentArray:
+        """Create a MomentArray from `numpy.datetime64` values.
+
+        Values with a finer resolution than seconds are truncated to the second.
+
+        Args:
+            values: An array-like of `datetime64` values.
+
+        Returns:
+            A new MomentArray holding the same points in time.
+
+        Example:
+            ```python
+            >>> import numpy as np
+            >>> import when_exactly as wnx
+            >>> moments = wnx.MomentArray.from_datetime64(
+            ...     np.array(["2025-01-30T15:25:30.5"], dtype="datetime64[ms]")
+            ... )
+            >>> moments[0]
+            Moment(year=2025, month=1, day=30, hour=15, minute=25, second=30)
+
+            ```
+        """
+        seconds = np.asarray(values).astype("datetime64[s]").astype(np.int64)
+        return cls(seconds + _UNIX_EPOCH_SECONDS)
+
+    def to_datetime64(self) -> npt.NDArray[np.datetime64]:
+        """Convert to an array of `datetime64[s]` values."""
+        return (self._epoch_seconds - _UNIX_EPOCH_SECONDS).astype("datetime64[s]")
+
+    def to_moments(self) -> list[Moment]:
+        """Convert to a list of Moments."""
+        return [
+            Moment(*fields)
+            for fields in zip(
+                self.year.tolist(),
+                self.month.tolist(),
+                self.day.tolist(),
+                self.hour.tolist(),
+                self.minute.tolist(),
+                self.second.tolist(),
+            )
+        ]
+
+    @property
+    def epoch_seconds(self) -> npt.NDArray[np.int64]:
+        """The read-only `int64` buffer of seconds since the epoch."""
+        return self._epoch_seconds
+
+    def _days(self) -> npt.NDArray[np.int64]:
+        """Days since 1970-01-01, the epoch of `datetime64`."""
+        return self._epoch_seconds // gregorian.SECONDS_PER_DAY - _UNIX_EPOCH_DAYS
+
+    def _dates(self) -> npt.NDArray[np.datetime64]:
+        return self._days().astype("datetime64[D]")
+
+    @property
+    def year(self) -> npt.NDArray[np.int64]:
+        """The year of each moment."""
+        return self._dates().astype("datetime64[Y]").astype(np.int64) + 1970
+
+    @property
+    def month(self) -> npt.NDArray[np.int64]:
+        """The month (1-12) of each moment."""
+        return self._dates().astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+    @property
+    def day(self) -> npt.NDArray[np.int64]:
+        """The day of the month (1-31) of each moment."""
+        dates = self._dates()
+        return (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1
+
+    @property
+    def hour(self) -> npt.NDArray[np.int64]:
+        """The hour (0-23) of each moment."""
+        return (
+            self._epoch_seconds
+            % gregorian.SECONDS_PER_DAY
+            // gregorian.SECONDS_PER_HOUR
+        )
+
+    @property
+    def minute(self) -> npt.NDArray[np.int64]:
+        """The minute (0-59) of each moment."""
+        return (
+            self._epoch_seconds
+            % gregorian.SECONDS_PER_HOUR
+            // gregorian.SECONDS_PER_MINUTE
+        )
+
+    @property
+    def second(self) -> npt.NDArray[np.int64]:
+        """The second (0-59) of each moment."""
+        return self._epoch_seconds % gregorian.SECONDS_PER_MINUTE
+
+    @property
+    def week_day(self) -> npt.NDArray[np.int64]:
+        """The ISO weekday (1=Monday, 7=Sunday) of each moment."""
+        # 1970-01-01 was a Thursday
+        return (self._days() + 3) % 7 + 1
+
+    def _thursdays(self) -> npt.NDArray[np.datetime64]:
+        """The Thursday of the ISO week of each moment, which decides its week year."""
+        days = self._days()
+        return (days - (days + 3) % 7 + 3).astype("datetime64[D]")
+
+    @property
+    def week_year(self) -> npt.NDArray[np.int64]:
+        """The ISO week-numbering year of each moment."""
+        return self._thursdays().astype("datetime64[Y]").astype(np.int64) + 1970
+
+    @property
+    def week(self) -> npt.NDArray[np.int64]:
+        """The ISO week number (1-53) of each moment."""
+        thursdays = self._thursdays()
+        day_of_year = (thursdays - thursdays.astype("datetime64[Y]")).astype(np.int64)
+        return day_of_year // 7 + 1
+
+    @property
+    def ordinal_day(self) -> npt.NDArray[np.int64]:
+        """The day of the year (1-366) of each moment."""
+        dates = self._dates()
+        return (dates - dates.astype("datetime64[Y]")).astype(np.int64) + 1
+
+    def __add__(self, delta: Delta) -> MomentArray:
+        """Add a Delta to every moment, with the same rules as `Moment + Delta`."""
+        seconds = self._epoch_seconds
+        if delta.years or delta.months:
+            dates = self._dates()
+            months = dates.astype("datetime64[M]")
+            day_index = (dates - months).astype(np.int64)
+            new_months = months + np.timedelta64(delta.years * 12 + delta.months, "M")
+            new_starts = new_months.astype("datetime64[D]")
+            new_stops = (new_months + np.timedelta64(1, "M")).astype("datetime64[D]")
+            month_lengths = (new_stops - new_starts).astype(np.int64)
+            # clamp to the end of the month, e.g. Jan 31 + 1 month -> Feb 28
+            new_dates = new_starts + np.minimum(day_index, month_lengths - 1).astype(
+                "timedelta64[D]"
+            )
+            seconds = (
+                new_dates.astype(np.int64) + _UNIX_EPOCH_DAYS
+            ) * gregorian.SECONDS_PER_DAY + seconds % gregorian.SECONDS_PER_DAY
+
+        offset = (
+            (delta.weeks * 7 + delta.days) * gregorian.SECONDS_PER_DAY
+            + delta.hours * gregorian.SECONDS_PER_HOUR
+            + delta.minutes * gregorian.SECONDS_PER_MINUTE
+            + delta.seconds
+        )
+        return MomentArray(seconds + offset)
+
+    def __sub__(self, delta: Delta) -> MomentArray:
+        """Subtract a Delta from every moment."""
+        return self + Delta(
+            years=-delta.years,
+            months=-delta.months,
+            weeks=-delta.weeks,
+            days=-delta.days,
+            hours=-delta.hours,
+            minutes=-delta.minutes,
+            seconds=-delta.seconds,
+        )
+
+    @staticmethod
+    def _key(other: MomentArray | Moment) -> npt.NDArray[np.int64] | int:
+        if isinstance(other, MomentArray):
+            return other._epoch_seconds
+        if isinstance(other, Moment):
+            return other.epoch_seconds
+        raise TypeError(f"cannot compare MomentArray with {type(other).__name__}")
+
+    def __eq__(self, other: object) -> npt.NDArray[np.bool_]:  # type: ignore
+        if not isinstance(other, (MomentArray, Moment)):
+            return NotImplemented
+        return self._epoch_seconds == self._key(other)
+
+    def __ne__(self, other: object) -> npt.NDArray[np.bool_]:  # type: ignore
+        if not isinstance(other, (MomentArray, Moment)):
+            return NotImplemented
+        return self._epoch_seconds != self._key(other)
+
+    def __lt__(self, other: MomentArray | Moment) -> npt.NDArray[np.bool_]:
+        return self._epoch_seconds < self._key(other)
+
+    def __le__(self, other: MomentArray | Moment) -> npt.NDArray[np.bool_]:
+        return self._epoch_seconds <= self._key(other)
+
+    def __gt__(self, other: MomentArray | Moment) -> npt.NDArray[np.bool_]:
+        return self._epoch_seconds > self._key(other)
+
+    def __ge__(self, other: MomentArray | Moment) -> npt.NDArray[np.bool_]:
+        return self._epoch_seconds >= self._key(other)
+
+    __hash__ = None  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._epoch_seconds)
+
+    def __iter__(self) -> Iterator[Moment]:
+        return iter(self.to_moments())
+
+    @overload
+    def __getitem__(self, index: int) -> Moment: ...
+
+    @overload
+    def __getitem__(self, index: slice | npt.ArrayLike) -> MomentArray: ...
+
+    def __getitem__(self, index: int | slice | npt.ArrayLike) -> Moment | MomentArray:
+        value = self._epoch_seconds[index]  # type: ignore
+        if isinstance(value, np.integer):
+            return Moment.from_epoch_seconds(int(value))
+        return MomentArray(value)
+
+    def __repr__(self) -> str:
+        return f"MomentArray({np.array2string(self.to_datetime64(), separator=', ')})"
@@ -0,0 +1,170 @@
+"""A compact binary file format for collections.
+
+A file starts with a header: the magic bytes `WNXC`, a format version, and the
+name of the interval type, padded to a multiple of 8 bytes.
+The rest of the file is an array of little-endian signed 64-bit integers.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import pairwise
+from typing import Iterator, Sequence, overload
+
+from when_exactly.core.custom_interval import CustomInterval
+from when_exactly.core.moment import Moment
+
+_MAGIC = b"WNXC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")  # magic, version, reserved, length of the name
+
+
+def write(path: str | os.PathLike[str], name: str, data: array[int]) -> None:
+    """Write a file with the interval type `name` and an array of integers."""
+    encoded = name.encode()
+    header = _HEADER.pack(_MAGIC, _VERSION, 0, len(encoded)) + encoded
+    header += bytes(-len(header) % 8)
+    if sys.byteorder == "big":  # pragma: no cover
+        data = array("q", data)
+        data.byteswap()
+    with open(path, "wb") as file:
+        file.write(header)
+        data.tofile(file)
+
+
+def read(
+    path: str | os.PathLike[str], use_mmap: bool = True
+) -> tuple[str, Sequence[int]]:
+    """Read the interval type name and the integers of a file.
+
+    With `use_mmap`, the integers are a view of the memory-mapped file,
+    so they are only read from disk when accessed.
+    The view keeps the file mapped until it is passed to `close`.
+
+    Raises:
+        ValueError: If the file is not in this format.
+    """
+    with open(path, "rb") as file:
+        magic, version, _, name_length = _HEADER.unpack(file.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{os.fspath(path)!r} is not a packed collection")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported packed collection version {version}")
+        name = file.read(name_length).decode()
+        offset = _HEADER.size + name_length
+        offset += -offset % 8
+
+        if use_mmap and sys.byteorder == "little":
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return name, memoryview(mapped)[offset:].cast("q")
+
+        file.seek(offset)
+        data = array("q")
+        data.frombytes(file.read())
+        if sys.byteorder == "big":  # pragma: no cover
+            data.byteswap()
+        return name, data
+
+
+def close(data: Sequence[int]) -> None:
+    """Release the memory-mapped file behind integers returned by `read`, if any.
+
+    Slices of the integers share the mapping; the file is unmapped once none remain.
+    Closing again does nothing.
+    """
+    if not isinstance(data, memoryview):
+        return
+    try:
+        mapped = data.obj
+    except ValueError:  # already released
+        return
+    if isinstance(mapped, mmap.mmap):
+        data.release()
+        try:
+            mapped.close()
+        except BufferError:  # a slice still uses the mapping
+            pass
+
+
+def check_sorted(keys: Sequence[object]) -> None:
+    """Raise `ValueError` unless `keys` are strictly increasing.
+
+    Lookups and merges bisect the loaded integers, so they must be sorted.
+    """
+    if not all(a < b for a, b in pairwise(keys)):  # type: ignore[operator]
+        raise ValueError("Packed collection is not sorted or has duplicates")
+
+
+class PackedIntervals[T: CustomInterval](Sequence[T]):
+    """Custom intervals stored as a sorted sequence of their interval indexes.
+
+    Intervals are only created when they are accessed.
+    Membership and lookups bisect the indexes.
+    """
+
+    def __init__(self, interval_type: type[T], indexes: Sequence[int]) -> None:
+        self._interval_type = interval_type
+        self._indexes = indexes
+
+    def close(self) -> None:
+        """Release the memory-mapped file holding the indexes, if any."""
+        close(self._indexes)
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> PackedIntervals[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | PackedIntervals[T]:
+        if isinstance(index, slice):
+            return PackedIntervals(self._interval_type, self._indexes[index])
+        return self._interval_type._from_index(self._indexes[index])
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._interval_type._from_index, self._indexes)
+
+    def __reversed__(self) -> Iterator[T]:
+        return map(self._interval_type._from_index, reversed(self._indexes))
+
+    def _position(self, index: int) -> int | None:
+        i = bisect_left(self._indexes, index)
+        if i < len(self._indexes) and self._indexes[i] == index:
+            return i
+        return None
+
+    def __contains__(self, x: object) -> bool:
+        return (
+            type(x) is self._interval_type and self._position(x._index) is not None  # type: ignore
+        )
+
+    def index(self, value: object) -> int:  # type: ignore
+        if type(value) is self._interval_type:
+            i = self._position(value._index)  # type: ignore
+            if i is not None:
+                return i
+        raise ValueError(f"{value!r} is not in PackedIntervals")
+
+    def find_containing(self, moment: Moment) -> T | None:
+        i = self._position(self._interval_type._index_of(moment.epoch_seconds))
+        if i is None:
+            return None
+        return self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PackedIntervals):
+            return self._interval_type is other._interval_type and memoryview(
+                self._indexes  # type: ignore
+            ) == memoryview(other._indexes)  # type: ignore
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PackedIntervals({self._interval_type.__name__}, {len(self)})"
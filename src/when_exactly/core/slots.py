@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Self, overload
+
+
+class FrozenSlots:
+    """A base for frozen dataclasses that declare `__slots__`.
+
+    Frozen dataclasses reject `setattr`, which the default restoring of slots
+    relies on when an instance is unpickled.
+    This restores the slots with `object.__setattr__` instead.
+
+    Frozen instances are immutable, so copying one returns the instance itself.
+    """
+
+    __slots__ = ()
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+    def __setstate__(self, state: tuple[dict[str, Any] | None, dict[str, Any]]) -> None:
+        attributes, slots = state
+        if attributes:
+            self.__dict__.update(attributes)
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
+
+class cached_property[T, R]:
+    """A `functools.cached_property` for classes with `__slots__`.
+
+    Computed values are stored in a dictionary in the instance's `_cached` slot,
+    which is only created when a first value is computed.
+    """
+
+    def __init__(self, func: Callable[[T], R]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.name = func.__name__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type | None = None
+    ) -> cached_property[T, R]: ...
+
+    @overload
+    def __get__(self, instance: T, owner: type | None = None) -> R: ...
+
+    def __get__(
+        self, instance: T | None, owner: type | None = None
+    ) -> R | cached_property[T, R]:
+        if instance is None:
+            return self
+        try:
+            cache = instance._cached  # type: ignore
+        except AttributeError:
+            cache = {}
+            object.__setattr__(instance, "_cached", cache)
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(instance)
+            return value
@@ -1,4 +1,6 @@
+import copy
 import dataclasses
+import pickle
 from typing import Any, Type
 
 import pytest
@@ -37,6 +39,14 @@ def assert_custom_interval_implemented_correctly(
     )
     assert params.custom_interval.next == params.expected_next
 
+    last_second = params.expected_stop - wnx.Delta(seconds=1)
+    assert params.custom_interval_type.bucket_many(
+        [params.expected_start, last_second, params.expected_stop]
+    ) == [params.custom_interval, params.custom_interval, params.expected_next]
+    assert params.custom_interval_type.bucket_many(
+        [params.expected_start - wnx.Delta(seconds=1)]
+    ) == [params.expected_prev]
+
     assert params.custom_interval + 1 == params.expected_next
     assert params.custom_interval - 1 == params.expected_prev
 
@@ -46,6 +56,14 @@ def assert_custom_interval_implemented_correctly(
     assert params.custom_interval + 2 == params.expected_next.next
     assert params.custom_interval - 2 == params.expected_prev.previous
 
+    assert params.custom_interval + -1 == params.expected_prev
+    assert params.custom_interval - -1 == params.expected_next
+    assert params.custom_interval + 100 - 100 == params.custom_interval
+
+    assert copy.copy(params.custom_interval) is params.custom_interval
+    assert copy.deepcopy(params.custom_interval) is params.custom_interval
+    assert pickle.loads(pickle.dumps(params.custom_interval)) == params.custom_interval
+
 
 def assert_frozen(obj: Any) -> None:
     assert dataclasses.is_dataclass(obj)
@@ -105,6 +123,15 @@ def assert_custom_collection_implemented_correctly[T: wnx.CustomInterval](
     for i, val in enumerate(interval_values):
         assert collection[i] == val
 
+    # test index and find_containing
+    for i, val in enumerate(interval_values):
+        assert collection.index(val) == i
+        assert collection.find_containing(val.start) == val
+    with pytest.raises(ValueError):
+        collection_type(interval_values[1:]).index(interval_values[0])
+    assert interval_values[0] not in collection_type(interval_values[1:])
+    assert object() not in collection
+
     # test __getitem__ with slice
     collection_slice = collection[1:]
     assert isinstance(collection_slice, collection_type)
@@ -114,14 +141,14 @@ def assert_custom_collection_implemented_correctly[T: wnx.CustomInterval](
     # # test __add__
     # assert collection + collection == collection_type(interval_values + interval_values)
 
-    # # test __sub__
-    # assert collection - collection == collection_type([])
+    # test __sub__
+    assert collection - collection == collection_type([])
 
-    # # test __and__
-    # assert collection & collection == collection
+    # test __and__
+    assert collection & collection == collection
 
-    # # test __or__
-    # assert collection | collection == collection
+    # test __or__
+    assert collection | collection == collection
 
-    # # test __xor__
-    # assert collection ^ collection == collection_type([])
+    # test __xor__
+    assert collection ^ collection == collection_type([])
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+import when_exactly as wnx
+
+
+def test_business_calendar_matches_brute_force() -> None:
+    rng = random.Random(0)
+    days = list(wnx.Days.range(wnx.Day(2019, 12, 1), 800))
+    holidays = rng.sample(days, 40)
+    for weekend in [(6, 7), (5, 6), (7,), ()]:
+        calendar = wnx.BusinessCalendar(weekend=weekend, holidays=holidays)
+        business = [
+            day
+            for day in days
+            if day.start.week_day not in weekend and day not in holidays
+        ]
+        assert [day for day in days if calendar.is_business_day(day)] == business
+
+        for _ in range(100):
+            a, b = sorted(rng.sample(range(len(days)), 2))
+            expected = sum(1 for day in business if days[a] <= day < days[b])
+            assert calendar.business_days_between(days[a], days[b]) == expected
+            assert calendar.business_days_between(days[b], days[a]) == -expected
+
+            day = days[rng.randrange(100, 700)]
+            after = [other for other in business if other.start > day.start]
+            before = [other for other in business if other.start < day.start]
+            assert calendar.next_business_day(day) == after[0]
+            n = rng.randrange(1, 80)
+            assert calendar.add_business_days(day, n) == after[n - 1]
+            assert calendar.add_business_days(day, -n) == before[-n]
+            assert calendar.add_business_days(day, 0) == day
+
+
+def test_business_calendar_spans_years() -> None:
+    calendar = wnx.BusinessCalendar(holidays=[wnx.Day(2025, 1, 1)])
+    day = calendar.add_business_days(wnx.Day(2000, 1, 3), 10_000)
+    assert calendar.business_days_between(wnx.Day(2000, 1, 3), day) == 10_000
+    assert calendar.is_business_day(day)
+    assert calendar.add_business_days(day, -10_000) == wnx.Day(2000, 1, 3)
+
+
+def test_business_calendar_invalid_weekend() -> None:
+    with pytest.raises(ValueError):
+        wnx.BusinessCalendar(weekend=range(1, 8))
+    with pytest.raises(ValueError):
+        wnx.BusinessCalendar(weekend=[0])
+
+
+def test_business_calendar_range_boundaries() -> None:
+    calendar = wnx.BusinessCalendar()
+    assert calendar.add_business_days(wnx.Day(9999, 6, 1), 1) == wnx.Day(9999, 6, 2)
+    assert calendar.next_business_day(wnx.Day(9999, 12, 1)) == wnx.Day(9999, 12, 2)
+    assert calendar.next_business_day(wnx.Day(9999, 12, 29)) == wnx.Day(9999, 12, 30)
+    assert calendar.add_business_days(wnx.Day(1, 1, 2), -1) == wnx.Day(1, 1, 1)
+    with pytest.raises(wnx.InvalidMomentError):
+        calendar.next_business_day(wnx.Day(9999, 12, 30))
+    with pytest.raises(wnx.InvalidMomentError):
+        calendar.add_business_days(wnx.Day(1, 1, 1), -1)
@@ -1,6 +1,14 @@
+import copy
+import csv
+import io
+import pickle
+from array import array
+from pathlib import Path
+
 import pytest
 
 import when_exactly as wnx
+from when_exactly.core import packed
 
 
 @pytest.fixture  # type: ignore
@@ -29,8 +37,7 @@ def test_collection_api(
     assert intervals[0:2] == wnx.Collection(values[0:2])
     assert intervals == intervals
 
-    with pytest.raises(NotImplementedError):
-        assert reversed(intervals)
+    assert list(reversed(intervals)) == values[::-1]
 
     assert len(intervals) == 3
 
@@ -43,3 +50,315 @@ def test_collection_sorts_and_removes_duplicates() -> None:
     values = [a, b, c, a, b, c]
     intervals = wnx.Collection(values)
     assert list(intervals) == [a, b, c]
+
+
+def test_collection_lookups() -> None:
+    day = wnx.Day(2020, 1, 1)
+    ordinal_day = wnx.OrdinalDay(2020, 1)  # same start and stop as day
+    week = wnx.Week(2020, 1)  # 2019-12-30 to 2020-01-06
+    hour = wnx.Hour(2020, 1, 3, 12)
+    intervals = wnx.Collection([hour, week, ordinal_day])
+
+    assert list(intervals) == [week, ordinal_day, hour]
+    assert intervals.index(ordinal_day) == 1
+    assert ordinal_day in intervals
+    assert day not in intervals
+    with pytest.raises(ValueError):
+        intervals.index(day)
+
+    assert intervals.find_containing(wnx.Moment(2019, 12, 30, 0, 0, 0)) == week
+    assert intervals.find_containing(wnx.Moment(2020, 1, 1, 6, 0, 0)) == ordinal_day
+    assert intervals.find_containing(wnx.Moment(2020, 1, 2, 6, 0, 0)) == week
+    assert intervals.find_containing(wnx.Moment(2020, 1, 3, 12, 30, 0)) == hour
+    assert intervals.find_containing(wnx.Moment(2020, 1, 6, 0, 0, 0)) is None
+    assert intervals.find_containing(wnx.Moment(2019, 1, 1, 0, 0, 0)) is None
+
+
+def test_range_collection_lookups() -> None:
+    days = wnx.Days.range(wnx.Day(2020, 1, 1), 10, step=2)
+    assert days.index(wnx.Day(2020, 1, 5)) == 2
+    with pytest.raises(ValueError):
+        days.index(wnx.Day(2020, 1, 2))
+    assert days.find_containing(wnx.Moment(2020, 1, 5, 1, 0, 0)) == wnx.Day(2020, 1, 5)
+    assert days.find_containing(wnx.Moment(2020, 1, 2, 1, 0, 0)) is None
+
+
+def test_collection_iteration_is_reentrant(
+    values: list[wnx.Interval], intervals: wnx.Collection[wnx.Interval]
+) -> None:
+    pairs = [(a, b) for a in intervals for b in intervals]
+    assert pairs == [(a, b) for a in values for b in values]
+
+    for _ in intervals:
+        break
+    assert list(intervals) == values
+
+    iterators = [iter(intervals), iter(intervals)]
+    assert next(iterators[0]) == values[0]
+    assert next(iterators[0]) == values[1]
+    assert next(iterators[1]) == values[0]
+
+    days = wnx.Days.range(wnx.Day(2020, 1, 1), 3)
+    assert list(reversed(days)) == list(days)[::-1]
+
+
+def test_collection_from_sorted(values: list[wnx.Interval]) -> None:
+    intervals = wnx.Collection.from_sorted(iter(values))
+    assert intervals == wnx.Collection(values)
+    assert values[1] in intervals
+    assert intervals.index(values[2]) == 2
+
+
+def test_collection_removes_duplicates_sharing_a_key() -> None:
+    day = wnx.Day(2020, 1, 1)
+    ordinal_day = wnx.OrdinalDay(2020, 1)  # same start and stop as day
+    intervals = wnx.Collection([ordinal_day, day, ordinal_day, day])
+    assert len(intervals) == 2
+    assert day in intervals
+    assert ordinal_day in intervals
+
+
+def test_collection_set_operations() -> None:
+    a = wnx.Days.range(wnx.Day(2020, 1, 1), 5)  # Jan 1 - 5
+    b = wnx.Days.range(wnx.Day(2020, 1, 4), 4)  # Jan 4 - 7
+    a_values, b_values = set(a), set(b)
+
+    for result, expected in [
+        (a | b, a_values | b_values),
+        (a & b, a_values & b_values),
+        (a - b, a_values - b_values),
+        (b - a, b_values - a_values),
+        (a ^ b, a_values ^ b_values),
+    ]:
+        assert isinstance(result, wnx.Days)
+        assert result == wnx.Days(expected)
+        assert result.index(max(expected, key=lambda day: day.start)) == len(result) - 1
+
+    assert (a & b).issubset(a)
+    assert not a.issubset(b)
+    assert wnx.Days([]).issubset(a)
+    with pytest.raises(TypeError):
+        a | set(b)  # type: ignore
+
+
+def test_collection_set_operations_keep_the_interval_type() -> None:
+    days = wnx.Days.range(wnx.Day(2020, 1, 1), 3)
+    hours = wnx.Hours([wnx.Hour(2020, 1, 1, 0)])
+    for operation in [
+        lambda: days | hours,
+        lambda: days & hours,
+        lambda: days - hours,
+        lambda: wnx.Days(list(days)) ^ hours,
+        lambda: days.union(hours),  # type: ignore
+        lambda: hours.issubset(days),  # type: ignore
+    ]:
+        with pytest.raises(TypeError):
+            operation()
+
+    bare = wnx.CustomCollection([wnx.Day(2020, 1, 5)])
+    assert list(days | bare) == [*days, wnx.Day(2020, 1, 5)]
+    assert list(bare - days) == [wnx.Day(2020, 1, 5)]
+
+
+def test_collection_set_operations_keep_operands_lazy() -> None:
+    days = wnx.Days.range(wnx.Day(2000, 1, 1), 3650)
+    holidays = wnx.Days(
+        [wnx.Day(2000, 12, 25), wnx.Day(2005, 1, 1), wnx.Day(2020, 1, 1)]
+    )
+    working = days - holidays
+    assert not isinstance(days._values, list)
+    assert days._keys is None
+    assert not isinstance(working._values, list)
+    assert len(working) == 3648
+    assert working == wnx.Days(list(days)) - wnx.Days(list(holidays))
+    assert wnx.Day(2000, 12, 25) not in working
+
+    loaded = wnx.Days._unpack(*days._pack())
+    assert (loaded & holidays).values == holidays[:2].values
+    assert not isinstance(loaded._values, list)
+    assert holidays | days == days | holidays
+    assert len(holidays | days) == 3651
+
+
+def test_collection_set_operations_with_shared_keys() -> None:
+    day = wnx.Day(2020, 1, 1)
+    ordinal_day = wnx.OrdinalDay(2020, 1)  # same start and stop as day
+    hour = wnx.Hour(2020, 1, 1, 0)
+    a = wnx.Collection[wnx.Interval]([day, hour])
+    b = wnx.Collection[wnx.Interval]([ordinal_day, hour])
+
+    assert list(a | b) == [hour, day, ordinal_day]
+    assert list(a & b) == [hour]
+    assert list(a - b) == [day]
+    assert list(a ^ b) == [day, ordinal_day]
+    assert not a.issubset(b)
+
+
+@pytest.mark.parametrize("mmap", [True, False])  # type: ignore
+def test_collection_dump_and_load(tmp_path: Path, mmap: bool) -> None:
+    path = tmp_path / "seconds.wnx"
+    seconds = wnx.Seconds.range(wnx.Second(2025, 1, 1, 0, 0, 0), 1_000_000, step=3)
+    seconds.dump(path)
+    assert path.stat().st_size < 8 * len(seconds) + 64
+
+    loaded = wnx.Seconds.load(path, mmap=mmap)
+    assert len(loaded) == len(seconds)
+    assert loaded[0] == wnx.Second(2025, 1, 1, 0, 0, 0)
+    assert loaded[-1] == seconds[-1]
+    assert loaded[10:13] == seconds[10:13]
+    assert loaded[13:10:-1] == seconds[13:10:-1]
+    assert wnx.Second(2025, 1, 1, 0, 0, 3) in loaded
+    assert wnx.Second(2025, 1, 1, 0, 0, 4) not in loaded
+    assert loaded.index(wnx.Second(2025, 1, 1, 0, 1, 0)) == 20
+    assert loaded.find_containing(wnx.Moment(2025, 1, 1, 0, 0, 6)) == wnx.Second(
+        2025, 1, 1, 0, 0, 6
+    )
+    assert loaded.find_containing(wnx.Moment(2025, 1, 1, 0, 0, 7)) is None
+    assert loaded == wnx.Seconds.load(path, mmap=mmap)
+
+    loaded[:5].dump(tmp_path / "head.wnx")
+    assert wnx.Seconds.load(tmp_path / "head.wnx").values == seconds[:5].values
+
+
+def test_collection_dump_and_load_plain_intervals(
+    tmp_path: Path, intervals: wnx.Collection[wnx.Interval]
+) -> None:
+    path = tmp_path / "intervals.wnx"
+    intervals.dump(path)
+    assert wnx.Collection.load(path) == intervals
+
+    with pytest.raises(ValueError, match="Cannot load Interval values into Days"):
+        wnx.Days.load(path)
+    with pytest.raises(TypeError, match="can only pack Interval values"):
+        wnx.Collection([wnx.Day(2025, 1, 1)]).dump(path)
+    with pytest.raises(TypeError, match="can only pack Day values"):
+        wnx.Days([wnx.Day(2025, 1, 1), wnx.OrdinalDay(2025, 5)]).dump(path)
+    with pytest.raises(TypeError, match="does not declare its interval type"):
+        wnx.CustomCollection([wnx.Day(2025, 1, 1)]).dump(path)
+
+    path.write_bytes(b"not a collection")
+    with pytest.raises(ValueError, match="is not a packed collection"):
+        wnx.Collection.load(path)
+
+
+def test_collection_load_can_be_closed(tmp_path: Path) -> None:
+    path = tmp_path / "days.wnx"
+    wnx.Days.range(wnx.Day(2025, 1, 1), 10).dump(path)
+
+    with wnx.Days.load(path) as days:
+        head = days[:2]
+        assert days[0] == wnx.Day(2025, 1, 1)
+    with pytest.raises(ValueError, match="released"):
+        days[0]
+    days.close()
+    assert list(head) == [wnx.Day(2025, 1, 1), wnx.Day(2025, 1, 2)]  # still mapped
+
+    wnx.Days.load(path, mmap=False).close()
+    wnx.Days.range(wnx.Day(2025, 1, 1), 10).close()
+
+
+def test_collection_load_rejects_unsorted_files(
+    tmp_path: Path, intervals: wnx.Collection[wnx.Interval]
+) -> None:
+    path = tmp_path / "days.wnx"
+    packed.write(path, "Day", array("q", [3, 1, 2]))
+    with pytest.raises(ValueError, match="not sorted"):
+        wnx.Days.load(path)
+    packed.write(path, "Day", array("q", [1, 1]))
+    with pytest.raises(ValueError, match="not sorted"):
+        wnx.Days.load(path, mmap=False)
+
+    _, data = intervals._pack()
+    packed.write(path, "Interval", array("q", reversed(data)))
+    with pytest.raises(ValueError, match="not sorted"):
+        wnx.Collection.load(path)
+
+
+@pytest.mark.parametrize(
+    "collection",
+    [
+        wnx.Years.range(wnx.Year(1999), 3),
+        wnx.Months.range(wnx.Month(2024, 11), 3),
+        wnx.Weeks.range(wnx.Week(2020, 52), 3),
+        wnx.Weekdays.range(wnx.Weekday(2020, 53, 6), 3),
+        wnx.Days.range(wnx.Day(2024, 12, 31), 3),
+        wnx.Hours.range(wnx.Hour(2024, 12, 31, 23), 3),
+        wnx.Minutes.range(wnx.Minute(2024, 12, 31, 23, 59), 3),
+        wnx.Seconds.range(wnx.Second(2024, 12, 31, 23, 59, 59), 3),
+        wnx.Collection(
+            [
+                wnx.Day(2025, 1, 1),
+                wnx.Interval(
+                    wnx.Moment(2025, 1, 1, 0, 0, 0), wnx.Moment(2025, 1, 3, 0, 0, 0)
+                ),
+            ]
+        ),
+    ],
+    ids=lambda collection: type(collection).__name__,
+)  # type: ignore
+def test_collection_format_many_and_to_csv(
+    tmp_path: Path, collection: wnx.Collection[wnx.Interval]
+) -> None:
+    assert collection.format_many() == [str(value) for value in collection]
+
+    path = tmp_path / "intervals.tsv"
+    collection.to_csv(path, delimiter="\t")
+    assert path.read_text().splitlines() == ["start\tstop\tlabel"] + [
+        f"{value.start}\t{value.stop}\t{value}" for value in collection
+    ]
+
+
+def test_collection_to_csv_writes_in_chunks() -> None:
+    seconds = wnx.Seconds.range(wnx.Second(2025, 1, 1, 0, 0, 0), 86_400)
+    buffer = io.StringIO()
+    seconds.to_csv(buffer, header=False)
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == 86_400
+    assert (
+        lines[65_536] == "2025-01-01T18:12:16,2025-01-01T18:12:17,2025-01-01T18:12:16"
+    )
+    assert lines[-1] == "2025-01-01T23:59:59,2025-01-02T00:00:00,2025-01-01T23:59:59"
+
+
+def test_collection_labels_of_other_interval_types() -> None:
+    days = wnx.Days([wnx.Day(2025, 1, 1), wnx.OrdinalDay(2025, 5)])
+    assert days.format_many() == ["2025-01-01", "2025-005"]
+    bare = wnx.CustomCollection([wnx.Day(2025, 1, 1)])
+    assert bare.format_many() == ["2025-01-01"]
+    buffer = io.StringIO()
+    bare.to_csv(buffer, delimiter="-")
+    rows = list(csv.reader(io.StringIO(buffer.getvalue()), delimiter="-"))
+    assert rows == [
+        ["start", "stop", "label"],
+        ["2025-01-01T00:00:00", "2025-01-02T00:00:00", "2025-01-01"],
+    ]
+
+
+def test_collection_pickle_and_copy(values: list[wnx.Interval]) -> None:
+    hours = wnx.Hours.from_sorted(
+        wnx.Hours.range(wnx.Hour(2025, 1, 1, 0), 10_000, step=2).values
+    )
+    data = pickle.dumps(hours)
+    assert len(data) < 9 * len(hours) + 200  # one 64-bit index per hour
+    assert pickle.loads(data) == hours
+
+    lazy = wnx.Days.range(wnx.Day(2020, 1, 1), 1_000_000)
+    assert len(pickle.dumps(lazy)) < 300
+    assert pickle.loads(pickle.dumps(lazy)) == lazy
+
+    plain = wnx.Collection(values)
+    mixed = wnx.Collection([*values, wnx.Day(2020, 1, 1)])
+    mixed_days = wnx.Days([wnx.Day(2020, 1, 1), wnx.OrdinalDay(2020, 5)])
+    restored = pickle.loads(pickle.dumps(mixed_days))
+    assert [type(value) for value in restored] == [wnx.Day, wnx.OrdinalDay]
+    assert list(restored) == list(mixed_days)
+    for collection in [hours, lazy, plain, mixed, mixed_days]:
+        assert pickle.loads(pickle.dumps(collection)) == collection
+        assert copy.copy(collection) == collection
+        deep = copy.deepcopy(collection)
+        assert deep == collection
+        assert deep is not collection
+
+    deep = copy.deepcopy(plain)
+    deep.values.pop()
+    assert len(plain) == 3
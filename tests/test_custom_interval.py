@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import csv
+import dataclasses
+import io
+import pickle
+
+import when_exactly as wnx
+
+
+@dataclasses.dataclass(frozen=True, init=False, repr=False)
+class Quarter(wnx.CustomInterval):
+    def __init__(self, year: int, quarter: int) -> None:
+        start = wnx.Moment(year, quarter * 3 - 2, 1, 0, 0, 0)
+        wnx.CustomInterval.__init__(self, start=start, stop=start + wnx.Delta(months=3))
+
+    @classmethod
+    def from_moment(cls, moment: wnx.Moment) -> Quarter:
+        return Quarter(moment.year, (moment.month - 1) // 3 + 1)
+
+    @property
+    def next(self) -> Quarter:
+        return Quarter.from_moment(self.stop)
+
+    @property
+    def previous(self) -> Quarter:
+        return Quarter.from_moment(self.start - wnx.Delta(months=3))
+
+    def __repr__(self) -> str:
+        return f"Quarter({self.start.year}, {(self.start.month - 1) // 3 + 1})"
+
+    def __str__(self) -> str:
+        return f"Q{(self.start.month - 1) // 3 + 1}, {self.start.year}"
+
+
+class Quarters(wnx.CustomCollection[Quarter]):
+    pass
+
+
+class MyDay(wnx.Day):
+    pass
+
+
+class MyWeek(wnx.Week):
+    pass
+
+
+def test_offset_falls_back_to_stepping() -> None:
+    quarter = Quarter(2020, 1)
+    assert quarter + 0 == quarter
+    assert quarter + 5 == Quarter(2021, 2)
+    assert quarter - 5 == Quarter(2018, 4)
+    assert quarter + -1 == Quarter(2019, 4)
+
+
+def test_offset_jumps_directly() -> None:
+    day = wnx.Day(2025, 1, 1)
+    assert day + 36500 == wnx.Day(2124, 12, 8)
+    assert day - 36500 == wnx.Day(1925, 1, 26)
+    assert wnx.Month(2025, 1) + 1200 == wnx.Month(2125, 1)
+    assert wnx.Week(2020, 53) + 1 == wnx.Week(2021, 1)
+    assert wnx.Weekday(2020, 53, 7) + 1 == wnx.Weekday(2021, 1, 1)
+    assert wnx.OrdinalDay(2020, 366) + 1 == wnx.OrdinalDay(2021, 1)
+    assert wnx.Second(2020, 1, 1, 0, 0, 0) - 1 == wnx.Second(2019, 12, 31, 23, 59, 59)
+
+
+def test_pickle_without_interval_indexes() -> None:
+    quarter = Quarter(2020, 1)
+    assert pickle.loads(pickle.dumps(quarter)) == quarter
+    assert type(pickle.loads(pickle.dumps(quarter, protocol=0))) is Quarter
+
+    quarters = Quarters([Quarter(2020, 2), Quarter(2020, 1)])
+    restored = pickle.loads(pickle.dumps(quarters))
+    assert restored == quarters
+    assert list(restored) == [Quarter(2020, 1), Quarter(2020, 2)]
+
+
+def test_to_csv_quotes_labels() -> None:
+    quarters = Quarters([Quarter(2020, 1), Quarter(2020, 2)])
+    assert quarters.format_many() == ["Q1, 2020", "Q2, 2020"]
+    buffer = io.StringIO()
+    quarters.to_csv(buffer, header=False)
+    assert list(csv.reader(io.StringIO(buffer.getvalue()))) == [
+        ["2020-01-01T00:00:00", "2020-04-01T00:00:00", "Q1, 2020"],
+        ["2020-04-01T00:00:00", "2020-07-01T00:00:00", "Q2, 2020"],
+    ]
+
+
+def test_subclasses_survive_index_arithmetic_and_pickling() -> None:
+    day = MyDay(2020, 1, 1)
+    week = MyWeek(2020, 53)
+    for value in [day + 1, day - 366, pickle.loads(pickle.dumps(day))]:
+        assert type(value) is MyDay
+    for value in [week.next, week.previous, week + 1, pickle.loads(pickle.dumps(week))]:
+        assert type(value) is MyWeek
+    assert pickle.loads(pickle.dumps(day)) == day
+    assert week.next == MyWeek(2021, 1)
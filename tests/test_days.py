@@ -43,3 +43,44 @@ def test_months() -> None:
         ]
     )
     assert days.months == wnx.Months([wnx.Month(2020, 1), wnx.Month(2020, 2)])
+
+
+def test_range() -> None:
+    days = wnx.Days.range(wnx.Day(2020, 2, 27), 4)
+    expected = wnx.Days(
+        [
+            wnx.Day(2020, 2, 27),
+            wnx.Day(2020, 2, 28),
+            wnx.Day(2020, 2, 29),
+            wnx.Day(2020, 3, 1),
+        ]
+    )
+    assert isinstance(days, wnx.Days)
+    assert days == expected
+    assert expected == days
+    assert len(days) == 4
+    assert list(days) == list(expected)
+    assert days[-1] == wnx.Day(2020, 3, 1)
+    assert days[1:3] == expected[1:3]
+    assert days[::-2] == expected[::-2]
+    assert wnx.Day(2020, 2, 29) in days
+    assert wnx.Day(2020, 3, 2) not in days
+    assert wnx.OrdinalDay(2020, 60) not in days
+    assert repr(days) == repr(expected)
+    assert days.months == wnx.Months([wnx.Month(2020, 2), wnx.Month(2020, 3)])
+
+
+def test_range_is_lazy() -> None:
+    days = wnx.Days.range(wnx.Day(1, 1, 1), 3652058)
+    assert len(days) == 3652058
+    assert days[-1] == wnx.Day(9999, 12, 30)
+    assert days[1000:2000:10][1] == days[1010]
+    assert wnx.Day(2020, 1, 1) in days
+    assert not isinstance(days._values, list)
+
+    assert repr(days[:2]) == "Days([Day(1, 1, 1), Day(1, 1, 2)])"
+    assert repr(days).startswith("Days([Day(1, 1, 1), Day(1, 1, 2), ")
+    assert repr(days).endswith("Day(1, 4, 10), ...])")
+    assert days[:3] == wnx.Days(list(days[:3]))
+    assert days != wnx.Days(list(days[:3]))
+    assert not isinstance(days._values, list)
@@ -1,3 +1,10 @@
+import datetime
+import itertools
+import operator
+from typing import Iterator
+
+import pytest
+
 import when_exactly as wnx
 from tests.asserts import (
     CustomIntervalParams,
@@ -40,3 +47,61 @@ def test_hour_minute() -> None:
     hour = wnx.Hour(2020, 1, 1, 0)
     assert hour.minute(0) == wnx.Minute(2020, 1, 1, 0, 0)
     assert hour.minute(59) == wnx.Minute(2020, 1, 1, 0, 59)
+
+
+def test_hour_bucket_ids() -> None:
+    ids = wnx.Hour.bucket_ids(
+        [
+            wnx.Moment(2020, 1, 1, 0, 0, 0),
+            datetime.datetime(2020, 1, 1, 0, 59, 59, 999999),
+            wnx.Moment(2020, 1, 1, 1, 0, 0),
+            datetime.datetime(2019, 12, 31, 23, 0, 0),
+        ]
+    )
+    assert ids[0] == ids[1]
+    assert ids[2] == ids[0] + 1
+    assert ids[3] == ids[0] - 1
+
+    hours = wnx.Hour.bucket_many([datetime.datetime(2020, 1, 1, 5, 30, 0)] * 3)
+    assert hours == [wnx.Hour(2020, 1, 1, 5)] * 3
+    assert hours[0] is hours[1] is hours[2]
+
+
+def test_hour_aggregate() -> None:
+    def stream() -> Iterator[tuple[wnx.Moment | datetime.datetime, int]]:
+        yield wnx.Moment(2020, 1, 1, 0, 15, 0), 5
+        yield datetime.datetime(2020, 1, 1, 0, 45, 0), 2
+        yield wnx.Moment(2020, 1, 1, 3, 0, 0), 7
+        yield wnx.Moment(2020, 1, 1, 3, 59, 59), 1
+
+    assert list(wnx.Hour.aggregate(stream(), operator.add)) == [
+        (wnx.Hour(2020, 1, 1, 0), 7),
+        (wnx.Hour(2020, 1, 1, 3), 8),
+    ]
+    assert list(wnx.Hour.aggregate(stream(), min)) == [
+        (wnx.Hour(2020, 1, 1, 0), 2),
+        (wnx.Hour(2020, 1, 1, 3), 1),
+    ]
+    assert list(wnx.Hour.aggregate(stream(), lambda n, _: n + 1, initial=0)) == [
+        (wnx.Hour(2020, 1, 1, 0), 2),
+        (wnx.Hour(2020, 1, 1, 3), 2),
+    ]
+    assert list(wnx.Hour.aggregate([], operator.add)) == []
+
+    # groups are yielded lazily
+    groups = wnx.Hour.aggregate(
+        itertools.chain(
+            stream(), itertools.repeat((wnx.Moment(2020, 1, 2, 0, 0, 0), 0))
+        ),
+        max,
+    )
+    assert next(groups) == (wnx.Hour(2020, 1, 1, 0), 5)
+
+    unsorted = reversed(list(stream()))
+    with pytest.raises(ValueError):
+        list(wnx.Hour.aggregate(unsorted, operator.add))
+    unsorted = reversed(list(stream()))
+    assert list(wnx.Hour.aggregate(unsorted, operator.add, ordered=False)) == [
+        (wnx.Hour(2020, 1, 1, 0), 7),
+        (wnx.Hour(2020, 1, 1, 3), 8),
+    ]
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+import when_exactly as wnx
+from when_exactly.core.interning import InternTable
+
+
+@pytest.fixture  # type: ignore
+def interning() -> Iterator[None]:
+    wnx.enable_interning(maxsize=3)
+    yield
+    wnx.disable_interning()
+
+
+def test_interning_disabled_by_default() -> None:
+    assert wnx.Day(2020, 1, 1) is not wnx.Day(2020, 1, 1)
+
+
+@pytest.mark.usefixtures("interning")
+def test_interning_returns_same_instance() -> None:
+    day = wnx.Day(2020, 1, 1)
+    assert wnx.Day(2020, 1, 1) is day
+    assert wnx.Day(2019, 12, 31).next is day
+    assert wnx.Day.from_moment(wnx.Moment(2020, 1, 1, 12, 0, 0)) is day
+    assert day.month is wnx.Day(2020, 1, 1).month
+    assert wnx.Weekday(year=2020, week=1, week_day=3) is wnx.Weekday(
+        week_day=3, week=1, year=2020
+    )
+    assert wnx.Month(2020, 1) is not wnx.Year(2020)
+
+
+@pytest.mark.usefixtures("interning")
+def test_interning_evicts_least_recently_used() -> None:
+    a, b, c = wnx.Year(2020), wnx.Year(2021), wnx.Year(2022)
+    assert wnx.Year(2020) is a  # a is now the most recently used
+    wnx.Year(2023)  # evicts b
+    assert wnx.Year(2020) is a
+    assert wnx.Year(2022) is c
+    assert wnx.Year(2021) is not b
+
+
+@pytest.mark.usefixtures("interning")
+def test_interning_invalid_arguments() -> None:
+    with pytest.raises(wnx.InvalidMomentError):
+        wnx.Day(2020, 1, 32)
+
+
+def test_intern_table_thread_safe() -> None:
+    table = InternTable(maxsize=10)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda i: table.get_or_create(i % 5, lambda: object()), range(1000)
+            )
+        )
+    assert len(table) == 5
+    for i, result in enumerate(results):
+        assert result is table.get_or_create(i % 5, lambda: object())
+
+    with pytest.raises(ValueError):
+        InternTable(maxsize=0)
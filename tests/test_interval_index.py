@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+import when_exactly as wnx
+
+
+def _brute_force(
+    values: list[wnx.Interval], start: int, stop: int
+) -> list[tuple[int, int]]:
+    return sorted(
+        (value.start.epoch_seconds, value.stop.epoch_seconds)
+        for value in values
+        if value.start.epoch_seconds < stop and start < value.stop.epoch_seconds
+    )
+
+
+def _keys(values: list[wnx.Interval]) -> list[tuple[int, int]]:
+    return [(value.start.epoch_seconds, value.stop.epoch_seconds) for value in values]
+
+
+def test_interval_index_queries() -> None:
+    day = wnx.Day(2020, 1, 1)
+    ordinal_day = wnx.OrdinalDay(2020, 1)  # same start and stop as day
+    week = wnx.Week(2020, 1)  # 2019-12-30 to 2020-01-06
+    hour = wnx.Hour(2020, 1, 3, 12)
+    index = wnx.IntervalIndex([hour, week, ordinal_day, day])
+
+    assert len(index) == 4
+    assert index.containing(wnx.Moment(2020, 1, 1, 6, 0, 0)) == [week, ordinal_day, day]
+    assert index.containing(wnx.Moment(2020, 1, 3, 12, 0, 0)) == [week, hour]
+    assert index.containing(wnx.Moment(2020, 1, 6, 0, 0, 0)) == []
+    assert index.overlapping(wnx.Day(2020, 1, 2)) == [week]
+    assert index.overlapping(wnx.Day(2019, 12, 29)) == []  # touching is not overlapping
+    assert index.overlapping_many([wnx.Day(2020, 1, 3), wnx.Month(2020, 2)]) == [
+        [week, hour],
+        [],
+    ]
+    assert index.containing_many([wnx.Moment(2020, 1, 5, 0, 0, 0)]) == [[week]]
+    assert day in index
+    assert wnx.Day(2020, 1, 2) not in index
+
+
+def test_interval_index_insert_and_remove() -> None:
+    day = wnx.Day(2020, 1, 1)
+    index = wnx.IntervalIndex[wnx.Day]()
+    assert index.containing(day.start) == []
+
+    index.insert(day)
+    index.insert(day)
+    assert index.containing(day.start) == [day, day]
+    index.remove(day)
+    assert list(index) == [day]
+    index.remove(day)
+    assert len(index) == 0
+    with pytest.raises(ValueError):
+        index.remove(day)
+
+
+def test_interval_index_matches_brute_force() -> None:
+    rng = random.Random(0)
+    origin = wnx.Moment(2020, 1, 1, 0, 0, 0)
+
+    def random_interval() -> wnx.Interval:
+        start = rng.randrange(0, 100_000)
+        return wnx.Interval(
+            origin + wnx.Delta(seconds=start),
+            origin + wnx.Delta(seconds=start + rng.randrange(1, 10_000)),
+        )
+
+    values = [random_interval() for _ in range(500)]
+    index = wnx.IntervalIndex(values)
+    for _ in range(500):
+        if rng.random() < 0.3:
+            value = random_interval()
+            index.insert(value)
+            values.append(value)
+        elif rng.random() < 0.3:
+            value = rng.choice(values)
+            index.remove(value)
+            values.remove(value)
+
+        query = random_interval()
+        expected = _brute_force(
+            values, query.start.epoch_seconds, query.stop.epoch_seconds
+        )
+        assert _keys(index.overlapping(query)) == expected
+        assert _keys(index.containing(query.start)) == _brute_force(
+            values, query.start.epoch_seconds, query.start.epoch_seconds + 1
+        )
+    assert len(index) == len(values)
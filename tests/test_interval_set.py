@@ -0,0 +1,89 @@
+import random
+
+import when_exactly as wnx
+
+
+def _seconds(interval_set: wnx.IntervalSet) -> set[int]:
+    return {
+        second
+        for span in interval_set
+        for second in range(span.start.epoch_seconds, span.stop.epoch_seconds)
+    }
+
+
+def test_interval_set_coalesces() -> None:
+    shifts = wnx.IntervalSet(
+        [
+            wnx.Hour(2020, 1, 1, 10),
+            wnx.Hour(2020, 1, 1, 9),
+            wnx.Day(2020, 1, 2),
+            wnx.Hour(2020, 1, 2, 5),  # inside the day
+            wnx.Hour(2020, 1, 3, 0),  # touches the day
+        ]
+    )
+    assert list(shifts) == [
+        wnx.Interval(wnx.Moment(2020, 1, 1, 9, 0, 0), wnx.Moment(2020, 1, 1, 11, 0, 0)),
+        wnx.Interval(wnx.Moment(2020, 1, 2, 0, 0, 0), wnx.Moment(2020, 1, 3, 1, 0, 0)),
+    ]
+    assert len(shifts) == 2
+    assert shifts.total_duration == wnx.Delta(seconds=27 * 3600)
+    assert wnx.Moment(2020, 1, 1, 10, 59, 59) in shifts
+    assert wnx.Moment(2020, 1, 1, 11, 0, 0) not in shifts
+    assert wnx.Hour(2020, 1, 2, 23) in shifts
+    assert wnx.Day(2020, 1, 1) not in shifts
+    assert shifts == wnx.IntervalSet(list(shifts))
+    assert wnx.IntervalSet() == wnx.IntervalSet([])
+
+
+def test_interval_set_to_collection() -> None:
+    shifts = wnx.IntervalSet(
+        [
+            wnx.Interval(
+                wnx.Moment(2020, 1, 1, 9, 30, 0), wnx.Moment(2020, 1, 1, 11, 0, 0)
+            ),
+            wnx.Hour(2020, 1, 1, 11),  # coalesced with the first span
+            wnx.Interval(
+                wnx.Moment(2020, 1, 1, 14, 0, 0), wnx.Moment(2020, 1, 1, 14, 0, 1)
+            ),
+            wnx.Hour(2020, 1, 1, 14).next,
+        ]
+    )
+    hours = shifts.to_collection(wnx.Hours)
+    assert isinstance(hours, wnx.Hours)
+    assert hours == wnx.Hours(
+        [wnx.Hour(2020, 1, 1, hour) for hour in [9, 10, 11, 14, 15]]
+    )
+    assert shifts.to_collection(wnx.Days) == wnx.Days([wnx.Day(2020, 1, 1)])
+    assert wnx.IntervalSet().to_collection(wnx.Days) == wnx.Days([])
+
+
+def test_interval_set_operations_match_brute_force() -> None:
+    rng = random.Random(0)
+    origin = wnx.Moment(2020, 1, 1, 0, 0, 0)
+
+    def random_set() -> wnx.IntervalSet:
+        intervals = []
+        for _ in range(rng.randrange(0, 20)):
+            start = rng.randrange(0, 500)
+            intervals.append(
+                wnx.Interval(
+                    origin + wnx.Delta(seconds=start),
+                    origin + wnx.Delta(seconds=start + rng.randrange(1, 50)),
+                )
+            )
+        return wnx.IntervalSet(intervals)
+
+    within = wnx.Interval(origin, origin + wnx.Delta(seconds=400))
+    for _ in range(200):
+        a, b = random_set(), random_set()
+        sa, sb = _seconds(a), _seconds(b)
+        assert _seconds(a | b) == sa | sb
+        assert _seconds(a & b) == sa & sb
+        assert _seconds(a - b) == sa - sb
+        assert _seconds(a ^ b) == sa ^ sb
+        assert (
+            _seconds(a.complement(within)) == _seconds(wnx.IntervalSet([within])) - sa
+        )
+        for result in [a | b, a & b, a - b, a ^ b]:
+            # the result is coalesced
+            assert result == wnx.IntervalSet(list(result))
@@ -0,0 +1,84 @@
+import pytest
+
+import when_exactly as wnx
+
+VALUES = [
+    wnx.Year(2025),
+    wnx.Month(2025, 2),
+    wnx.Week(2020, 53),
+    wnx.Weekday(2020, 1, 1),
+    wnx.Day(2025, 1, 15),
+    wnx.OrdinalDay(2020, 366),
+    wnx.Hour(2025, 1, 1, 5),
+    wnx.Minute(2025, 1, 1, 5, 6),
+    wnx.Second(2025, 1, 1, 5, 6, 7),
+]
+
+
+@pytest.mark.parametrize("value", VALUES, ids=lambda v: type(v).__name__)  # type: ignore
+def test_parse_round_trips(value: wnx.CustomInterval) -> None:
+    assert type(value).parse(str(value)) == value
+    assert type(value).parse_many([str(value)]) == ([value], [])
+
+
+@pytest.mark.parametrize(
+    "interval_type, text",
+    [
+        (wnx.Year, "202"),
+        (wnx.Year, "+202"),
+        (wnx.Month, "2025-13"),
+        (wnx.Week, "2025-W53"),
+        (wnx.Week, "2025W01"),
+        (wnx.Weekday, "2020-W01-8"),
+        (wnx.Day, "2025-02-30"),
+        (wnx.Day, "2025-1-15"),
+        (wnx.Day, "２０２５-01-15"),
+        (wnx.OrdinalDay, "2025-366"),
+        (wnx.Hour, "2025-01-01 05"),
+        (wnx.Second, "2025-01-01T05:06:60"),
+    ],
+)  # type: ignore
+def test_parse_rejects_invalid_strings(
+    interval_type: type[wnx.CustomInterval], text: str
+) -> None:
+    with pytest.raises(ValueError, match="Invalid isoformat string"):
+        interval_type.parse(text)
+
+
+def test_moment_parse() -> None:
+    moment = wnx.Moment(2025, 1, 30, 15, 25, 30)
+    assert wnx.Moment.parse(str(moment)) == moment
+    assert wnx.Moment.parse("2025-01-30 15:25:30.5") == moment
+    with pytest.raises(ValueError, match="no time zone"):
+        wnx.Moment.parse("2025-01-30T15:25:30+01:00")
+    with pytest.raises(ValueError, match="not an ISO 8601 date and time"):
+        wnx.Moment.parse("yesterday")
+
+
+def test_interval_parse() -> None:
+    interval = wnx.Interval(
+        wnx.Moment(2025, 1, 1, 0, 0, 0), wnx.Moment(2025, 1, 2, 12, 0, 0)
+    )
+    assert wnx.Interval.parse(str(interval)) == interval
+    assert wnx.Interval.parse("2025-01-01/2025-01-02T12:00") == interval
+    with pytest.raises(ValueError, match="start must be before stop"):
+        wnx.Interval.parse("2025-01-02/2025-01-01")
+    with pytest.raises(ValueError, match="expected start/stop"):
+        wnx.Interval.parse("2025-01-01")
+
+
+def test_parse_many_reports_bad_rows() -> None:
+    lines = iter(["2025-01-01T09", "", "2025-01-01T10", "2025-01-01T25"])
+    hours, failures = wnx.Hour.parse_many(lines)
+    assert hours == [wnx.Hour(2025, 1, 1, 9), wnx.Hour(2025, 1, 1, 10)]
+    assert [(failure.row, failure.text) for failure in failures] == [
+        (1, ""),
+        (3, "2025-01-01T25"),
+    ]
+    assert failures[0] == wnx.ParseFailure(
+        1, "", "Invalid isoformat string for Hour: ''"
+    )
+
+    moments, failures = wnx.Moment.parse_many(["2025-01-01T00:00:00", "x"])
+    assert moments == [wnx.Moment(2025, 1, 1, 0, 0, 0)]
+    assert [failure.row for failure in failures] == [1]
@@ -60,6 +60,21 @@ def test_comparators() -> None:
         assert moment_eq >= moment1
 
 
+def test_epoch_seconds() -> None:
+    assert wnx.Moment(1, 1, 1, 0, 0, 0).epoch_seconds == 0
+    moment = wnx.Moment(2020, 2, 29, 13, 14, 15)
+    expected = datetime.datetime(2020, 2, 29, 13, 14, 15) - datetime.datetime(1, 1, 1)
+    assert moment.epoch_seconds == expected.total_seconds()
+    assert wnx.Moment.from_epoch_seconds(moment.epoch_seconds) == moment
+
+
+def test_hash() -> None:
+    moment = wnx.Moment(2020, 1, 1, 0, 0, 0)
+    assert hash(moment) == hash(wnx.Moment(2020, 1, 1, 0, 0, 0))
+    assert len({moment, wnx.Moment(2020, 1, 1, 0, 0, 0)}) == 1
+    assert moment != (2020, 1, 1, 0, 0, 0)
+
+
 @pytest.mark.parametrize(
     "delta_type, delta_value, expected_plus, expected_minus",
     [
@@ -175,6 +190,22 @@ def test_add_delta_edge_cases() -> None:
     assert leap_year + wnx.Delta(years=1) == wnx.Moment(2021, 2, 28, 0, 0, 0)
 
 
+def test_add_delta_combined() -> None:
+    moment = wnx.Moment(2019, 1, 31, 23, 59, 59)
+    delta = wnx.Delta(
+        years=1, months=13, weeks=1, days=1, hours=1, minutes=1, seconds=1
+    )
+    assert moment + delta == wnx.Moment(2021, 3, 9, 1, 1, 0)
+    assert moment + wnx.Delta(months=-13) == wnx.Moment(2017, 12, 31, 23, 59, 59)
+
+
+def test_add_delta_out_of_range() -> None:
+    with pytest.raises(wnx.InvalidMomentError):
+        wnx.Moment(datetime.MAXYEAR, 12, 31, 23, 59, 59) + wnx.Delta(seconds=1)
+    with pytest.raises(wnx.InvalidMomentError):
+        wnx.Moment(datetime.MINYEAR, 1, 1, 0, 0, 0) - wnx.Delta(months=1)
+
+
 def test_moment_week_accessors() -> None:
     moment = wnx.Moment(2020, 1, 1, 0, 0, 0)
     assert moment.week_year == 2020
@@ -192,6 +223,23 @@ def test_moment_week_accessors() -> None:
     assert moment.week_day == 2
 
 
+def test_moment_calendar_fields_match_datetime() -> None:
+    moment = wnx.Moment(2000, 2, 29, 12, 0, 0)
+    for _ in range(400):
+        dt = moment.to_datetime()
+        assert (moment.week_year, moment.week, moment.week_day) == tuple(
+            dt.isocalendar()
+        )
+        assert moment.ordinal_day == dt.timetuple().tm_yday
+        moment = moment + wnx.Delta(days=3)
+
+    # the fields are cached, and caching does not affect equality or hashing
+    moment = wnx.Moment(2020, 1, 1, 0, 0, 0)
+    assert moment.week == moment.week
+    assert moment == wnx.Moment(2020, 1, 1, 0, 0, 0)
+    assert hash(moment) == hash(wnx.Moment(2020, 1, 1, 0, 0, 0))
+
+
 def test_moment_ordinal_accessors() -> None:
     moment = wnx.Moment(2020, 1, 1, 0, 0, 0)
     assert moment.ordinal_day == 1
@@ -0,0 +1,120 @@
+import datetime
+import random
+
+import pytest
+
+import when_exactly as wnx
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture  # type: ignore
+def moments() -> list[wnx.Moment]:
+    rng = random.Random(0)
+    edge_cases = [
+        wnx.Moment(1, 1, 1, 0, 0, 0),
+        wnx.Moment(1969, 12, 31, 23, 59, 59),
+        wnx.Moment(1970, 1, 1, 0, 0, 0),
+        wnx.Moment(2019, 12, 30, 0, 0, 0),
+        wnx.Moment(2020, 12, 31, 12, 0, 0),
+        wnx.Moment(2021, 1, 3, 0, 0, 0),
+        wnx.Moment(2024, 2, 29, 23, 59, 59),
+        wnx.Moment(9999, 12, 31, 23, 59, 59),
+    ]
+    return edge_cases + [
+        wnx.Moment.from_epoch_seconds(rng.randrange(0, edge_cases[-1].epoch_seconds))
+        for _ in range(500)
+    ]
+
+
+def test_fields_match_moment(moments: list[wnx.Moment]) -> None:
+    array = wnx.MomentArray.from_moments(moments)
+    assert len(array) == len(moments)
+    for field in [
+        "year",
+        "month",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "week_year",
+        "week",
+        "week_day",
+        "ordinal_day",
+    ]:
+        assert getattr(array, field).tolist() == [getattr(m, field) for m in moments]
+
+
+def test_conversions(moments: list[wnx.Moment]) -> None:
+    array = wnx.MomentArray.from_moments(moments)
+    assert array.to_moments() == moments
+    assert list(array) == moments
+    assert array[3] == moments[3]
+    assert array[2:4].to_moments() == moments[2:4]
+
+    datetimes = array.to_datetime64()
+    assert datetimes.dtype == np.dtype("datetime64[s]")
+    assert datetimes.astype(datetime.datetime).tolist() == [
+        m.to_datetime() for m in moments
+    ]
+    assert wnx.MomentArray.from_datetime64(datetimes).to_moments() == moments
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        wnx.Delta(seconds=-1),
+        wnx.Delta(days=400, hours=5),
+        wnx.Delta(months=1),
+        wnx.Delta(months=-13),
+        wnx.Delta(years=1, months=1, weeks=1, minutes=1),
+    ],
+)
+def test_add_delta(delta: wnx.Delta) -> None:
+    moments = [
+        wnx.Moment(2020, 1, 31, 12, 0, 0),
+        wnx.Moment(2020, 2, 29, 0, 0, 0),
+        wnx.Moment(1900, 3, 31, 23, 59, 59),
+        wnx.Moment(1969, 12, 31, 0, 0, 30),
+    ]
+    array = wnx.MomentArray.from_moments(moments)
+    assert (array + delta).to_moments() == [m + delta for m in moments]
+    assert (array - delta).to_moments() == [m - delta for m in moments]
+
+
+def test_add_delta_out_of_range() -> None:
+    array = wnx.MomentArray.from_moments([wnx.Moment(9999, 12, 31, 0, 0, 0)])
+    with pytest.raises(wnx.InvalidMomentError):
+        array + wnx.Delta(days=1)
+
+
+def test_comparators() -> None:
+    a = wnx.Moment(2020, 1, 1, 0, 0, 0)
+    b = wnx.Moment(2020, 1, 1, 0, 0, 1)
+    array = wnx.MomentArray.from_moments([a, b])
+    assert (array == a).tolist() == [True, False]
+    assert (array != a).tolist() == [False, True]
+    assert (array < b).tolist() == [True, False]
+    assert (array <= b).tolist() == [True, True]
+    assert (array > a).tolist() == [False, True]
+    assert (array >= array).tolist() == [True, True]
+    with pytest.raises(TypeError):
+        assert array < 1  # type: ignore
+    assert (array == None) is False
+    assert (array != "2020") is True
+    assert array not in [None, 1]
+
+
+def test_immutable() -> None:
+    array = wnx.MomentArray([0, 1])
+    with pytest.raises(ValueError):
+        array.epoch_seconds[0] = 5
+    with pytest.raises(ValueError):
+        wnx.MomentArray([[0, 1]])
+    with pytest.raises(wnx.InvalidMomentError):
+        wnx.MomentArray([-1])
+    epoch_seconds = np.array([0, 1], dtype=np.int64)
+    array = wnx.MomentArray(epoch_seconds)
+    epoch_seconds[0] = -100
+    assert array.year.tolist() == [1, 1]
+    assert array[0] == wnx.Moment(1, 1, 1, 0, 0, 0)
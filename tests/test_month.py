@@ -34,3 +34,11 @@ def test_month_day() -> None:
     month = wnx.Month(2020, 1)
     day = month.day(1)
     assert day == wnx.Day(2020, 1, 1)
+
+
+def test_month_days_end_of_year() -> None:
+    days = wnx.Month(2020, 12).days()
+    assert len(days) == 31
+    assert days[0] == wnx.Day(2020, 12, 1)
+    assert days[-1] == wnx.Day(2020, 12, 31)
+    assert len(wnx.Month(2020, 2).days()) == 29
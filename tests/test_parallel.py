@@ -0,0 +1,110 @@
+import operator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+import when_exactly as wnx
+
+
+def minutes_at_noon(chunk: wnx.Interval) -> wnx.Minutes:
+    minutes = wnx.IntervalSet([chunk]).to_collection(wnx.Minutes)
+    return wnx.Minutes.from_sorted(
+        minute for minute in minutes if minute.start.hour == 12
+    )
+
+
+def spans(chunk: wnx.Interval) -> wnx.Collection[wnx.Interval]:
+    return wnx.Collection([chunk])
+
+
+def days_around(chunk: wnx.Interval) -> wnx.CustomCollection[wnx.CustomInterval]:
+    # neighbouring chunks share the first day of each month
+    first = wnx.Day.from_moment(chunk.start)
+    return wnx.CustomCollection([first, first.previous, wnx.OrdinalDay(2025, 100)])
+
+
+def test_parallel_split() -> None:
+    parallel = wnx.Parallel(wnx.Day)  # splitting does not use the executor
+    assert parallel.split(wnx.Month(2025, 2)) == list(wnx.Month(2025, 2).days())
+    chunks = parallel.split(
+        wnx.Interval(wnx.Moment(2025, 1, 1, 12, 0, 0), wnx.Moment(2025, 1, 3, 6, 0, 0))
+    )
+    assert [str(chunk) for chunk in chunks] == [
+        "2025-01-01T12:00:00/2025-01-02T00:00:00",
+        "2025-01-02",
+        "2025-01-03T00:00:00/2025-01-03T06:00:00",
+    ]
+
+
+def test_parallel_collect_in_processes() -> None:
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = wnx.Parallel(wnx.Day, executor)
+        minutes = parallel.collect(minutes_at_noon, wnx.Month(2025, 1))
+    assert len(minutes) == 31 * 60
+    assert minutes[0] == wnx.Minute(2025, 1, 1, 12, 0)
+    assert minutes[-1] == wnx.Minute(2025, 1, 31, 12, 59)
+    assert wnx.Minute(2025, 1, 15, 12, 30) in minutes
+
+
+def test_parallel_collect_merges_overlapping_chunks() -> None:
+    with ThreadPoolExecutor() as executor:
+        parallel = wnx.Parallel(wnx.Month, executor)
+        weeks = parallel.collect(
+            lambda chunk: wnx.IntervalSet([chunk]).to_collection(wnx.Weeks),
+            wnx.Year(2025),
+        )
+        assert weeks == wnx.Weeks.range(wnx.Week(2025, 1), 53)
+
+        collection = parallel.collect(
+            spans,
+            wnx.Interval(
+                wnx.Moment(2025, 1, 15, 0, 0, 0), wnx.Moment(2025, 2, 15, 0, 0, 0)
+            ),
+        )
+        assert [str(span) for span in collection] == [
+            "2025-01-15T00:00:00/2025-02-01T00:00:00",
+            "2025-02-01T00:00:00/2025-02-15T00:00:00",
+        ]
+
+        days = parallel.collect(
+            days_around,
+            wnx.Interval(
+                wnx.Moment(2025, 1, 1, 0, 0, 0), wnx.Moment(2025, 4, 1, 0, 0, 0)
+            ),
+        )
+        assert list(days) == [
+            wnx.Day(2024, 12, 31),
+            wnx.Day(2025, 1, 1),
+            wnx.Day(2025, 1, 31),
+            wnx.Day(2025, 2, 1),
+            wnx.Day(2025, 2, 28),
+            wnx.Day(2025, 3, 1),
+            wnx.OrdinalDay(2025, 100),
+        ]
+
+        mixed = parallel.collect(
+            lambda chunk: wnx.Days([wnx.Day(2025, 1, 1), wnx.OrdinalDay(2025, 1)]),
+            wnx.Year(2025),
+        )
+        assert [type(value) for value in mixed] == [wnx.Day, wnx.OrdinalDay]
+
+        with pytest.raises(TypeError, match="one collection type"):
+            parallel.collect(
+                lambda chunk: wnx.Days([]) if chunk.start.month == 1 else wnx.Hours([]),
+                wnx.Year(2025),
+            )
+
+
+def test_parallel_aggregate() -> None:
+    pairs = [
+        (wnx.Moment(2025, 1, 1, 0, 0, 0) + wnx.Delta(minutes=7 * i), i)
+        for i in range(20_000)
+    ]
+    expected = list(wnx.Week.aggregate(pairs, operator.add))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = wnx.Parallel(wnx.Month, executor)
+        assert parallel.aggregate(wnx.Week, pairs, operator.add) == expected
+        assert parallel.aggregate(wnx.Week, pairs, max, initial=-1) == list(
+            wnx.Week.aggregate(pairs, max, initial=-1)
+        )
+    assert wnx.Parallel().aggregate(wnx.Week, [], operator.add) == []
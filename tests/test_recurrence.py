@@ -0,0 +1,67 @@
+import itertools
+
+import pytest
+
+import when_exactly as wnx
+
+
+def test_recurrence_every() -> None:
+    recurrence = wnx.Recurrence(wnx.Day(2020, 1, 1), every=15)
+    days = list(wnx.Days.range(wnx.Day(2019, 12, 1), 400))
+    expected = [
+        day
+        for day in days
+        if (day._index - wnx.Day(2020, 1, 1)._index) % 15 == 0
+        and day.start >= wnx.Moment(2020, 1, 1, 0, 0, 0)
+    ]
+
+    assert list(itertools.islice(recurrence, 3)) == expected[:3]
+    for start, stop in [(0, 400), (31, 32), (40, 100), (45, 46), (46, 47), (100, 50)]:
+        low, high = days[start % 400].start, days[stop % 400].start
+        matches = [day for day in expected if low <= day.start < high]
+        assert list(recurrence.between(low, high)) == matches
+        assert recurrence.count(low, high) == len(matches)
+
+    hours = wnx.Recurrence(wnx.Hour(2020, 1, 1, 0), every=6)
+    assert (
+        hours.count(wnx.Moment(2020, 1, 1, 0, 0, 1), wnx.Moment(2020, 1, 2, 0, 0, 1))
+        == 4
+    )
+
+    with pytest.raises(ValueError):
+        wnx.Recurrence(wnx.Day(2020, 1, 1), every=0)
+
+
+def test_recurrence_nth_weekday() -> None:
+    months = wnx.Months.range(wnx.Month(2020, 1), 24)
+    fifth_fridays = wnx.Recurrence.nth_weekday(wnx.Month(2020, 1), 5, [5])
+    last_business_days = wnx.Recurrence.nth_weekday(wnx.Month(2020, 1), -1, range(1, 6))
+
+    expected_fifth_fridays = []
+    expected_last_business_days = []
+    for month in months:
+        fridays = [day for day in month.days() if day.start.week_day == 5]
+        if len(fridays) == 5:
+            expected_fifth_fridays.append(fridays[4])
+        business_days = [day for day in month.days() if day.start.week_day <= 5]
+        expected_last_business_days.append(business_days[-1])
+
+    start, stop = months[0].start, months[-1].stop
+    assert list(fifth_fridays.between(start, stop)) == expected_fifth_fridays
+    assert fifth_fridays.count(start, stop) == len(expected_fifth_fridays)
+    assert list(itertools.islice(last_business_days, 24)) == expected_last_business_days
+    assert list(last_business_days.between(wnx.Moment(2020, 5, 29, 0, 0, 1), stop))[
+        0
+    ] == wnx.Day(2020, 6, 30)
+
+    every_other_tuesday = wnx.Recurrence.nth_weekday(wnx.Week(2020, 1), 1, [2], every=2)
+    assert list(itertools.islice(every_other_tuesday, 3)) == [
+        wnx.Day(2019, 12, 31),
+        wnx.Day(2020, 1, 14),
+        wnx.Day(2020, 1, 28),
+    ]
+
+    with pytest.raises(ValueError):
+        wnx.Recurrence.nth_weekday(wnx.Month(2020, 1), 0, [1])
+    with pytest.raises(ValueError):
+        wnx.Recurrence.nth_weekday(wnx.Month(2020, 1), 1, [8])
@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+import pytest
+
+import when_exactly as wnx
+
+
+class Clock:
+    """A wall clock that starts at a given moment and can be moved."""
+
+    def __init__(self, moment: wnx.Moment, offset: float = 0.0) -> None:
+        self.shift = moment.epoch_seconds + offset - time.monotonic()
+
+    def __call__(self) -> float:
+        return time.monotonic() + self.shift
+
+
+def test_ticks_start_at_the_next_boundary() -> None:
+    clock = Clock(wnx.Moment(2025, 1, 1, 12, 14, 59), offset=0.95)
+
+    async def main() -> list[wnx.Minute]:
+        scheduler = wnx.Scheduler(clock)
+        minutes = []
+        async for minute in wnx.ticks(wnx.Minute, every=15, scheduler=scheduler):
+            assert clock() >= minute.start.epoch_seconds
+            minutes.append(minute)
+            clock.shift += 15 * 60 - 0.05  # jump to just before the next tick
+            if len(minutes) == 2:
+                return minutes
+        raise AssertionError
+
+    assert asyncio.run(main()) == [
+        wnx.Minute(2025, 1, 1, 12, 15),
+        wnx.Minute(2025, 1, 1, 12, 30),
+    ]
+
+
+def test_ticks_coalesce_missed_ticks() -> None:
+    clock = Clock(wnx.Moment(2025, 1, 1, 0, 0, 0), offset=-0.02)
+
+    async def main() -> list[wnx.Second]:
+        seconds = []
+        async for second in wnx.Scheduler(clock).ticks(wnx.Second):
+            seconds.append(second)
+            if len(seconds) == 2:
+                return seconds
+            clock.shift += 10.5  # the consumer was busy for ten seconds
+        raise AssertionError
+
+    assert asyncio.run(main()) == [
+        wnx.Second(2025, 1, 1, 0, 0, 0),
+        wnx.Second(2025, 1, 1, 0, 0, 10),
+    ]
+
+
+def test_scheduler_compensates_for_drift() -> None:
+    clock = Clock(wnx.Moment(2025, 1, 1, 0, 0, 0))
+
+    async def main() -> None:
+        scheduler = wnx.Scheduler(clock)
+        deadline = clock() + 0.02
+        sleeper = asyncio.ensure_future(scheduler.sleep_until(deadline))
+        await asyncio.sleep(0)
+        clock.shift -= 0.03  # the wall clock falls behind the loop clock
+        await sleeper
+        assert clock() >= deadline
+
+    asyncio.run(main())
+
+
+def test_scheduler_hosts_many_timers_on_one_heap() -> None:
+    clock = Clock(wnx.Moment(2025, 1, 1, 0, 0, 0))
+
+    async def main() -> None:
+        scheduler = wnx.Scheduler(clock)
+        now = clock()
+        sleepers = [
+            asyncio.ensure_future(scheduler.sleep_until(now + 0.01 + i % 10 / 1000))
+            for i in range(5000)
+        ]
+        await asyncio.sleep(0)
+        assert len(scheduler._heap) == 5000
+        sleepers[0].cancel()
+        await asyncio.gather(*sleepers[1:])
+        assert scheduler._heap == []
+        assert scheduler._timer is None
+
+    asyncio.run(main())
+
+
+def test_ticks_every_must_be_positive() -> None:
+    async def main() -> None:
+        with pytest.raises(ValueError, match="every must be positive"):
+            await anext(wnx.ticks(wnx.Day, every=0))
+
+    asyncio.run(main())
@@ -1,3 +1,7 @@
+import copy
+import pickle
+import tracemalloc
+
 import when_exactly as wnx
 from tests.asserts import (
     CustomIntervalParams,
@@ -37,3 +41,31 @@ def test_from_moment() -> None:
     moment = wnx.Moment(2020, 1, 1, 0, 0, 0)
     second = wnx.Second.from_moment(moment)
     assert second == wnx.Second(2020, 1, 1, 0, 0, 0)
+
+
+def test_second_memory_budget() -> None:
+    # see the memory budget in the Interval docstring
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        seconds = [wnx.Second(2020, 1, 1, 0, i // 60, i % 60) for i in range(1000)]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(seconds) == 1000
+    assert used / len(seconds) <= 400
+    assert not hasattr(seconds[0], "__dict__")
+    assert not hasattr(seconds[0].start, "__dict__")
+
+
+def test_second_copy_and_pickle() -> None:
+    second = wnx.Second(2020, 1, 1, 0, 0, 0)
+    assert second.start.week == 1  # cached on the moment
+    for copied in [
+        copy.copy(second),
+        copy.deepcopy(second),
+        pickle.loads(pickle.dumps(second)),
+    ]:
+        assert copied == second
+        assert copied.start.week == 1
+        assert copied.minute() == second.minute()
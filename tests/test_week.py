@@ -1,3 +1,7 @@
+import datetime
+
+import pytest
+
 import when_exactly as wnx
 from tests.asserts import (
     CustomIntervalParams,
@@ -39,3 +43,21 @@ def test_week_days() -> None:
     days = week.days
     expected = wnx.Days([wnx.Day(2020, 1, 5 + i) for i in range(1, 8)])
     assert days == expected
+
+
+def test_week_matches_isocalendar() -> None:
+    for year in [2015, 2019, 2020, 2026]:
+        weeks = wnx.Year(year).weeks
+        assert len(weeks) == datetime.date(year, 12, 28).isocalendar()[1]
+        for week in [weeks[0], weeks[-1]]:
+            start = week.start.to_datetime()
+            assert repr(week) == "Week({}, {})".format(*start.isocalendar()[:2])
+            assert week.next.start == week.stop
+            assert week.next.previous == week
+
+
+def test_week_invalid() -> None:
+    with pytest.raises(ValueError):
+        wnx.Week(2019, 53)
+    with pytest.raises(ValueError):
+        wnx.Weekday(2020, 1, 8)